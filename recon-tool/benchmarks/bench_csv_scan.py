@@ -0,0 +1,89 @@
+"""
+Benchmark: mmap field scanner vs pandas read_csv(usecols)
+Compara el escáner mmap con pandas leyendo solo columnas clave de un CSV ancho
+
+Uso:
+    python benchmarks/bench_csv_scan.py --rows 200000 --filler-columns 60
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import numpy as np
+import pandas as pd
+
+from recon.adapters.csv_model import CsvSourceReader, MmapFieldScanner
+from recon.core.config import ConfigLoader
+
+CONFIG_PATH = Path(__file__).parent.parent / 'configs' / 'mvh.yaml'
+
+
+def mvh_columns() -> list[str]:
+    """Columnas del SharePoint de mvh: claves, filtros y campos mapeados"""
+    config = ConfigLoader(CONFIG_PATH).load()
+    source = config.sources['sharepoint_arch1']
+    columns = list(source.key_columns) + list(source.filter_columns.values())
+    for rule in config.validation_rules.values():
+        columns += [m.source_field for m in rule.field_mappings]
+    return list(dict.fromkeys(columns))
+
+
+def write_csv(path: Path, rows: int, filler_columns: int) -> list[str]:
+    """CSV ancho con el esquema de mvh más columnas de relleno"""
+    columns = mvh_columns() + [f'Extra Field {i}' for i in range(filler_columns)]
+    rng = np.random.default_rng(146)
+    data = {}
+    for column in columns:
+        if column == 'Site_Location_Key':
+            data[column] = np.arange(rows).astype(str)
+        elif column == 'Vendor':
+            data[column] = rng.choice(['Verizon', 'ATT', 'Lumen', 'Comcast'], rows)
+        else:
+            data[column] = np.round(rng.uniform(10, 2_000, rows), 2).astype(str)
+    pd.DataFrame(data, columns=columns).to_csv(path, index=False)
+    return columns
+
+
+def _time(read, repeat: int) -> tuple[float, int]:
+    best, rows = float('inf'), 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = sum(len(chunk) for chunk in read())
+        best = min(best, time.perf_counter() - start)
+    return best, rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--filler-columns', type=int, default=60)
+    parser.add_argument('--chunk-rows', type=int, default=50_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'sharepoint_wide.csv'
+        columns = write_csv(path, args.rows, args.filler_columns)
+        size_mb = path.stat().st_size / 1024 ** 2
+        print(f"{args.rows:,} rows x {len(columns)} columns ({size_mb:.1f} MB)\n")
+        print(f"{'columns':<32} {'pandas usecols':>15} {'mmap scanner':>15} {'speedup':>8}")
+
+        for wanted in (['Site_Location_Key'], ['Site_Location_Key', 'Vendor']):
+            pandas_reader = CsvSourceReader(path, columns=set(wanted))
+            scanner = MmapFieldScanner(path, wanted)
+            pandas_seconds, pandas_rows = _time(
+                lambda reader=pandas_reader: reader.iter_chunks(args.chunk_rows), args.repeat)
+            mmap_seconds, mmap_rows = _time(
+                lambda scanner=scanner: scanner.iter_chunks(args.chunk_rows), args.repeat)
+            assert pandas_rows == mmap_rows == args.rows
+            print(f"{', '.join(wanted):<32} {pandas_seconds:>14.3f}s {mmap_seconds:>14.3f}s "
+                  f"{pandas_seconds / mmap_seconds:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
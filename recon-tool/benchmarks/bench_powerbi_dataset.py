@@ -0,0 +1,77 @@
+"""
+Benchmark: per-site DAX queries vs batched, pooled queries
+Compara una consulta por sitio con consultas por lotes sobre conexiones keep-alive
+
+Uso:
+    python benchmarks/bench_powerbi_dataset.py --sites 1000 --latency 0.01
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+
+from recon.adapters.powerbi_dataset import DatasetSourceReader
+from tests.powerbi_standin import StandInDataset
+
+
+def quotes_table(sites: int) -> pd.DataFrame:
+    """factQuotes simulado: tres servicios por sitio"""
+    rng = np.random.default_rng(146)
+    keys = np.repeat(np.arange(sites).astype(str), 3)
+    return pd.DataFrame({
+        'Site_Location_Key': keys,
+        'Service_Type': np.tile(['Broadband', 'DIA', 'LTE'], sites),
+        'Vendor': rng.choice(['Verizon', 'ATT', 'Lumen', 'Comcast'], len(keys)),
+        'Total MRC': np.round(rng.uniform(10, 2_000, len(keys)), 2),
+    })
+
+
+def run(dataset: StandInDataset, sites: set[str], batch_size: int,
+        connections: int) -> tuple[float, int, dict]:
+    reader = DatasetSourceReader(dataset.url, 'factQuotes',
+                                 columns={'Site_Location_Key', 'Service_Type', 'Total MRC'},
+                                 filters={'Site_Location_Key': sites},
+                                 key_columns=['Site_Location_Key'],
+                                 batch_size=batch_size, connections=connections)
+    start = time.perf_counter()
+    rows = sum(len(chunk) for chunk in reader.iter_chunks(50_000))
+    return time.perf_counter() - start, rows, reader.metrics
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sites', type=int, default=1000)
+    parser.add_argument('--latency', type=float, default=0.01,
+                        help='Segundos de latencia por request del servidor simulado')
+    parser.add_argument('--batch-size', type=int, default=500)
+    parser.add_argument('--connections', type=int, default=4)
+    args = parser.parse_args()
+
+    table = quotes_table(args.sites)
+    sites = set(table['Site_Location_Key'])
+    print(f"{args.sites:,} sites ({len(table):,} rows), {args.latency * 1000:.0f} ms per request\n")
+    print(f"{'mode':<28} {'seconds':>9} {'requests':>9} {'connections':>12}")
+
+    with StandInDataset({'factQuotes': table}, latency=args.latency) as dataset:
+        modes = [
+            ('one query per site', 1, 1),
+            (f'batches of {args.batch_size}, 1 conn', args.batch_size, 1),
+            (f'batches of {args.batch_size}, {args.connections} conn', args.batch_size,
+             args.connections),
+        ]
+        for label, batch_size, connections in modes:
+            seconds, rows, metrics = run(dataset, sites, batch_size, connections)
+            assert rows == len(table)
+            print(f"{label:<28} {seconds:>8.2f}s {metrics['requests']:>9,} "
+                  f"{metrics['connections_opened']:>12}")
+
+
+if __name__ == '__main__':
+    main()
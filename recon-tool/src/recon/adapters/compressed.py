@@ -0,0 +1,88 @@
+"""
+Compressed Source Adapter
+Apertura en streaming de fuentes comprimidas (gzip, bz2, zstd, miembro de zip)
+"""
+
+import bz2
+import gzip
+import zipfile
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import BinaryIO
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - dependencia opcional
+    zstandard = None
+
+
+COMPRESSION_METHODS = ("gzip", "bz2", "zstd", "zip")
+
+# Extensión del archivo → método (compression: infer)
+COMPRESSION_SUFFIXES = {
+    ".gz": "gzip",
+    ".gzip": "gzip",
+    ".bz2": "bz2",
+    ".zst": "zstd",
+    ".zstd": "zstd",
+    ".zip": "zip",
+}
+
+
+def resolve_compression(path: str | Path, compression: str | None = "infer") -> str | None:
+    """
+    Método de compresión efectivo de una fuente.
+
+    `infer` lo deduce de la extensión; `none` (o None) indica archivo plano.
+    """
+    if compression in (None, "", "none"):
+        return None
+    if compression == "infer":
+        return COMPRESSION_SUFFIXES.get(Path(path).suffix.lower())
+    if compression not in COMPRESSION_METHODS:
+        raise ValueError(f"Unsupported compression '{compression}' "
+                         f"(expected one of: infer, none, {', '.join(COMPRESSION_METHODS)})")
+    return compression
+
+
+def _zip_member(archive: zipfile.ZipFile, member: str | None) -> str:
+    """Miembro a leer: el indicado o, si se omite, el único archivo del zip"""
+    names = [info.filename for info in archive.infolist() if not info.is_dir()]
+    if member is not None:
+        if member not in names:
+            raise ValueError(f"Member '{member}' not found in zip (members: {', '.join(names)})")
+        return member
+    if len(names) != 1:
+        raise ValueError(f"Zip has {len(names)} members; set 'member' in the source config "
+                         f"(members: {', '.join(names)})")
+    return names[0]
+
+
+@contextmanager
+def open_stream(path: str | Path, compression: str | None,
+                member: str | None = None) -> Iterator[BinaryIO]:
+    """
+    Abre la fuente como stream binario descomprimido al vuelo.
+
+    No se escribe ningún archivo temporal: el lector de chunks consume
+    directamente el stream de descompresión.
+    """
+    path = Path(path)
+    with ExitStack() as stack:
+        if compression is None:
+            yield stack.enter_context(open(path, "rb"))
+        elif compression == "gzip":
+            yield stack.enter_context(gzip.open(path, "rb"))
+        elif compression == "bz2":
+            yield stack.enter_context(bz2.open(path, "rb"))
+        elif compression == "zstd":
+            if zstandard is None:
+                raise ImportError("zstd sources require zstandard (pip install 'recon-tool[zstd]')")
+            raw = stack.enter_context(open(path, "rb"))
+            yield stack.enter_context(zstandard.ZstdDecompressor().stream_reader(raw))
+        elif compression == "zip":
+            archive = stack.enter_context(zipfile.ZipFile(path))
+            yield stack.enter_context(archive.open(_zip_member(archive, member)))
+        else:
+            raise ValueError(f"Unsupported compression '{compression}'")
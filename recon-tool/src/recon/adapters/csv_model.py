@@ -2,3 +2,272 @@
 CSV Model Adapter
 Adaptador para cargar y modelar archivos CSV
 """
+
+import io
+import mmap
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from recon.adapters.compressed import open_stream
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - dependencia opcional
+    pa = None
+
+
+# Filas leídas para estimar el tamaño por fila antes de fijar el chunk real
+PROBE_ROWS = 256
+
+# Bytes del archivo mapeado que el escáner procesa por bloque
+MMAP_BLOCK_BYTES = 64 * 1024 * 1024
+
+# Codificaciones en las que el escáner puede buscar separadores byte a byte
+MMAP_ENCODINGS = ("utf-8", "utf8", "utf-8-sig", "ascii")
+
+# Valores que read_csv interpreta como nulos por defecto (lista documentada de `na_values`)
+NA_VALUES = frozenset({
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND",
+    "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+})
+
+
+class CsvSourceReader:
+    """
+    Lector de CSV por chunks.
+
+    Todas las columnas se leen como texto: la tipificación es responsabilidad
+    de etapas posteriores (nunca asumir tipos a partir de los datos).
+
+    Con `compression` (gzip, bz2, zstd o zip) el archivo se descomprime como
+    stream mientras se parsea, sin desempaquetarlo a disco.
+    """
+
+    def __init__(self, path: str | Path, encoding: str = "utf-8", delimiter: str = ",",
+                 columns: set[str] | None = None, compression: str | None = None,
+                 member: str | None = None, quotechar: str = '"'):
+        self.path = Path(path)
+        self.encoding = encoding
+        self.delimiter = delimiter
+        self.quotechar = quotechar
+        self.columns = columns  # Proyección; None = todas las columnas
+        self.compression = compression  # None = archivo plano
+        self.member = member  # Miembro a leer dentro de un zip
+
+    def read_header(self) -> list[str]:
+        """Lee solo la fila de encabezados del archivo"""
+        with open_stream(self.path, self.compression, self.member) as handle:
+            return list(pd.read_csv(
+                handle, encoding=self.encoding, sep=self.delimiter, quotechar=self.quotechar,
+                nrows=0
+            ).columns)
+
+    def iter_chunks(self, chunk_rows: int, max_memory: int | None = None,
+                    start_offset: int = 0) -> Iterator[pd.DataFrame]:
+        """
+        Genera DataFrames de como máximo `chunk_rows` filas.
+
+        Si se indica `max_memory` (bytes), se lee primero un chunk de prueba
+        para estimar el tamaño por fila y se reduce `chunk_rows` de modo que
+        cada chunk quede dentro del presupuesto.
+
+        Con `start_offset` (solo archivos sin comprimir) se parsean únicamente
+        las filas desde ese byte, que debe ser un inicio de línea; los nombres
+        de columna se toman del encabezado del archivo.
+        """
+        probe_rows = min(chunk_rows, PROBE_ROWS) if max_memory else chunk_rows
+        header_options = {}
+        if start_offset:
+            if self.compression:
+                raise ValueError("start_offset is not supported on compressed sources")
+            header_options = {"header": None, "names": self.read_header()}
+
+        with open_stream(self.path, self.compression, self.member) as handle:
+            if start_offset:
+                handle.seek(start_offset)
+            yield from self._iter_handle(handle, chunk_rows, probe_rows, max_memory,
+                                         header_options)
+
+    def _iter_handle(self, handle, chunk_rows: int, probe_rows: int,
+                     max_memory: int | None, header_options: dict) -> Iterator[pd.DataFrame]:
+        with pd.read_csv(
+            handle,
+            encoding=self.encoding,
+            sep=self.delimiter,
+            quotechar=self.quotechar,
+            dtype=str,
+            usecols=(lambda c: c in self.columns) if self.columns is not None else None,
+            chunksize=probe_rows,
+            **header_options
+        ) as reader:
+            try:
+                first = reader.get_chunk(probe_rows)
+            except StopIteration:
+                return
+
+            if max_memory and len(first) > 0:
+                bytes_per_row = max(1, first.memory_usage(deep=True).sum() // len(first))
+                chunk_rows = max(1, min(chunk_rows, max_memory // bytes_per_row))
+
+            yield first
+
+            while True:
+                try:
+                    chunk = reader.get_chunk(chunk_rows)
+                except StopIteration:
+                    return
+                yield chunk
+
+
+class MmapFieldScanner:
+    """
+    Escáner de CSV sobre el archivo mapeado en memoria que extrae solo
+    algunas columnas.
+
+    Pensado para pasadas de claves (checks de integridad, duplicados) sobre
+    CSV anchos: los separadores y saltos de línea se localizan con numpy sobre
+    el buffer mapeado y de cada columna pedida se copian únicamente sus bytes.
+    Las columnas omitidas nunca se convierten en strings de Python.
+
+    Un bloque con comillas, filas con distinta cantidad de campos o bytes no
+    UTF-8 se parsea con pandas (mismo resultado, sin el atajo). Como en
+    `CsvSourceReader`, los valores se entregan como texto y los marcadores de
+    nulo por defecto de pandas ('', 'NA', 'null', ...) como NaN.
+    """
+
+    def __init__(self, path: str | Path, columns: set[str] | list[str],
+                 encoding: str = "utf-8", delimiter: str = ",",
+                 block_bytes: int = MMAP_BLOCK_BYTES, quotechar: str = '"'):
+        self.path = Path(path)
+        self.columns = set(columns)
+        self.encoding = encoding
+        self.delimiter = delimiter
+        self.quotechar = quotechar
+        self.block_bytes = block_bytes
+        self.metrics = {"blocks_scanned": 0, "blocks_fallback": 0}
+
+    @staticmethod
+    def supports(path: str | Path, encoding: str, delimiter: str, quotechar: str = '"') -> bool:
+        """El archivo admite el escaneo byte a byte (codificación y encabezado simples)"""
+        if encoding.lower() not in MMAP_ENCODINGS or len(delimiter.encode("utf-8")) != 1:
+            return False
+        with open(path, "rb") as f:
+            header_line = f.readline()
+        return quotechar.encode("utf-8") not in header_line
+
+    def read_header(self) -> list[str]:
+        return CsvSourceReader(self.path, self.encoding, self.delimiter,
+                               quotechar=self.quotechar).read_header()
+
+    def iter_chunks(self, chunk_rows: int,
+                    max_memory: int | None = None) -> Iterator[pd.DataFrame]:
+        """Genera DataFrames de las columnas pedidas, de como máximo `chunk_rows` filas"""
+        header = self.read_header()
+        positions = [i for i, name in enumerate(header) if name in self.columns]
+        names = [header[i] for i in positions]
+        block_bytes = min(self.block_bytes, max_memory) if max_memory else self.block_bytes
+
+        if self.path.stat().st_size == 0:
+            return
+        with open(self.path, "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            start = mapped.find(b"\n") + 1
+            if start == 0:
+                yield pd.DataFrame(columns=names)
+                return
+
+            yielded = False
+            for block_start, block_end in self._blocks(mapped, start, block_bytes):
+                frame = self._scan_block(mapped, block_start, block_end, len(header),
+                                         positions, names)
+                for offset in range(0, len(frame), chunk_rows):
+                    yielded = True
+                    yield frame.iloc[offset:offset + chunk_rows].reset_index(drop=True)
+            if not yielded:
+                yield pd.DataFrame(columns=names)
+
+    @staticmethod
+    def _blocks(mapped: mmap.mmap, start: int, block_bytes: int) -> Iterator[tuple[int, int]]:
+        """Rangos de bytes de hasta `block_bytes`, cortados en fin de línea"""
+        size = len(mapped)
+        while start < size:
+            end = min(size, start + block_bytes)
+            if end < size:
+                newline = mapped.rfind(b"\n", start, end)
+                end = newline + 1 if newline >= 0 else mapped.find(b"\n", end) + 1 or size
+            yield start, end
+            start = end
+
+    def _scan_block(self, mapped: mmap.mmap, start: int, end: int, n_columns: int,
+                    positions: list[int], names: list[str]) -> pd.DataFrame:
+        self.metrics["blocks_scanned"] += 1
+        buffer = np.frombuffer(mapped, dtype=np.uint8, count=end - start, offset=start)
+        frame = None
+        if not (buffer == ord(self.quotechar)).any():
+            frame = self._slice_fields(buffer, n_columns, positions, names)
+        if frame is None:
+            self.metrics["blocks_fallback"] += 1
+            frame = pd.read_csv(io.BytesIO(mapped[start:end]), encoding=self.encoding,
+                                sep=self.delimiter, quotechar=self.quotechar,
+                                dtype=str, header=None,
+                                names=list(range(n_columns)), usecols=positions)
+            frame.columns = names
+        return frame
+
+    def _slice_fields(self, buffer: np.ndarray, n_columns: int, positions: list[int],
+                      names: list[str]) -> pd.DataFrame | None:
+        """Extrae las columnas pedidas de un bloque sin comillas (None = usar pandas)"""
+        newlines = np.flatnonzero(buffer == ord("\n"))
+        row_ends = newlines if len(newlines) and newlines[-1] == len(buffer) - 1 \
+            else np.append(newlines, len(buffer))
+        row_starts = np.concatenate(([0], row_ends[:-1] + 1))
+        # Fin de línea Windows: el \r no es parte del último campo
+        crlf = (row_ends > row_starts) & (buffer[np.maximum(row_ends - 1, 0)] == ord("\r"))
+        row_ends = row_ends - crlf
+        keep = row_ends > row_starts  # pandas descarta líneas en blanco
+        row_starts, row_ends = row_starts[keep], row_ends[keep]
+
+        delimiters = np.flatnonzero(buffer == ord(self.delimiter))
+        counts = np.searchsorted(delimiters, row_ends) - np.searchsorted(delimiters, row_starts)
+        if (counts != n_columns - 1).any():
+            return None
+        grid = delimiters.reshape(len(row_starts), n_columns - 1)
+
+        data = {}
+        for position, name in zip(positions, names, strict=True):
+            starts = row_starts if position == 0 else grid[:, position - 1] + 1
+            ends = row_ends if position == n_columns - 1 else grid[:, position]
+            values = self._gather(buffer, starts, ends)
+            if values is None:
+                return None
+            data[name] = values.where(~values.isin(NA_VALUES))
+        return pd.DataFrame(data, columns=names)
+
+    @staticmethod
+    def _gather(buffer: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> pd.Series | None:
+        """Copia los bytes de cada campo a un único buffer y lo decodifica como texto"""
+        lengths = ends - starts
+        if pa is None:
+            raw = buffer.tobytes()
+            try:
+                return pd.Series(
+                    [raw[s:e].decode("utf-8") for s, e in zip(starts, ends, strict=True)],
+                    dtype=object
+                )
+            except UnicodeDecodeError:
+                return None
+
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        index = np.arange(offsets[-1]) + np.repeat(starts - offsets[:-1], lengths)
+        array = pa.LargeStringArray.from_buffers(
+            len(lengths), pa.py_buffer(offsets), pa.py_buffer(buffer[index])
+        )
+        try:
+            array.validate(full=True)
+        except pa.ArrowInvalid:
+            return None
+        return array.to_pandas()
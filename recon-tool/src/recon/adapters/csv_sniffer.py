@@ -0,0 +1,132 @@
+"""
+CSV Sniffer Adapter
+Detección de encoding, separador y comillas a partir de una muestra del archivo
+"""
+
+import codecs
+from collections import Counter
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from recon.adapters.compressed import open_stream
+
+# Bytes iniciales inspeccionados (ya descomprimidos)
+SNIFF_BYTES = 64 * 1024
+
+DELIMITER_CANDIDATES = (",", ";", "\t", "|")
+QUOTE_CANDIDATES = ('"', "'")
+
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+@dataclass
+class CsvDialect:
+    """Formato detectado de un CSV"""
+    encoding: str
+    delimiter: str
+    quotechar: str = '"'
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def detect_encoding(sample: bytes) -> str:
+    """
+    Encoding de la muestra: BOM, UTF-16 sin BOM (bytes nulos alternados),
+    UTF-8 válido o, si no, cp1252 (exportaciones de Excel en Windows).
+    """
+    for bom, encoding in _BOMS:
+        if sample.startswith(bom):
+            return encoding
+
+    pairs = len(sample) // 2
+    if pairs:
+        even_nulls = sample[0::2].count(0) / pairs
+        odd_nulls = sample[1::2].count(0) / pairs
+        if odd_nulls > 0.3 and even_nulls < 0.05:
+            return "utf-16-le"
+        if even_nulls > 0.3 and odd_nulls < 0.05:
+            return "utf-16-be"
+
+    # Decodificación incremental: un carácter cortado al final de la muestra no es error
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+    try:
+        sample.decode("cp1252")
+        return "cp1252"
+    except UnicodeDecodeError:
+        return "latin-1"
+
+
+def _complete_lines(text: str, limit: int = 200) -> list[str]:
+    """Líneas completas y no vacías de la muestra (la última puede estar cortada)"""
+    lines = text.splitlines()
+    if not text.endswith(("\n", "\r")):
+        lines = lines[:-1]
+    return [line for line in lines if line.strip()][:limit]
+
+
+def _count_outside_quotes(line: str, char: str, quotechar: str) -> int:
+    count, quoted = 0, False
+    for c in line:
+        if c == quotechar:
+            quoted = not quoted
+        elif c == char and not quoted:
+            count += 1
+    return count
+
+
+def detect_quotechar(text: str) -> str:
+    """Comilla que encierra campos: la que más aparece junto a un separador"""
+    scores = {}
+    for quote in QUOTE_CANDIDATES:
+        scores[quote] = sum(
+            text.count(f"{d}{quote}") + text.count(f"{quote}{d}")
+            for d in DELIMITER_CANDIDATES
+        )
+    best = max(QUOTE_CANDIDATES, key=lambda q: scores[q])
+    return best if scores[best] > 0 else '"'
+
+
+def detect_delimiter(text: str, quotechar: str = '"') -> str:
+    """
+    Separador más consistente entre líneas.
+
+    Para cada candidato se toma la cantidad de apariciones más frecuente por
+    línea (fuera de comillas); gana el que aparece con esa misma cantidad en
+    más líneas y, a igualdad, el que genera más columnas.
+    """
+    lines = _complete_lines(text)
+    if not lines:
+        return ","
+    best, best_score = ",", (0.0, 0)
+    for candidate in DELIMITER_CANDIDATES:
+        counts = Counter(_count_outside_quotes(line, candidate, quotechar) for line in lines)
+        mode, frequency = counts.most_common(1)[0]
+        if mode == 0:
+            continue
+        score = (frequency / len(lines), mode)
+        if score > best_score:
+            best, best_score = candidate, score
+    return best
+
+
+def sniff_csv(path: str | Path, compression: str | None = None,
+              member: str | None = None) -> CsvDialect:
+    """Detecta encoding, separador y comillas leyendo solo `SNIFF_BYTES` bytes"""
+    with open_stream(path, compression, member) as handle:
+        sample = handle.read(SNIFF_BYTES)
+
+    encoding = detect_encoding(sample)
+    # utf-8-sig y utf-16 descartan el BOM al decodificar la muestra
+    text = codecs.getincrementaldecoder(encoding)(errors="replace").decode(sample)
+    quotechar = detect_quotechar(text)
+    return CsvDialect(encoding=encoding, delimiter=detect_delimiter(text, quotechar),
+                      quotechar=quotechar)
@@ -0,0 +1,133 @@
+"""
+Excel Source Adapter
+Adaptador para leer hojas de Excel (.xlsx) sin cargar el libro completo
+"""
+
+from collections.abc import Iterator
+from datetime import date, datetime, time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+try:
+    import openpyxl
+except ImportError:  # pragma: no cover - dependencia opcional
+    openpyxl = None
+
+
+# Filas leídas para estimar el tamaño por fila antes de fijar el chunk real
+PROBE_ROWS = 256
+
+
+def _cell_text(value: Any) -> Any:
+    """
+    Valor de celda como texto, igual que una columna CSV leída con dtype=str.
+
+    Los enteros guardados como float (146.0) se escriben sin decimales para
+    que las claves coincidan con las de otras fuentes.
+    """
+    if value is None:
+        return np.nan
+    if isinstance(value, str):
+        return value if value != "" else np.nan
+    if isinstance(value, bool):
+        return str(value).upper()
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    return str(value)
+
+
+class ExcelSourceReader:
+    """
+    Lector de una hoja de Excel por chunks en modo `read_only` de openpyxl.
+
+    En modo de solo lectura las filas se recorren desde el XML de la hoja sin
+    construir el modelo de celdas del libro, de modo que la memoria depende
+    del tamaño del chunk y no del de la hoja. Como en CSV, todos los valores
+    se entregan como texto.
+    """
+
+    def __init__(self, path: str | Path, sheet: str | None = None, header_row: int = 1,
+                 columns: set[str] | None = None):
+        if openpyxl is None:
+            raise ImportError("Excel sources require openpyxl (pip install 'recon-tool[excel]')")
+        self.path = Path(path)
+        self.sheet = sheet  # None = primera hoja
+        self.header_row = header_row
+        self.columns = columns  # Proyección; None = todas las columnas
+
+    def _open(self):
+        return openpyxl.load_workbook(self.path, read_only=True, data_only=True)
+
+    def _worksheet(self, workbook):
+        if self.sheet is None:
+            return workbook.worksheets[0]
+        if self.sheet not in workbook.sheetnames:
+            raise ValueError(f"Sheet '{self.sheet}' not found in {self.path.name} "
+                             f"(sheets: {', '.join(workbook.sheetnames)})")
+        return workbook[self.sheet]
+
+    def _header(self, worksheet) -> list[str]:
+        rows = worksheet.iter_rows(
+            min_row=self.header_row, max_row=self.header_row, values_only=True
+        )
+        header = next(rows, ())
+        # Igual que pandas: encabezados vacíos como 'Unnamed: i'
+        return [f"Unnamed: {i}" if value is None or str(value).strip() == ""
+                else str(value).strip() for i, value in enumerate(header)]
+
+    def read_header(self) -> list[str]:
+        """Lee solo la fila de encabezados de la hoja"""
+        workbook = self._open()
+        try:
+            return self._header(self._worksheet(workbook))
+        finally:
+            workbook.close()
+
+    def iter_chunks(self, chunk_rows: int,
+                    max_memory: int | None = None) -> Iterator[pd.DataFrame]:
+        """
+        Genera DataFrames de como máximo `chunk_rows` filas.
+
+        Con `max_memory` el primer chunk es de prueba (`PROBE_ROWS` filas) y
+        sirve para estimar el tamaño por fila, como en el lector CSV.
+        """
+        workbook = self._open()
+        try:
+            worksheet = self._worksheet(workbook)
+            header = self._header(worksheet)
+            if self.columns is None:
+                positions = list(range(len(header)))
+            else:
+                positions = [i for i, name in enumerate(header) if name in self.columns]
+            names = [header[i] for i in positions]
+
+            limit = min(chunk_rows, PROBE_ROWS) if max_memory else chunk_rows
+            probed = not max_memory
+            rows: list[list[Any]] = []
+            yielded = False
+            for values in worksheet.iter_rows(min_row=self.header_row + 1, values_only=True):
+                if all(v is None for v in values):
+                    continue  # Filas vacías con formato al final de la hoja
+                rows.append([_cell_text(values[i]) if i < len(values) else np.nan
+                             for i in positions])
+                if len(rows) < limit:
+                    continue
+
+                chunk = pd.DataFrame(rows, columns=names, dtype=object)
+                rows = []
+                if not probed:
+                    bytes_per_row = max(1, chunk.memory_usage(deep=True).sum() // len(chunk))
+                    limit = max(1, min(chunk_rows, max_memory // bytes_per_row))
+                    probed = True
+                yielded = True
+                yield chunk
+
+            if rows or not yielded:
+                yield pd.DataFrame(rows, columns=names, dtype=object)
+        finally:
+            workbook.close()
@@ -0,0 +1,265 @@
+"""
+PBI Catalog - Index of report visuals, fields and filters
+Índice de visuales, campos y filtros del Layout, persistido en la caché
+"""
+
+import hashlib
+import json
+import os
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+from recon.adapters.pbi_layout import (
+    LAYOUT_MEMBER,
+    LayoutItem,
+    PbixArchive,
+    ReportSection,
+    VisualContainer,
+    iter_layout,
+)
+from recon.core.cache import CATALOG_CACHE_DIR
+
+# Cambiar si cambia el formato del catálogo para invalidar los ya guardados
+CATALOG_FORMAT_VERSION = 1
+
+
+def field_id(table: str, column: str) -> str:
+    """Identificador de un campo del modelo en notación DAX: Tabla[Columna]"""
+    return f"{table}[{column}]"
+
+
+def _literal(value: Any) -> Any:
+    """Valor de un literal de consulta PBI ('Broadband' → Broadband, 12L → 12)"""
+    if isinstance(value, str):
+        if len(value) >= 2 and value[0] == value[-1] == "'":
+            return value[1:-1].replace("''", "'")
+        if value[-1:] in ("L", "D", "M") and value[:-1].lstrip("-").replace(".", "", 1).isdigit():
+            number = value[:-1]
+            return float(number) if "." in number else int(number)
+        if value in ("true", "false"):
+            return value == "true"
+    return value
+
+
+def _expression_field(expression: dict, aliases: dict[str, str]) -> tuple[str, str] | None:
+    """(tabla, campo) de una expresión de columna/medida/agregación de una consulta PBI"""
+    for kind in ("Column", "Measure"):
+        node = expression.get(kind)
+        if isinstance(node, dict):
+            source = node.get("Expression", {}).get("SourceRef", {})
+            table = source.get("Entity") or aliases.get(source.get("Source", ""))
+            if table and node.get("Property"):
+                return table, node["Property"]
+    if isinstance(expression.get("Aggregation"), dict):
+        return _expression_field(expression["Aggregation"].get("Expression", {}), aliases)
+    level = expression.get("HierarchyLevel")
+    if isinstance(level, dict):
+        hierarchy = level.get("Expression", {}).get("Hierarchy", {})
+        source = hierarchy.get("Expression", {})
+        source = source.get("PropertyVariationSource", {}).get("Expression", source)
+        source = source.get("SourceRef", {})
+        table = source.get("Entity") or aliases.get(source.get("Source", ""))
+        if table and level.get("Level"):
+            return table, level["Level"]
+    return None
+
+
+def _aliases(query: dict) -> dict[str, str]:
+    return {f.get("Name", ""): f.get("Entity", "") for f in query.get("From", [])}
+
+
+def _filter_values(query: dict) -> list | None:
+    """Valores de un filtro de lista (condición In); None si es de otro tipo o excluyente"""
+    values = []
+    for where in query.get("Where", []):
+        condition = where.get("Condition", {})
+        rows = condition.get("In", {}).get("Values")
+        if rows is None:
+            return None
+        values.extend(_literal(cell.get("Literal", {}).get("Value"))
+                      for row in rows for cell in row)
+    return values
+
+
+@dataclass
+class VisualRef:
+    """Visual del reporte tal como se guarda en el catálogo"""
+    page: str  # Nombre interno de la sección (ReportSection...)
+    page_display_name: str
+    visual: str
+    visual_type: str
+    title: str | None = None
+
+
+@dataclass
+class FilterRef:
+    """Filtro de página o de visual sobre un campo del modelo"""
+    field: str
+    scope: str  # page o visual
+    visual: str | None = None
+    type: str | None = None  # Categorical, Advanced, TopN, ...
+    values: list | None = None  # Valores de un filtro de lista, si aplica
+
+
+def visual_fields(visual: VisualContainer) -> list[str]:
+    """Campos del modelo que proyecta un visual (prototypeQuery o queryRef)"""
+    single = visual.config.get("singleVisual", {})
+    query = single.get("prototypeQuery", {})
+    aliases = _aliases(query)
+    fields = []
+    for select in query.get("Select", []):
+        found = _expression_field(select, aliases)
+        if found:
+            fields.append(field_id(*found))
+    if not query:
+        # Sin prototypeQuery: "Tabla.Campo" de las proyecciones
+        for projections in single.get("projections", {}).values():
+            for projection in projections:
+                table, _, column = projection.get("queryRef", "").partition(".")
+                if table and column:
+                    fields.append(field_id(table, column))
+    return list(dict.fromkeys(fields))
+
+
+def parse_filters(filters: list, scope: str, visual: str | None = None) -> list[FilterRef]:
+    """Filtros (lista decodificada de `filters`) sobre campos del modelo"""
+    refs = []
+    for item in filters:
+        if not isinstance(item, dict):
+            continue
+        found = _expression_field(item.get("expression", {}), {})
+        if not found:
+            continue
+        query = item.get("filter") or {}
+        refs.append(FilterRef(field=field_id(*found), scope=scope, visual=visual,
+                              type=item.get("type"),
+                              values=_filter_values(query) if query else None))
+    return refs
+
+
+@dataclass
+class LayoutCatalog:
+    """
+    Índices del reporte para búsquedas O(1):
+
+    - `fields`: campo → posiciones en `visuals` de los visuales que lo usan
+      (proyectado o filtrado en el visual)
+    - `tables`: tabla → campos referenciados (incluye filtros de página)
+    - `filters`: página → filtros de la página y de sus visuales
+    """
+    key: str = ""
+    visuals: list[VisualRef] = field(default_factory=list)
+    fields: dict[str, list[int]] = field(default_factory=dict)
+    tables: dict[str, list[str]] = field(default_factory=dict)
+    filters: dict[str, list[FilterRef]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, items: Iterable[LayoutItem], key: str = "") -> "LayoutCatalog":
+        """Construye el catálogo recorriendo el Layout en streaming"""
+        catalog = cls(key=key)
+        for item in items:
+            if isinstance(item, ReportSection):
+                page_filters = parse_filters(item.filters, "page")
+                catalog.filters.setdefault(item.name, [])[:0] = page_filters
+                for ref in page_filters:
+                    catalog._add_table_field(ref.field)
+                continue
+
+            visual = item
+            position = len(catalog.visuals)
+            catalog.visuals.append(VisualRef(
+                page=visual.section.name,
+                page_display_name=visual.section.display_name,
+                visual=visual.name,
+                visual_type=visual.visual_type,
+                title=visual.title,
+            ))
+            visual_filters = parse_filters(visual.filters, "visual", visual.name)
+            catalog.filters.setdefault(visual.section.name, []).extend(visual_filters)
+            used = visual_fields(visual) + [ref.field for ref in visual_filters]
+            for name in dict.fromkeys(used):
+                catalog.fields.setdefault(name, []).append(position)
+                catalog._add_table_field(name)
+        return catalog
+
+    def _add_table_field(self, name: str) -> None:
+        table = name.split("[", 1)[0]
+        fields = self.tables.setdefault(table, [])
+        if name not in fields:
+            fields.append(name)
+
+    def visuals_using(self, name: str) -> list[VisualRef]:
+        return [self.visuals[i] for i in self.fields.get(name, [])]
+
+    def filters_for(self, visual: VisualRef) -> list[FilterRef]:
+        """Filtros que aplican a un visual: los de su página más los propios"""
+        return [ref for ref in self.filters.get(visual.page, [])
+                if ref.scope == "page" or ref.visual == visual.visual]
+
+    @cached_property
+    def _referenced(self) -> set[str]:
+        return {name for fields in self.tables.values() for name in fields}
+
+    def is_referenced(self, table: str, column: str) -> bool:
+        """Si algún visual o filtro del reporte usa Tabla[Columna]"""
+        return field_id(table, column) in self._referenced
+
+    def to_dict(self) -> dict:
+        return {
+            "version": CATALOG_FORMAT_VERSION,
+            "key": self.key,
+            "visuals": [asdict(v) for v in self.visuals],
+            "fields": self.fields,
+            "tables": self.tables,
+            "filters": {page: [asdict(f) for f in refs] for page, refs in self.filters.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LayoutCatalog":
+        return cls(
+            key=data.get("key", ""),
+            visuals=[VisualRef(**v) for v in data.get("visuals", [])],
+            fields=data.get("fields", {}),
+            tables=data.get("tables", {}),
+            filters={page: [FilterRef(**f) for f in refs]
+                     for page, refs in data.get("filters", {}).items()},
+        )
+
+
+def catalog_key(model: PbixArchive) -> str:
+    """
+    Clave del catálogo: el hash del PBIX o, en una carpeta descomprimida, la
+    huella (ruta, tamaño, mtime) del Layout.
+    """
+    if model.is_archive:
+        return model.key
+    stat = model.member_path(LAYOUT_MEMBER).stat()
+    payload = f"{model.member_path(LAYOUT_MEMBER).resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def load_catalog(model: PbixArchive,
+                 cache_dir: str | Path | None = None) -> tuple[LayoutCatalog, bool]:
+    """
+    Catálogo del reporte desde la caché, o parseando el Layout si no existe.
+
+    Retorna (catálogo, cached). El catálogo se guarda en
+    `cache_dir/catalog/<clave>.json`, junto a la caché de fuentes.
+    """
+    key = catalog_key(model)
+    path = Path(cache_dir) / CATALOG_CACHE_DIR / f"{key}.json" if cache_dir else None
+    if path is not None and path.exists():
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("version") == CATALOG_FORMAT_VERSION:
+            return LayoutCatalog.from_dict(data), True
+
+    catalog = LayoutCatalog.build(iter_layout(model), key=key)
+    if path is not None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.tmp{os.getpid()}")
+        tmp.write_text(json.dumps(catalog.to_dict(), ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+    return catalog, False
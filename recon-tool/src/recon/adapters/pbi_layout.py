@@ -2,3 +2,428 @@
 PBI Layout Adapter
 Adaptador para leer y parsear el archivo Layout de Power BI
 """
+
+import codecs
+import hashlib
+import json
+import os
+import re
+import shutil
+import zipfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import cached_property
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from recon.core.cache import MEMBER_CACHE_DIR, MEMBER_META_FILE, content_hash
+
+PBIX_SUFFIXES = (".pbix", ".pbit")
+
+LAYOUT_MEMBER = "Report/Layout"
+SCHEMA_MEMBER = "DataModelSchema"
+
+_COPY_BUFFER_BYTES = 1024 * 1024
+
+# Bytes leídos por vez al parsear el Layout
+LAYOUT_READ_BYTES = 256 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Caracteres que pueden seguir a un valor completo
+_VALUE_END = frozenset(" \t\n\r,:]}")
+
+
+class PbiLayoutError(Exception):
+    """Error al leer un PBIX o su contenido"""
+    pass
+
+
+def is_pbix(path: str | Path) -> bool:
+    return Path(path).suffix.lower() in PBIX_SUFFIXES
+
+
+def archive_key(path: str | Path) -> str:
+    """
+    Clave de un PBIX: hash de contenido muestreado y tamaño.
+
+    No incluye ruta ni mtime, así que copiar o mover el PBIX conserva los
+    miembros ya extraídos.
+    """
+    path = Path(path)
+    size = path.stat().st_size
+    payload = f"{content_hash(path, size)}:{size}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+class PbixArchive:
+    """
+    Miembros de un modelo PBI: un `.pbix`/`.pbit` o su carpeta descomprimida.
+
+    Sobre el zip solo se lee el directorio central; cada miembro pedido se
+    descomprime en streaming. Con `cache_dir`, el miembro se extrae una vez a
+    `cache_dir/pbix/<hash>/` y las lecturas siguientes abren ese archivo sin
+    tocar el zip; esas extracciones son entradas de la caché (`recon cache
+    ls/prune/clear`). Una carpeta descomprimida se lee directamente.
+    """
+
+    def __init__(self, path: str | Path, cache_dir: str | Path | None = None):
+        self.path = Path(path)
+        if not self.path.exists():
+            raise PbiLayoutError(f"PBI model not found: {self.path}")
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.is_archive = self.path.is_file()
+        self._key: str | None = None
+        self._names: list[str] | None = None
+        self.members_extracted = 0  # Miembros descomprimidos (no servidos desde la caché)
+
+    @property
+    def key(self) -> str:
+        if self._key is None:
+            self._key = archive_key(self.path) if self.is_archive else ""
+        return self._key
+
+    def _cached_path(self, member: str) -> Path | None:
+        if not self.is_archive or self.cache_dir is None:
+            return None
+        return self.cache_dir / MEMBER_CACHE_DIR / self.key / member
+
+    def members(self) -> list[str]:
+        """Nombres de los miembros (rutas con '/')"""
+        if self._names is None:
+            if self.is_archive:
+                try:
+                    with zipfile.ZipFile(self.path) as archive:
+                        self._names = [i.filename for i in archive.infolist() if not i.is_dir()]
+                except zipfile.BadZipFile as e:
+                    raise PbiLayoutError(f"Not a valid PBIX archive: {self.path} ({e})") from e
+            else:
+                self._names = sorted(p.relative_to(self.path).as_posix()
+                                     for p in self.path.rglob("*") if p.is_file())
+        return self._names
+
+    def has_member(self, member: str) -> bool:
+        cached = self._cached_path(member)
+        return (cached is not None and cached.exists()) or member in self.members()
+
+    def member_path(self, member: str) -> Path:
+        """
+        Archivo en disco con el contenido del miembro (la carpeta descomprimida
+        o la extracción en caché). Sin `cache_dir` no hay archivo para un zip.
+        """
+        if not self.is_archive:
+            path = self.path / member
+            if not path.is_file():
+                raise PbiLayoutError(f"Member '{member}' not found in {self.path}")
+            return path
+        cached = self._cached_path(member)
+        if cached is None:
+            raise PbiLayoutError("Extracting PBIX members to disk requires a cache directory")
+        if not cached.exists():
+            self._extract(member, cached)
+        self._mark_used()
+        return cached
+
+    def _mark_used(self) -> None:
+        """Registra el PBIX de origen de la extracción y su último uso (LRU de la caché)"""
+        meta = self.cache_dir / MEMBER_CACHE_DIR / self.key / MEMBER_META_FILE
+        if meta.exists():
+            os.utime(meta)
+            return
+        meta.write_text(json.dumps({"source_path": str(self.path.resolve()),
+                                    "created_at": datetime.now().isoformat()}),
+                        encoding="utf-8")
+
+    def _extract(self, member: str, target: Path) -> None:
+        """Descomprime un miembro en streaming hacia la caché (escritura atómica)"""
+        if member not in self.members():
+            raise PbiLayoutError(f"Member '{member}' not found in {self.path}")
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f"{target.name}.tmp{os.getpid()}")
+        with zipfile.ZipFile(self.path) as archive, archive.open(member) as src, \
+                open(tmp, "wb") as dst:
+            shutil.copyfileobj(src, dst, _COPY_BUFFER_BYTES)
+        os.replace(tmp, target)
+        self.members_extracted += 1
+
+    @contextmanager
+    def open(self, member: str) -> Iterator[BinaryIO]:
+        """Stream binario de un miembro (desde la caché si ya fue extraído)"""
+        if not self.is_archive or self.cache_dir is not None:
+            with open(self.member_path(member), "rb") as f:
+                yield f
+            return
+        if member not in self.members():
+            raise PbiLayoutError(f"Member '{member}' not found in {self.path}")
+        with zipfile.ZipFile(self.path) as archive, archive.open(member) as f:
+            yield f
+
+    def read(self, member: str) -> bytes:
+        with self.open(member) as f:
+            return f.read()
+
+
+def clear_member_cache(cache_dir: str | Path) -> int:
+    """Elimina los miembros extraídos de todos los PBIX; retorna cuántos PBIX había"""
+    root = Path(cache_dir) / MEMBER_CACHE_DIR
+    if not root.exists():
+        return 0
+    archives = [p for p in root.iterdir() if p.is_dir()]
+    shutil.rmtree(root)
+    return len(archives)
+
+
+def _nested_json(raw: dict, key: str) -> Any:
+    """Valor JSON doblemente codificado (texto con JSON dentro) decodificado"""
+    value = raw.get(key)
+    if isinstance(value, str):
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            return None
+    return value
+
+
+@dataclass
+class ReportSection:
+    """
+    Página del reporte.
+
+    `raw` conserva las propiedades de la sección salvo `visualContainers`,
+    que se entregan uno a uno; `filters` y `config` se decodifican solo al
+    pedirlos.
+    """
+    index: int
+    raw: dict = field(default_factory=dict)
+    visual_count: int = 0
+
+    @property
+    def name(self) -> str:
+        return self.raw.get("name", "")
+
+    @property
+    def display_name(self) -> str:
+        return self.raw.get("displayName", self.name)
+
+    @cached_property
+    def filters(self) -> list:
+        return _nested_json(self.raw, "filters") or []
+
+    @cached_property
+    def config(self) -> dict:
+        return _nested_json(self.raw, "config") or {}
+
+
+@dataclass
+class VisualContainer:
+    """
+    Visual de una página, con su `config`, `filters` y `query` decodificados
+    de forma diferida. `section` puede estar incompleta mientras se recorre
+    (las propiedades posteriores a `visualContainers` aún no se leyeron).
+    """
+    section: ReportSection
+    index: int
+    raw: dict = field(default_factory=dict)
+
+    @cached_property
+    def config(self) -> dict:
+        return _nested_json(self.raw, "config") or {}
+
+    @cached_property
+    def filters(self) -> list:
+        return _nested_json(self.raw, "filters") or []
+
+    @cached_property
+    def query(self) -> dict:
+        return _nested_json(self.raw, "query") or {}
+
+    @property
+    def name(self) -> str:
+        return self.config.get("name", "")
+
+    @property
+    def visual_type(self) -> str:
+        return self.config.get("singleVisual", {}).get("visualType", "")
+
+    @property
+    def title(self) -> str | None:
+        """Título configurado del visual, si lo tiene"""
+        for title in self.config.get("singleVisual", {}).get("vcObjects", {}).get("title", []):
+            text = title.get("properties", {}).get("text", {}).get("expr", {})
+            value = text.get("Literal", {}).get("Value")
+            if isinstance(value, str):
+                return value.strip("'")
+        return None
+
+
+LayoutItem = VisualContainer | ReportSection
+
+
+def detect_member_encoding(head: bytes) -> tuple[str, int]:
+    """
+    Codificación de un miembro JSON del PBIX (Layout, DataModelSchema) y bytes
+    de BOM. Los PBIX guardan esos miembros en UTF-16LE sin BOM.
+    """
+    if head.startswith(codecs.BOM_UTF16_LE):
+        return "utf-16-le", 2
+    if head.startswith(codecs.BOM_UTF16_BE):
+        return "utf-16-be", 2
+    if head.startswith(codecs.BOM_UTF8):
+        return "utf-8", 3
+    if len(head) >= 2 and head[1] == 0:
+        return "utf-16-le", 0
+    if len(head) >= 2 and head[0] == 0:
+        return "utf-16-be", 0
+    return "utf-8", 0
+
+
+class LayoutReader:
+    """
+    Parser incremental del JSON del Layout.
+
+    El stream se decodifica por bloques (`LAYOUT_READ_BYTES`) y solo se
+    mantiene en memoria el texto pendiente más el valor en curso: cada
+    visual se decodifica completo y se entrega, y cada página se entrega sin
+    su lista de visuales al cerrarse. La memoria pico depende del visual más
+    grande, no del número de páginas o visuales. Las propiedades del reporte
+    (todo salvo `sections`) quedan en `report` al terminar el recorrido.
+    """
+
+    def __init__(self, stream: BinaryIO, read_bytes: int = LAYOUT_READ_BYTES):
+        self.stream = stream
+        self.read_bytes = read_bytes
+        self.report: dict = {}
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = None
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    # Lectura del texto
+
+    def _fill(self) -> bool:
+        """Agrega un bloque decodificado al buffer; False al final del stream"""
+        if self._eof:
+            return False
+        if self._text_decoder is None:
+            # El primer bloque alcanza al menos para detectar la codificación
+            data = self.stream.read(max(self.read_bytes, 4))
+            encoding, bom = detect_member_encoding(data)
+            self._text_decoder = codecs.getincrementaldecoder(encoding)(errors="strict")
+            data = data[bom:]
+        else:
+            data = self.stream.read(self.read_bytes)
+        if not data:
+            self._eof = True
+            self._buffer += self._decode(b"", final=True)
+            return False
+        # Descartar lo ya consumido para que el buffer no crezca con el archivo
+        if self._pos:
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        self._buffer += self._decode(data)
+        return True
+
+    def _decode(self, data: bytes, final: bool = False) -> str:
+        try:
+            return self._text_decoder.decode(data, final=final)
+        except UnicodeDecodeError as e:
+            raise PbiLayoutError(f"Invalid Layout encoding: {e}") from e
+
+    def _peek(self) -> str:
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise PbiLayoutError("Unexpected end of Layout JSON")
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            raise PbiLayoutError(f"Invalid Layout JSON: expected '{char}' at offset {self._pos}, "
+                                 f"found '{self._buffer[self._pos]}'")
+        self._pos += 1
+
+    def _value(self) -> Any:
+        """Decodifica un valor JSON completo (leyendo más texto si está cortado)"""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as e:
+                if not self._fill():
+                    raise PbiLayoutError(f"Invalid Layout JSON: {e}") from e
+                continue
+            # Un número cortado por el bloque ("10" de "10.5") se decodifica igual
+            cut = end == len(self._buffer) or self._buffer[end] not in _VALUE_END
+            if cut and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def _members(self) -> Iterator[str]:
+        """Claves de un objeto (tras '{'); el valor lo consume quien itera"""
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self._value()
+            if not isinstance(key, str):
+                raise PbiLayoutError("Invalid Layout JSON: object key is not a string")
+            self._expect(":")
+            yield key
+            separator = self._peek()
+            self._pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise PbiLayoutError(f"Invalid Layout JSON: unexpected '{separator}'")
+
+    def _elements(self) -> Iterator[None]:
+        """Posiciones de los elementos de un arreglo (tras '[')"""
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield None
+            separator = self._peek()
+            self._pos += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise PbiLayoutError(f"Invalid Layout JSON: unexpected '{separator}'")
+
+    # Recorrido del Layout
+
+    def __iter__(self) -> Iterator[LayoutItem]:
+        self._expect("{")
+        for key in self._members():
+            if key == "sections" and self._peek() == "[":
+                self._pos += 1
+                for index, _ in enumerate(self._elements()):
+                    yield from self._section(index)
+            else:
+                self.report[key] = self._value()
+
+    def _section(self, index: int) -> Iterator[LayoutItem]:
+        section = ReportSection(index=index)
+        self._expect("{")
+        for key in self._members():
+            if key == "visualContainers" and self._peek() == "[":
+                self._pos += 1
+                for _ in self._elements():
+                    raw = self._value()
+                    yield VisualContainer(section=section, index=section.visual_count,
+                                          raw=raw if isinstance(raw, dict) else {})
+                    section.visual_count += 1
+            else:
+                section.raw[key] = self._value()
+        yield section
+
+
+def iter_layout(model: PbixArchive) -> Iterator[LayoutItem]:
+    """Páginas y visuales del `Report/Layout` de un modelo PBI, uno a uno"""
+    with model.open(LAYOUT_MEMBER) as stream:
+        yield from LayoutReader(stream)
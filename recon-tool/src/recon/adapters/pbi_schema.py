@@ -0,0 +1,250 @@
+"""
+PBI Schema - Tabular model metadata from DataModelSchema
+Metadatos del modelo (tablas, columnas, tipos, relaciones y medidas) sin leer datos
+"""
+
+import json
+from dataclasses import dataclass, field
+
+from recon.adapters.pbi_layout import (
+    SCHEMA_MEMBER,
+    PbiLayoutError,
+    PbixArchive,
+    detect_member_encoding,
+)
+from recon.core.config import IntegrityCheck, ProjectConfig
+from recon.core.planner import column_references
+
+# Tipos de datos numéricos del modelo tabular
+NUMERIC_TYPES = ("int64", "double", "decimal")
+
+# Tipo declarado en `schema:` → tipos del modelo compatibles (None = cualquiera)
+SCHEMA_MODEL_TYPES: dict[str, tuple[str, ...] | None] = {
+    "int": ("int64",),
+    "decimal": NUMERIC_TYPES,
+    "money": NUMERIC_TYPES,
+    "date": ("dateTime",),
+    "category": None,
+    "string": None,
+}
+
+# Severidad de los checks generados desde relaciones del modelo
+RELATIONSHIP_CHECK_SEVERITY = "WARNING"
+
+
+@dataclass
+class ModelColumn:
+    """Columna de una tabla del modelo"""
+    name: str
+    data_type: str  # string, int64, double, decimal, dateTime, boolean, ...
+    kind: str = "data"  # data, calculated o calculatedTableColumn
+    is_hidden: bool = False
+
+
+@dataclass
+class ModelTable:
+    """Tabla del modelo con sus columnas y los nombres de sus medidas"""
+    name: str
+    columns: dict[str, ModelColumn] = field(default_factory=dict)
+    measures: list[str] = field(default_factory=list)
+    is_hidden: bool = False
+
+
+@dataclass
+class ModelRelationship:
+    """Relación entre dos columnas del modelo (from = lado muchos por defecto)"""
+    name: str
+    from_table: str
+    from_column: str
+    to_table: str
+    to_column: str
+    is_active: bool = True
+    from_cardinality: str = "many"
+    to_cardinality: str = "one"
+    cross_filtering: str = "oneDirection"
+
+
+@dataclass
+class ModelSchema:
+    """Esquema del modelo tabular tal como lo describe DataModelSchema"""
+    name: str = ""
+    tables: dict[str, ModelTable] = field(default_factory=dict)
+    relationships: list[ModelRelationship] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, raw: dict) -> "ModelSchema":
+        """Construye el esquema desde el JSON (TMSL) de DataModelSchema"""
+        model = raw.get("model", {})
+        tables = {}
+        for table in model.get("tables", []):
+            columns = {}
+            for column in table.get("columns", []):
+                # La columna interna RowNumber-<guid> no existe en las exportaciones
+                if column.get("type") == "rowNumber":
+                    continue
+                columns[column["name"]] = ModelColumn(
+                    name=column["name"],
+                    data_type=column.get("dataType", "string"),
+                    kind=column.get("type", "data"),
+                    is_hidden=column.get("isHidden", False),
+                )
+            tables[table["name"]] = ModelTable(
+                name=table["name"],
+                columns=columns,
+                measures=[m["name"] for m in table.get("measures", [])],
+                is_hidden=table.get("isHidden", False),
+            )
+        relationships = [
+            ModelRelationship(
+                name=rel.get("name", ""),
+                from_table=rel["fromTable"],
+                from_column=rel["fromColumn"],
+                to_table=rel["toTable"],
+                to_column=rel["toColumn"],
+                is_active=rel.get("isActive", True),
+                from_cardinality=rel.get("fromCardinality", "many"),
+                to_cardinality=rel.get("toCardinality", "one"),
+                cross_filtering=rel.get("crossFilteringBehavior", "oneDirection"),
+            )
+            for rel in model.get("relationships", [])
+        ]
+        return cls(name=raw.get("name", ""), tables=tables, relationships=relationships)
+
+    def column(self, table: str, name: str) -> ModelColumn | None:
+        model_table = self.tables.get(table)
+        return model_table.columns.get(name) if model_table else None
+
+
+def read_model_schema(model: PbixArchive) -> ModelSchema:
+    """
+    Lee el `DataModelSchema` de un modelo PBI (.pbit o carpeta descomprimida).
+
+    Solo se decodifica ese miembro; los datos del modelo (`DataModel`) no se
+    abren.
+    """
+    if not model.has_member(SCHEMA_MEMBER):
+        raise PbiLayoutError(f"No {SCHEMA_MEMBER} in {model.path} "
+                             f"(save the report as a .pbit template to include it)")
+    data = model.read(SCHEMA_MEMBER)
+    encoding, bom = detect_member_encoding(data[:4])
+    try:
+        raw = json.loads(data[bom:].decode(encoding))
+        return ModelSchema.from_dict(raw)
+    except (ValueError, KeyError, TypeError) as e:
+        raise PbiLayoutError(f"Invalid {SCHEMA_MEMBER} in {model.path}: {e}") from e
+
+
+@dataclass
+class ModelIssue:
+    """Referencia de la configuración que no coincide con el modelo PBI"""
+    source_name: str
+    table: str
+    column: str | None  # None si falta la tabla completa
+    problem: str
+    referrers: list[str] = field(default_factory=list)
+
+    @property
+    def message(self) -> str:
+        target = f"{self.table}[{self.column}]" if self.column else f"Table '{self.table}'"
+        used_by = f" (used by {', '.join(self.referrers)})" if self.referrers else ""
+        return f"{target} {self.problem} in source '{self.source_name}'{used_by}"
+
+
+def model_sources(config: ProjectConfig, schema: ModelSchema) -> dict[str, str]:
+    """
+    Fuentes que representan tablas del modelo → tabla. Son las `pbi_source`
+    de las reglas, las que declaran `pbi_table` y las que por nombre de
+    archivo coinciden con una tabla del modelo.
+    """
+    pbi_sources = {rule.pbi_source for rule in config.validation_rules.values()}
+    return {
+        name: source.model_table for name, source in config.sources.items()
+        if name in pbi_sources or source.pbi_table or source.model_table in schema.tables
+    }
+
+
+def check_model_fields(config: ProjectConfig, schema: ModelSchema) -> list[ModelIssue]:
+    """
+    Valida contra el modelo las columnas que la configuración usa en fuentes
+    del modelo: que la tabla y la columna existan (una medida no se exporta
+    como columna), que las comparaciones `numeric` apunten a columnas
+    numéricas y que los tipos declarados en `schema:` sean compatibles.
+    """
+    issues = []
+    references = column_references(config)
+    for source_name, table in model_sources(config, schema).items():
+        model_table = schema.tables.get(table)
+        if model_table is None:
+            issues.append(ModelIssue(source_name, table, None, "not found in the PBI model"))
+            continue
+        for column, referrers in references.get(source_name, {}).items():
+            if column in model_table.columns:
+                continue
+            problem = ("is a measure, not a column" if column in model_table.measures
+                       else "not found in the PBI model")
+            issues.append(ModelIssue(source_name, table, column, problem, referrers))
+
+        for column, declared in config.sources[source_name].schema.items():
+            model_column = model_table.columns.get(column)
+            allowed = SCHEMA_MODEL_TYPES.get(declared.type)
+            if model_column and allowed and model_column.data_type not in allowed:
+                issues.append(ModelIssue(
+                    source_name, table, column,
+                    f"is {model_column.data_type} in the model but declared '{declared.type}'",
+                    ["schema"]))
+
+    for service_type, rule in config.validation_rules.items():
+        pbi_source = config.sources.get(rule.pbi_source)
+        if pbi_source is None:
+            continue
+        for mapping in rule.field_mappings:
+            model_column = schema.column(pbi_source.model_table, mapping.pbi_field)
+            if (mapping.compare_type == "numeric" and model_column
+                    and model_column.data_type not in NUMERIC_TYPES):
+                issues.append(ModelIssue(
+                    rule.pbi_source, pbi_source.model_table, mapping.pbi_field,
+                    f"is {model_column.data_type} in the model, not numeric "
+                    f"(compare_type 'numeric')", [f"rule:{service_type}"]))
+    return issues
+
+
+def relationship_checks(config: ProjectConfig, schema: ModelSchema) -> list[IntegrityCheck]:
+    """
+    Checks de integridad referencial derivados de las relaciones activas del
+    modelo: el lado muchos (hechos) debe encontrar su clave en el lado uno
+    (dimensión). Solo se generan si ambas tablas tienen fuente en el proyecto
+    y no hay ya un check configurado para el mismo par de columnas.
+    """
+    by_table: dict[str, str] = {}
+    for name, table in model_sources(config, schema).items():
+        by_table.setdefault(table, name)
+    configured = {(c.source_table, c.source_key, c.target_table, c.target_key)
+                  for c in config.integrity_checks}
+
+    checks = []
+    for rel in schema.relationships:
+        if not rel.is_active:
+            continue
+        many = (rel.from_table, rel.from_column)
+        one = (rel.to_table, rel.to_column)
+        if rel.from_cardinality == "one" and rel.to_cardinality == "many":
+            many, one = one, many
+        elif rel.from_cardinality == rel.to_cardinality == "many":
+            continue  # Muchos a muchos: ningún lado es una clave única
+        source, target = by_table.get(many[0]), by_table.get(one[0])
+        if source is None or target is None:
+            continue
+        signature = (source, many[1], target, one[1])
+        if signature in configured:
+            continue
+        configured.add(signature)
+        checks.append(IntegrityCheck(
+            name=f"{source}_to_{target}" if many[1] == one[1]
+            else f"{source}_{many[1]}_to_{target}",
+            source_table=source,
+            target_table=target,
+            source_key=many[1],
+            target_key=one[1],
+            severity=RELATIONSHIP_CHECK_SEVERITY,
+        ))
+    return checks
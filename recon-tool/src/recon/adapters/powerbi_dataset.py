@@ -1,4 +1,573 @@
 """
-Power BI Dataset Adapter (Optional)
-Adaptador opcional para conectar directamente con datasets de Power BI
+Power BI Dataset Adapter - Batched, paged DAX queries over pooled connections
+Adaptador para leer tablas de un dataset de Power BI con la API executeQueries
 """
+
+import http.client
+import itertools
+import json
+import os
+import queue
+import re
+import ssl
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date
+from typing import Any
+from urllib.parse import urlsplit
+
+import numpy as np
+import pandas as pd
+
+# Límites de la API executeQueries por consulta
+MAX_QUERY_ROWS = 100_000
+MAX_QUERY_VALUES = 1_000_000
+
+# Reintentos ante 429/503 (respetando Retry-After) y espera máxima entre intentos
+MAX_RETRIES = 3
+MAX_RETRY_SECONDS = 30.0
+
+# Filas del primer chunk usadas para estimar el tamaño por fila con max_memory
+PROBE_ROWS = 256
+
+# Fechas de COLUMNSTATISTICS y de las filas de resultado (ISO 8601)
+_ISO_DATETIME = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?Z?$")
+
+# Fin de las páginas de un lote en la cola de su productor
+_BATCH_DONE = object()
+
+# Errores de una conexión keep-alive que el servidor cerró entre requests
+_STALE_CONNECTION = (http.client.RemoteDisconnected, http.client.CannotSendRequest,
+                     ConnectionResetError, BrokenPipeError)
+
+
+class DatasetError(Exception):
+    """Error al consultar un dataset de Power BI"""
+    pass
+
+
+def dax_table(name: str) -> str:
+    return "'" + name.replace("'", "''") + "'"
+
+
+def dax_column(table: str, column: str) -> str:
+    return f"{dax_table(table)}[{column.replace(']', ']]')}]"
+
+
+def dax_literal(value: Any) -> str:
+    """Literal DAX: números tal cual, fechas con DATE/TIME y el resto como texto"""
+    if value is None:
+        return "BLANK()"
+    if isinstance(value, bool):
+        return "TRUE()" if value else "FALSE()"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, date):
+        literal = f"DATE({value.year}, {value.month}, {value.day})"
+        clock = tuple(getattr(value, part, 0) for part in ("hour", "minute", "second"))
+        if any(clock):
+            literal += f" + TIME({clock[0]}, {clock[1]}, {clock[2]})"
+        return literal
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def column_kind(*values: Any) -> str:
+    """
+    Tipo de una columna ('number', 'boolean', 'datetime' o 'text') desde sus
+    valores JSON de ejemplo (Min/Max de COLUMNSTATISTICS).
+    """
+    values = [v for v in values if v is not None]
+    if not values:
+        return "text"
+    if all(isinstance(v, bool) for v in values):
+        return "boolean"
+    if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+        return "number"
+    if all(isinstance(v, str) and _ISO_DATETIME.match(v) for v in values):
+        return "datetime"
+    return "text"
+
+
+def typed_value(value: Any, kind: str) -> Any:
+    """
+    Valor de filtro (texto) como valor del tipo de la columna del modelo.
+
+    Un valor que el tipo no admite (ej: 'abc' en una columna entera) levanta
+    ValueError: no puede coincidir con ninguna fila.
+    """
+    if not isinstance(value, str) or kind == "text":
+        return value
+    text = value.strip()
+    if kind == "number":
+        try:
+            return int(text)
+        except ValueError:
+            number = float(text)
+            if not np.isfinite(number):
+                raise ValueError(f"Not a finite number: {value!r}") from None
+            return number
+    if kind == "boolean":
+        if text.upper() not in ("TRUE", "FALSE"):
+            raise ValueError(f"Not a boolean: {value!r}")
+        return text.upper() == "TRUE"
+    timestamp = pd.Timestamp(text)
+    if pd.isna(timestamp):
+        raise ValueError(f"Not a date: {value!r}")
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.tz_localize(None)
+    return timestamp.to_pydatetime()
+
+
+def build_query(table: str, columns: list[str],
+                filters: dict[str, list] | None = None,
+                page_column: str | None = None, page_rows: int | None = None,
+                after: Any = None, has_after: bool = False) -> str:
+    """
+    Consulta DAX de una tabla proyectada a `columns`.
+
+    Los filtros se aplican con TREATAS (un conjunto de valores por columna).
+    Con `page_column`, la consulta devuelve la siguiente página por clave:
+    las `page_rows` primeras filas con clave mayor que `after`, más los
+    empates del último valor (TOPN incluye todos los empates), de modo que
+    la página siguiente empieza justo después de una clave completa.
+    """
+    selected = ", ".join(f'"{c.replace(chr(34), chr(34) * 2)}", {dax_column(table, c)}'
+                         for c in columns)
+    expression = f"SELECTCOLUMNS({dax_table(table)}, {selected})"
+    if filters:
+        treatas = ", ".join(
+            f"TREATAS({{{', '.join(dax_literal(v) for v in values)}}}, "
+            f"{dax_column(table, column)})"
+            for column, values in filters.items()
+        )
+        expression = f"CALCULATETABLE({expression}, {treatas})"
+    if page_column is None:
+        return f"EVALUATE {expression}"
+
+    key = f"[{page_column.replace(']', ']]')}]"
+    if has_after:
+        expression = f"FILTER({expression}, {key} > {dax_literal(after)})"
+    return f"EVALUATE TOPN({page_rows}, {expression}, {key}, ASC) ORDER BY {key}"
+
+
+def header_query(table: str) -> str:
+    """Columnas de una tabla desde los metadatos del modelo (sin leer filas)"""
+    return (f'EVALUATE FILTER(COLUMNSTATISTICS(), [Table Name] = '
+            f'{dax_literal(table)})')
+
+
+def result_column(key: str) -> str:
+    """Nombre de columna de una clave de resultado ('T[Col]' o '[Col]' → 'Col')"""
+    if key.endswith("]") and "[" in key:
+        return key[key.index("[") + 1:-1].replace("]]", "]")
+    return key
+
+
+def _value_text(value: Any) -> Any:
+    """Valor JSON como texto, igual que una columna CSV leída con dtype=str"""
+    if value is None:
+        return np.nan
+    if isinstance(value, str):
+        return value if value != "" else np.nan
+    if isinstance(value, bool):
+        return str(value).upper()
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+class ConnectionPool:
+    """
+    Pool de conexiones HTTP/1.1 keep-alive (stdlib `http.client`) a un host.
+
+    Cada request toma una conexión libre o abre una nueva (hasta `size`) y la
+    devuelve al terminar, así que el handshake TCP/TLS se paga una vez por
+    conexión y no por consulta. Una conexión que el servidor cerró mientras
+    estaba libre se reabre y el request se reintenta una vez.
+    """
+
+    def __init__(self, url: str, size: int = 4, timeout: float = 120.0):
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise DatasetError(f"Invalid dataset URL: {url!r}")
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port
+        self.size = max(1, size)
+        self.timeout = timeout
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+        self.requests = 0
+
+    def _connect(self) -> http.client.HTTPConnection:
+        with self._lock:
+            self.connections_opened += 1
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout,
+                                               context=ssl.create_default_context())
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    @contextmanager
+    def _connection(self) -> Iterator[tuple[http.client.HTTPConnection, bool]]:
+        """Conexión del pool y si es reutilizada (True) o recién abierta"""
+        with self._slots:
+            try:
+                connection, reused = self._idle.get_nowait(), True
+            except queue.Empty:
+                connection, reused = self._connect(), False
+            try:
+                yield connection, reused
+            except BaseException:
+                connection.close()
+                raise
+            # Solo vuelven al pool las conexiones que siguen abiertas
+            if connection.sock is not None:
+                self._idle.put(connection)
+
+    def request(self, method: str, path: str, body: bytes,
+                headers: dict[str, str]) -> tuple[int, dict[str, str], bytes]:
+        """Envía un request y retorna (status, headers, cuerpo)"""
+        for attempt in range(2):
+            with self._connection() as (connection, reused):
+                try:
+                    connection.request(method, path, body=body, headers=headers)
+                    response = connection.getresponse()
+                    data = response.read()
+                except _STALE_CONNECTION:
+                    connection.close()
+                    if reused and attempt == 0:
+                        continue
+                    raise
+                with self._lock:
+                    self.requests += 1
+                if response.will_close:
+                    connection.close()  # El servidor no mantiene la conexión: no vuelve al pool
+                return response.status, dict(response.getheaders()), data
+        raise DatasetError("Connection closed by the dataset endpoint")  # pragma: no cover
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class PowerBIDatasetClient:
+    """
+    Cliente de `POST {dataset}/executeQueries` sobre un `ConnectionPool`.
+
+    `url` es la URL del dataset, ej:
+    https://api.powerbi.com/v1.0/myorg/groups/<workspace>/datasets/<id>.
+    El token (Azure AD) se toma de la variable de entorno `token_env`.
+    """
+
+    def __init__(self, url: str, token: str | None = None, connections: int = 4,
+                 timeout: float = 120.0):
+        self.url = url.rstrip("/")
+        self.path = urlsplit(self.url).path + "/executeQueries"
+        self.pool = ConnectionPool(self.url, size=connections, timeout=timeout)
+        self.headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
+        if token:
+            self.headers["Authorization"] = f"Bearer {token}"
+        self.retries = 0
+
+    def execute(self, dax: str) -> list[dict[str, Any]]:
+        """Ejecuta una consulta DAX y retorna sus filas como diccionarios"""
+        body = json.dumps({
+            "queries": [{"query": dax}],
+            "serializerSettings": {"includeNulls": True},
+        }).encode("utf-8")
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                status, headers, data = self.pool.request("POST", self.path, body, self.headers)
+            except (OSError, http.client.HTTPException) as e:
+                raise DatasetError(f"Could not reach {self.url}: {e}") from e
+            if status in (429, 503) and attempt < MAX_RETRIES:
+                self.retries += 1
+                retry_after = headers.get("Retry-After") or headers.get("retry-after")
+                try:
+                    wait = float(retry_after) if retry_after else 2.0 ** attempt
+                except ValueError:
+                    wait = 2.0 ** attempt
+                time.sleep(min(wait, MAX_RETRY_SECONDS))
+                continue
+            break
+        if status == 401:
+            raise DatasetError(f"Unauthorized for {self.url} (check the access token)")
+        if status >= 400:
+            raise DatasetError(f"Query failed with HTTP {status}: {_error_message(data)}")
+        try:
+            result = json.loads(data)["results"][0]
+        except (ValueError, KeyError, IndexError) as e:
+            raise DatasetError(f"Unexpected executeQueries response: {e}") from e
+        if "error" in result:
+            raise DatasetError(f"Query failed: {_error_message(json.dumps(result).encode())}")
+        tables = result.get("tables") or [{}]
+        return tables[0].get("rows", [])
+
+    def close(self) -> None:
+        self.pool.close()
+
+
+def _error_message(data: bytes) -> str:
+    """Detalle del error de la API (código y mensaje del motor si existen)"""
+    try:
+        error = json.loads(data).get("error", {})
+    except (ValueError, AttributeError):
+        return data[:200].decode("utf-8", "replace")
+    details = error.get("pbi.error", {}).get("details", [])
+    for detail in details:
+        value = detail.get("detail", {}).get("value")
+        if value:
+            return value
+    return error.get("message") or error.get("code") or "unknown error"
+
+
+class DatasetSourceReader:
+    """
+    Lector por chunks de una tabla de un dataset de Power BI.
+
+    Los valores de filtro de la columna con más valores (ej: miles de
+    Site_Location_Key) se reparten en lotes de `batch_size` y cada lote es
+    una sola consulta con TREATAS, en lugar de una consulta por entidad.
+    Cada lote se pagina por `page_column` (keyset sobre TOPN) para no
+    exceder el límite de filas por consulta, y hasta `connections` lotes se
+    consultan a la vez sobre el pool keep-alive. Las páginas se convierten en
+    chunks a medida que llegan (con `max_memory`, además, su tamaño se ajusta
+    al tamaño estimado por fila). Las filas se entregan en el orden de los
+    lotes, como texto, igual que una fuente CSV.
+    """
+
+    def __init__(self, url: str, table: str, columns: set[str] | None = None,
+                 filters: dict[str, set[str]] | None = None,
+                 key_columns: list[str] | None = None,
+                 token: str | None = None, batch_size: int = 500,
+                 page_rows: int = 50_000, connections: int = 4, timeout: float = 120.0,
+                 page_column: str | None = None,
+                 client: PowerBIDatasetClient | None = None):
+        self.table = table
+        self.columns = columns
+        self.filters = filters or {}
+        self.key_columns = key_columns or []
+        self.batch_size = max(1, batch_size)
+        self.page_rows = max(1, min(page_rows, MAX_QUERY_ROWS))
+        self.connections = max(1, connections)
+        self.page_column = page_column
+        self.client = client or PowerBIDatasetClient(url, token=token,
+                                                     connections=self.connections,
+                                                     timeout=timeout)
+        self._page_rows = self.page_rows
+        self._header: list[str] | None = None
+        self.column_kinds: dict[str, str] = {}
+        self.metrics: dict[str, int] = {}
+
+    def read_header(self) -> list[str]:
+        """
+        Columnas de la tabla desde COLUMNSTATISTICS(), sin leer filas.
+
+        El tipo de cada columna se deduce de sus valores Min/Max y queda en
+        `column_kinds` para castear los filtros.
+        """
+        if self._header is None:
+            rows = self.client.execute(header_query(self.table))
+            names = []
+            for row in rows:
+                values = {result_column(k): v for k, v in row.items()}
+                name = values.get("Column Name")
+                # La columna interna RowNumber-<guid> no es consultable
+                if name and not str(name).startswith("RowNumber-"):
+                    names.append(str(name))
+                    self.column_kinds[str(name)] = column_kind(values.get("Min"),
+                                                               values.get("Max"))
+            self._header = names
+        return self._header
+
+    def _plan(self) -> tuple[list[str], str | None, list[dict[str, list]]]:
+        """Columnas de la consulta, columna de paginación y filtros de cada lote"""
+        header = self.read_header()
+        columns = header if self.columns is None else [c for c in header if c in self.columns]
+        page_column = self.page_column or next(
+            (c for c in self.key_columns if c in header), None)
+        if page_column is not None and page_column not in header:
+            raise DatasetError(f"Page column '{page_column}' not found in '{self.table}'")
+        query_columns = list(columns)
+        if page_column is not None and page_column not in query_columns:
+            query_columns.append(page_column)
+
+        missing = [c for c in self.filters if c not in header]
+        if missing:
+            return query_columns, page_column, []  # Ninguna fila puede cumplir el filtro
+        filters = {c: self._typed_values(c, v) for c, v in self.filters.items()}
+        if any(not values for values in filters.values()):
+            return query_columns, page_column, []
+        if not filters:
+            return query_columns, page_column, [{}]
+        batched = max(filters, key=lambda c: len(filters[c]))
+        values = filters[batched]
+        return query_columns, page_column, [
+            {**filters, batched: values[start:start + self.batch_size]}
+            for start in range(0, len(values), self.batch_size)
+        ]
+
+    def _typed_values(self, column: str, values: set[str]) -> list:
+        """
+        Los filtros llegan como texto; se castean al tipo de la columna del
+        modelo (un texto en TREATAS sobre una columna entera no coincide).
+        Los valores que el tipo no admite se descartan.
+        """
+        kind = self.column_kinds.get(column, "text")
+        typed = set()
+        for value in values:
+            try:
+                typed.add(typed_value(value, kind))
+            except ValueError:
+                continue
+        return sorted(typed)
+
+    def _page_size(self, columns: list[str]) -> int:
+        """Filas por página: `page_rows` (o el tope por max_memory) y el límite de valores"""
+        return max(1, min(self._page_rows, MAX_QUERY_VALUES // max(len(columns), 1)))
+
+    def _fetch_batch(self, columns: list[str], page_column: str | None,
+                     filters: dict[str, list]) -> Iterator[list[dict[str, Any]]]:
+        """Genera las páginas de un lote a medida que llegan (consultas secuenciales por clave)"""
+        if page_column is None:
+            # Sin columna de paginación la tabla (o el lote) es una sola consulta
+            yield self.client.execute(build_query(self.table, columns, filters))
+            return
+        after, has_after = None, False
+        key = f"[{page_column}]"
+        while True:
+            # El tamaño se lee en cada página: baja en cuanto se estima el tamaño por fila
+            page_rows = self._page_size(columns)
+            rows = self.client.execute(build_query(self.table, columns, filters, page_column,
+                                                   page_rows, after, has_after))
+            yield rows
+            if len(rows) < page_rows:
+                return
+            last = rows[-1]
+            # Las fechas vuelven como texto ISO: el keyset compara con DATE(...)
+            after = typed_value(last.get(key, last.get(f"{self.table}[{page_column}]")),
+                                self.column_kinds.get(page_column, "text"))
+            has_after = True
+
+    def _iter_pages(self, columns: list[str], page_column: str | None,
+                    batches: list[dict[str, list]]) -> Iterator[list[dict[str, Any]]]:
+        """
+        Páginas de todos los lotes en orden.
+
+        Con más de una conexión, hasta `connections` lotes se consultan a la
+        vez; cada uno entrega sus páginas por una cola de una posición, así
+        que en memoria hay como máximo unas pocas páginas por lote en vuelo
+        y nunca un lote completo.
+        """
+        self.metrics = {"batches": len(batches), "pages": 0}
+        jobs = min(self.connections, len(batches))
+        if jobs <= 1:
+            for batch in batches:
+                for rows in self._fetch_batch(columns, page_column, batch):
+                    self.metrics["pages"] += 1
+                    yield rows
+            return
+
+        stop = threading.Event()
+
+        def put(pages: queue.Queue, item: Any) -> bool:
+            # Espera a que el consumidor libere la cola; False si la lectura se canceló
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce(batch: dict[str, list], pages: queue.Queue) -> None:
+            try:
+                for rows in self._fetch_batch(columns, page_column, batch):
+                    if not put(pages, rows):
+                        return
+            except BaseException as e:
+                put(pages, e)
+                return
+            put(pages, _BATCH_DONE)
+
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            window: deque[queue.Queue] = deque()
+            remaining = iter(batches)
+            try:
+                for batch in itertools.islice(remaining, jobs):
+                    window.append(queue.Queue(maxsize=1))
+                    pool.submit(produce, batch, window[-1])
+                while window:
+                    pages = window.popleft()
+                    while (item := pages.get()) is not _BATCH_DONE:
+                        if isinstance(item, BaseException):
+                            raise item
+                        self.metrics["pages"] += 1
+                        yield item
+                    # Lote terminado: entra el siguiente a la ventana
+                    for batch in itertools.islice(remaining, 1):
+                        window.append(queue.Queue(maxsize=1))
+                        pool.submit(produce, batch, window[-1])
+            finally:
+                stop.set()
+
+    def iter_chunks(self, chunk_rows: int,
+                    max_memory: int | None = None) -> Iterator[pd.DataFrame]:
+        """Genera DataFrames de como máximo `chunk_rows` filas (texto)"""
+        columns, page_column, batches = self._plan()
+        names = columns if self.columns is None or page_column in self.columns \
+            else [c for c in columns if c != page_column]
+
+        limit = min(chunk_rows, PROBE_ROWS) if max_memory else chunk_rows
+        probed = not max_memory
+        # Con max_memory las primeras páginas son de PROBE_ROWS filas; tras estimar el
+        # tamaño por fila, las páginas se limitan a lo que cabe en max_memory
+        self._page_rows = min(self.page_rows, PROBE_ROWS) if max_memory else self.page_rows
+        rows: list[list[Any]] = []
+        yielded = False
+        try:
+            for page in self._iter_pages(columns, page_column, batches):
+                for row in page:
+                    values = {result_column(k): v for k, v in row.items()}
+                    rows.append([_value_text(values.get(c)) for c in names])
+                    if len(rows) < limit:
+                        continue
+                    chunk = pd.DataFrame(rows, columns=names, dtype=object)
+                    rows = []
+                    if not probed:
+                        bytes_per_row = max(1, chunk.memory_usage(deep=True).sum() // len(chunk))
+                        limit = max(1, min(chunk_rows, max_memory // bytes_per_row))
+                        self._page_rows = max(1, min(self.page_rows,
+                                                     max_memory // bytes_per_row))
+                        probed = True
+                    yielded = True
+                    yield chunk
+            if rows or not yielded:
+                yield pd.DataFrame(rows, columns=names, dtype=object)
+        finally:
+            self.metrics.update(requests=self.client.pool.requests,
+                                connections_opened=self.client.pool.connections_opened,
+                                retries=self.client.retries)
+            self.client.close()
+
+
+def reader_for_source(source, columns: set[str] | None = None,
+                      filters: dict[str, set[str]] | None = None) -> DatasetSourceReader:
+    """Lector de una fuente `type: powerbi` con sus opciones `dataset:`"""
+    options = source.dataset
+    return DatasetSourceReader(
+        source.path, source.model_table, columns=columns, filters=filters,
+        key_columns=source.key_columns, token=os.environ.get(options.token_env),
+        batch_size=options.batch_size, page_rows=options.page_rows,
+        connections=options.connections, timeout=options.timeout,
+        page_column=options.page_column,
+    )
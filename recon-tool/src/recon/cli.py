@@ -13,12 +13,32 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from recon.core.config import ConfigLoader, ConfigurationError
-from recon.core.models import (
-    ReconciliationReport,
-    ValidationStatus,
-    Severity
+from recon.adapters.pbi_catalog import load_catalog
+from recon.adapters.pbi_layout import (
+    LAYOUT_MEMBER,
+    SCHEMA_MEMBER,
+    PbiLayoutError,
+    PbixArchive,
+    ReportSection,
+    iter_layout,
+)
+from recon.adapters.pbi_schema import (
+    ModelSchema,
+    check_model_fields,
+    read_model_schema,
+    relationship_checks,
 )
+from recon.core.backends import ENGINES, BackendError, get_backend
+from recon.core.cache import CacheError, SourceCache
+from recon.core.config import ConfigLoader, ConfigurationError
+from recon.core.dialect import DialectCache
+from recon.core.ingest import IngestEngine, IngestError, IngestOptions, parse_memory_size
+from recon.core.models import ReconciliationReport, Severity, ValidationStatus
+from recon.core.planner import build_plan
+from recon.core.rules import RulesEngine, referenced_rules, select_rules
+from recon.core.schema import SchemaCache, check_columns, probe_sources
+from recon.core.session import SourceSession
+from recon.core.spill import DEFAULT_SPILL_MEMORY
 
 console = Console()
 
@@ -77,8 +97,38 @@ def cli():
 @click.option('--output', '-o', type=click.Choice(['console', 'markdown', 'json', 'all']), 
               default='console', help='Formato de salida')
 @click.option('--output-dir', default='./reports', help='Directorio para guardar reportes')
+@click.option('--chunk-rows', type=int, help='Filas por chunk de ingesta (override de settings)')
+@click.option('--max-memory', help='Memoria máxima por chunk, ej: 256MB (override de settings)')
+@click.option('--no-projection', is_flag=True, help='Cargar todas las columnas de cada fuente')
+@click.option('--no-dictionary', is_flag=True,
+              help='No codificar como category las columnas de baja cardinalidad')
+@click.option('--dtype-backend', type=click.Choice(['numpy', 'pyarrow']),
+              help='Columnas en memoria: numpy o pyarrow (ArrowDtype, override de settings)')
+@click.option('--engine', 'engine_name', type=click.Choice(ENGINES),
+              help='Motor de reglas y checks: pandas, polars o duckdb (override de settings)')
+@click.option('--referenced-only/--all-fields', default=None,
+              help='Reconciliar solo los campos PBI que usan los visuales del reporte')
+@click.option('--model-checks/--no-model-checks', default=None,
+              help='Agregar checks de integridad desde las relaciones del modelo PBI')
+@click.option('--no-unpivot', is_flag=True,
+              help='Ejecutar cada regla de servicio por separado (sin cruce único)')
+@click.option('--out-of-core', is_flag=True,
+              help='Comparar por buckets en disco; --max-memory acota cada par de buckets')
+@click.option('--spill-dir', help='Directorio para los buckets en disco (override de settings)')
+@click.option('--jobs', '-j', type=int, help='Fuentes cargadas en paralelo (override de settings)')
+@click.option('--executor', type=click.Choice(['thread', 'process']),
+              help='Pool de carga: thread (I/O) o process (parseo CPU)')
+@click.option('--no-cache', is_flag=True, help='No usar la caché columnar de fuentes')
+@click.option('--cache-dir', help='Directorio de la caché (override de settings)')
+@click.option('--skip-schema-check', is_flag=True,
+              help='No verificar columnas referenciadas antes de cargar')
 def run(project: str, config_dir: str, site: str, vendor: str, 
-        service_type: str, output: str, output_dir: str):
+        service_type: str, output: str, output_dir: str,
+        chunk_rows: int, max_memory: str, no_projection: bool, no_dictionary: bool,
+        dtype_backend: str, engine_name: str, referenced_only: bool,
+        model_checks: bool | None, no_unpivot: bool, out_of_core: bool,
+        spill_dir: str, jobs: int, executor: str, no_cache: bool, cache_dir: str,
+        skip_schema_check: bool):
     """
     Ejecuta la reconciliación de datos para un proyecto.
     
@@ -87,6 +137,7 @@ def run(project: str, config_dir: str, site: str, vendor: str,
       recon run --project mvh
       recon run --project mvh --site 146 --vendor Verizon
       recon run --project mvh --service-type Broadband --output markdown
+      recon run --project mvh --out-of-core --max-memory 512MB
     """
     start_time = datetime.now()
     
@@ -124,21 +175,115 @@ def run(project: str, config_dir: str, site: str, vendor: str,
     if service_type:
         filters['service_type'] = service_type
         console.print(f"🔍 Filter: Service Type = [yellow]{service_type}[/yellow]")
+
+    # Ingesta de fuentes por chunks
+    try:
+        options = IngestOptions.from_config(config, chunk_rows=chunk_rows, max_memory=max_memory,
+                                            jobs=jobs, executor=executor,
+                                            dictionary_encoding=False if no_dictionary else None,
+                                            dtype_backend=dtype_backend)
+    except IngestError as e:
+        console.print(f"[red]✗ Error:[/red] {e}")
+        sys.exit(1)
+
+    try:
+        backend = get_backend(engine_name or config.engine)
+    except BackendError as e:
+        console.print(f"[red]✗ Error:[/red] {e}")
+        sys.exit(1)
+
+    if no_projection:
+        config.column_projection = False
+    if no_unpivot:
+        config.unpivot_rules = False
+
+    cache = None
+    dialect_cache = None
+    if config.cache_enabled and not no_cache:
+        dialect_cache = DialectCache(cache_dir or config.cache_dir)
+        if SourceCache.available():
+            cache = SourceCache(cache_dir or config.cache_dir)
+        else:
+            console.print("\n[yellow]⚠️  pyarrow not installed - source cache disabled[/yellow]")
+
+    # Cada fuente se carga una vez y se comparte entre reglas y checks
+    config.validation_rules = select_rules(config, service_type)
+    if referenced_only if referenced_only is not None else config.referenced_fields_only:
+        _restrict_to_report(config, None if no_cache else cache_dir or config.cache_dir)
+
+    # Metadatos del modelo (DataModelSchema): checks por relaciones y validación de campos
+    model_checks = model_checks if model_checks is not None else config.model_checks
+    model_schema = None
+    if model_checks or not skip_schema_check:
+        model_schema = _load_model_schema(config,
+                                          None if no_cache else cache_dir or config.cache_dir,
+                                          quiet=not model_checks)
+    if model_checks and model_schema is not None:
+        generated = relationship_checks(config, model_schema)
+        config.integrity_checks.extend(generated)
+        console.print(f"\n🔗 Model relationships: {len(generated)} integrity checks added")
+        for check in generated:
+            console.print(f"   - {check.name}: {check.source_table}.{check.source_key} → "
+                          f"{check.target_table}.{check.target_key}")
+    plan = build_plan(config, filters)
+    engine = IngestEngine(config, options, plan=plan, cache=cache, dialect_cache=dialect_cache)
+    session = SourceSession(engine, plan)
+
+    # Sondeo de encabezados: una columna inexistente aborta antes de cargar datos
+    if not skip_schema_check:
+        schema_cache = SchemaCache(cache_dir or config.cache_dir) \
+            if config.cache_enabled and not no_cache else None
+        schemas = probe_sources(config, session.needed_sources, schema_cache)
+        issues = check_columns(config, schemas)
+        if model_schema is not None:
+            issues += check_model_fields(config, model_schema)
+        if issues:
+            console.print("\n[red]✗ Schema check failed:[/red]")
+            for issue in issues:
+                console.print(f"   [red]✗[/red] {issue.message}")
+            console.print("   (use --skip-schema-check to run anyway)")
+            sys.exit(1)
+        probed = sum(1 for schema in schemas.values() if schema.ok)
+        model = ", PBI model fields checked" if model_schema is not None else ""
+        console.print(f"\n🧾 Schema check: referenced columns present "
+                      f"({probed}/{len(schemas)} sources probed{model})")
+
+    budget = f", max {_format_bytes(options.max_memory)}/chunk" if options.max_memory else ""
+    parallel = f", {options.jobs} {options.executor} jobs" if options.jobs > 1 else ""
+    console.print(f"\n📥 Ingesting sources "
+                  f"(chunks of {options.chunk_rows:,} rows{budget}{parallel})")
+    out_of_core = out_of_core or config.out_of_core
+    spill_memory = (options.max_memory or DEFAULT_SPILL_MEMORY) if out_of_core else None
+    if out_of_core:
+        console.print(f"   Out-of-core: sources are streamed into on-disk buckets "
+                      f"(max {_format_bytes(spill_memory)} per bucket pair)")
+    elif options.jobs > 1:
+        load_seconds = session.preload().seconds
+        console.print(f"   Load phase: [green]{load_seconds:.2f}s[/green]")
+    else:
+        console.print("   Sources are loaded on first use")
     
-    # TODO: Implementar el engine de reconciliación en Sprint 1
-    console.print("\n" + "="*60)
-    console.print("[yellow]⚠️  Sprint 0: Skeleton mode - Engine not yet implemented[/yellow]")
-    console.print("="*60)
-    
-    # Crear reporte vacío para demo
     report = ReconciliationReport(
         project_name=config.name,
         generated_at=datetime.now(),
         config_file=str(config_path),
-        filters_applied=filters,
-        execution_time_seconds=(datetime.now() - start_time).total_seconds()
+        filters_applied=filters
     )
-    
+
+    console.print(f"\n🔎 Running integrity checks and validation rules "
+                  f"({backend.name} engine)...")
+    rules_engine = RulesEngine(config, session, backend, spill_memory=spill_memory,
+                               spill_dir=spill_dir or config.spill_dir)
+    rules_engine.run(report)
+
+    _print_ingest_stats(engine, session)
+    _print_spill_stats(rules_engine.spill_stats)
+    report.sources_loaded = {
+        name: stats.rows for name, stats in engine.stats.items() if name not in session.errors
+    }
+    report.source_stats = {name: stats.to_dict() for name, stats in engine.stats.items()}
+    report.execution_time_seconds = (datetime.now() - start_time).total_seconds()
+
     # Generar salida según formato
     if output in ['markdown', 'all']:
         from recon.reporting.markdown_reporter import MarkdownReporter
@@ -222,10 +367,26 @@ def validate_config(project: str, config_dir: str):
         console.print(f"[bold]Project:[/bold] {config.name}")
         console.print(f"[bold]Description:[/bold] {config.description}")
         console.print(f"[bold]Version:[/bold] {config.version}")
-        
+
+        # Esquema de cada fuente leyendo solo encabezados
+        schemas = probe_sources(config, cache=SchemaCache(config.cache_dir)
+                                if config.cache_enabled else None)
+        issues = check_columns(config, schemas)
+        model_schema = _load_model_schema(config, config.cache_dir if config.cache_enabled
+                                          else None, quiet=True)
+        if model_schema is not None:
+            issues += check_model_fields(config, model_schema)
+
         console.print(f"\n[bold]Sources ({len(config.sources)}):[/bold]")
         for name, src in config.sources.items():
-            path_status = "✓" if src.resolve_path(config.base_path).exists() else "✗ NOT FOUND"
+            schema = schemas[name]
+            if not schema.found:
+                path_status = "✗ NOT FOUND"
+            elif not schema.ok:
+                path_status = f"✗ {schema.error}"
+            else:
+                cached = ", cached" if schema.cached else ""
+                path_status = f"✓ {len(schema.columns)} columns{cached}"
             console.print(f"  - {name}: {src.path} [{path_status}]")
         
         console.print(f"\n[bold]Validation Rules ({len(config.validation_rules)}):[/bold]")
@@ -236,6 +397,18 @@ def validate_config(project: str, config_dir: str):
         for check in config.integrity_checks:
             console.print(f"  - {check.name}: {check.source_table} → {check.target_table}")
         
+        if model_schema is not None:
+            console.print(f"\n[bold]PBI Model:[/bold] {len(model_schema.tables)} tables, "
+                          f"{len(model_schema.relationships)} relationships "
+                          f"(fields and types checked from {SCHEMA_MEMBER})")
+
+        if issues:
+            console.print(f"\n[red]✗ Missing columns ({len(issues)}):[/red]")
+            for issue in issues:
+                console.print(f"  - {issue.message}")
+            sys.exit(1)
+        console.print("\n[green]✓ All referenced columns exist in the available sources[/green]")
+
     except ConfigurationError as e:
         console.print(f"[red]✗ Configuration Error:[/red] {e}")
         sys.exit(1)
@@ -244,6 +417,262 @@ def validate_config(project: str, config_dir: str):
         sys.exit(1)
 
 
+@cli.group()
+def cache():
+    """Administra la caché columnar de fuentes parseadas."""
+    pass
+
+
+def _open_cache(cache_dir: str) -> SourceCache:
+    try:
+        return SourceCache(cache_dir)
+    except CacheError as e:
+        console.print(f"[red]✗ Error:[/red] {e}")
+        sys.exit(1)
+
+
+@cache.command('ls')
+@click.option('--cache-dir', default='.recon_cache', help='Directorio de la caché')
+def cache_ls(cache_dir: str):
+    """Lista las entradas de la caché (más recientes primero), incluidos los PBIX extraídos."""
+    entries = _open_cache(cache_dir).all_entries()
+
+    if not entries:
+        console.print("[yellow]Cache is empty.[/yellow]")
+        return
+
+    table = Table(show_header=True, header_style="bold cyan")
+    table.add_column("Key")
+    table.add_column("Source")
+    table.add_column("Rows", justify="right")
+    table.add_column("Columns", justify="right")
+    table.add_column("Size", justify="right")
+    table.add_column("Last Used")
+
+    for entry in entries:
+        is_pbix = entry.kind == "pbix"
+        table.add_row(
+            entry.key[:12],
+            f"{entry.source_name} (PBIX members)" if is_pbix else entry.source_name,
+            "-" if is_pbix else f"{entry.rows:,}",
+            f"{len(entry.columns)} members" if is_pbix
+            else f"{len(entry.columns)}/{entry.columns_total}",
+            _format_bytes(entry.size_bytes),
+            entry.last_used_at.strftime('%Y-%m-%d %H:%M:%S')
+        )
+
+    console.print(table)
+    total = sum(e.size_bytes for e in entries)
+    console.print(f"\n{len(entries)} entries, {_format_bytes(total)}")
+
+
+@cache.command('clear')
+@click.option('--cache-dir', default='.recon_cache', help='Directorio de la caché')
+def cache_clear(cache_dir: str):
+    """
+    Elimina todas las entradas de la caché (fuentes y miembros extraídos de PBIX)
+    y los resultados de detección guardados (formatos CSV, encabezados, catálogos).
+    """
+    removed = _open_cache(cache_dir).clear()
+    console.print(f"[green]✓ Removed {removed} cache entries and cached detection "
+                  f"results[/green]")
+
+
+@cache.command('prune')
+@click.option('--cache-dir', default='.recon_cache', help='Directorio de la caché')
+@click.option('--max-size', required=True, help='Tamaño máximo de la caché, ej: 10GB')
+def cache_prune(cache_dir: str, max_size: str):
+    """Elimina las entradas menos usadas hasta quedar bajo --max-size."""
+    try:
+        limit = parse_memory_size(max_size)
+    except IngestError as e:
+        console.print(f"[red]✗ Error:[/red] {e}")
+        sys.exit(1)
+
+    removed = _open_cache(cache_dir).prune(limit)
+    for entry in removed:
+        console.print(f"  - {entry.source_name} ({entry.key[:12]}, "
+                      f"{_format_bytes(entry.size_bytes)})")
+    console.print(f"[green]✓ Pruned {len(removed)} cache entries[/green]")
+
+
+@cli.group()
+def pbi():
+    """Inspecciona el modelo PBI (.pbix/.pbit o carpeta descomprimida)."""
+    pass
+
+
+def _open_pbi_model(project: str, config_dir: str, no_cache: bool) -> PbixArchive:
+    try:
+        config = ConfigLoader(Path(config_dir) / f"{project}.yaml").load()
+        cache_dir = config.cache_dir if config.cache_enabled and not no_cache else None
+        return PbixArchive(config.pbi_model_path, cache_dir=cache_dir)
+    except (ConfigurationError, PbiLayoutError) as e:
+        console.print(f"[red]✗ Error:[/red] {e}")
+        sys.exit(1)
+
+
+@pbi.command('members')
+@click.option('--project', '-p', required=True, help='Nombre del proyecto')
+@click.option('--config-dir', '-c', default='./configs', help='Directorio de configuraciones')
+@click.option('--no-cache', is_flag=True, help='No extraer miembros a la caché')
+def pbi_members(project: str, config_dir: str, no_cache: bool):
+    """Lista los miembros del modelo PBI sin descomprimirlo."""
+    model = _open_pbi_model(project, config_dir, no_cache)
+    try:
+        members = model.members()
+    except PbiLayoutError as e:
+        console.print(f"[red]✗ Error:[/red] {e}")
+        sys.exit(1)
+
+    kind = f"archive {model.key[:12]}" if model.is_archive else "unpacked directory"
+    console.print(f"\n📦 {model.path} ({kind}, {len(members)} members)")
+    for member in members:
+        marker = " [cyan](used)[/cyan]" if member in (LAYOUT_MEMBER, SCHEMA_MEMBER) else ""
+        console.print(f"  - {member}{marker}")
+
+
+@pbi.command('layout')
+@click.option('--project', '-p', required=True, help='Nombre del proyecto')
+@click.option('--config-dir', '-c', default='./configs', help='Directorio de configuraciones')
+@click.option('--no-cache', is_flag=True, help='No extraer miembros a la caché')
+def pbi_layout(project: str, config_dir: str, no_cache: bool):
+    """Lista las páginas del reporte y sus visuales (parseo en streaming)."""
+    model = _open_pbi_model(project, config_dir, no_cache)
+
+    table = Table(show_header=True, header_style="bold cyan")
+    table.add_column("Page")
+    table.add_column("Visuals", justify="right")
+    table.add_column("Visual Types")
+
+    visual_types: dict[str, int] = {}
+    try:
+        for item in iter_layout(model):
+            if isinstance(item, ReportSection):
+                types = ", ".join(f"{t} ({n})" if n > 1 else t for t, n in visual_types.items())
+                table.add_row(item.display_name, str(item.visual_count), types)
+                visual_types = {}
+            else:
+                visual_type = item.visual_type or "?"
+                visual_types[visual_type] = visual_types.get(visual_type, 0) + 1
+    except PbiLayoutError as e:
+        console.print(f"[red]✗ Error:[/red] {e}")
+        sys.exit(1)
+
+    console.print(table)
+
+
+@pbi.command('fields')
+@click.option('--project', '-p', required=True, help='Nombre del proyecto')
+@click.option('--config-dir', '-c', default='./configs', help='Directorio de configuraciones')
+@click.option('--table', help='Campos de una tabla del modelo')
+@click.option('--field', 'field_name',
+              help="Visuales y filtros de un campo, ej: 'factQuotes[Total MRC]'")
+@click.option('--no-cache', is_flag=True, help='Parsear el Layout sin usar el catálogo guardado')
+def pbi_fields(project: str, config_dir: str, table: str, field_name: str, no_cache: bool):
+    """Consulta el catálogo de campos usados por los visuales del reporte."""
+    model = _open_pbi_model(project, config_dir, no_cache)
+    try:
+        catalog, cached = load_catalog(model, model.cache_dir)
+    except PbiLayoutError as e:
+        console.print(f"[red]✗ Error:[/red] {e}")
+        sys.exit(1)
+
+    if field_name:
+        visuals = catalog.visuals_using(field_name)
+        if not visuals:
+            console.print(f"[yellow]No visual uses {field_name}[/yellow]")
+            return
+        console.print(f"\n[bold]{field_name}[/bold]: {len(visuals)} visuals")
+        for visual in visuals:
+            label = visual.title or visual.visual
+            console.print(f"  - {visual.page_display_name} / {label} ({visual.visual_type})")
+            for ref in catalog.filters_for(visual):
+                values = f" = {ref.values}" if ref.values is not None else ""
+                console.print(f"      {ref.scope} filter: {ref.field}{values}")
+        return
+
+    table_view = Table(show_header=True, header_style="bold cyan")
+    if table:
+        table_view.add_column("Field")
+        table_view.add_column("Visuals", justify="right")
+        for name in catalog.tables.get(table, []):
+            table_view.add_row(name, str(len(catalog.fields.get(name, []))))
+    else:
+        table_view.add_column("Table")
+        table_view.add_column("Fields", justify="right")
+        for name, fields in sorted(catalog.tables.items()):
+            table_view.add_row(name, str(len(fields)))
+    console.print(table_view)
+    source = "cached catalog" if cached else "parsed Layout"
+    console.print(f"\n{len(catalog.visuals)} visuals ({source})")
+
+
+@pbi.command('schema')
+@click.option('--project', '-p', required=True, help='Nombre del proyecto')
+@click.option('--config-dir', '-c', default='./configs', help='Directorio de configuraciones')
+@click.option('--table', help='Columnas y medidas de una tabla del modelo')
+@click.option('--checks', is_flag=True,
+              help='Imprimir como YAML los checks de integridad derivados de las relaciones')
+@click.option('--no-cache', is_flag=True, help='No extraer miembros a la caché')
+def pbi_schema(project: str, config_dir: str, table: str, checks: bool, no_cache: bool):
+    """Tablas, tipos y relaciones del modelo (solo DataModelSchema, sin datos)."""
+    model = _open_pbi_model(project, config_dir, no_cache)
+    try:
+        schema = read_model_schema(model)
+    except PbiLayoutError as e:
+        console.print(f"[red]✗ Error:[/red] {e}")
+        sys.exit(1)
+
+    if checks:
+        config = ConfigLoader(Path(config_dir) / f"{project}.yaml").load()
+        generated = relationship_checks(config, schema)
+        if not generated:
+            console.print("[yellow]No unchecked model relationship maps to project "
+                          "sources[/yellow]")
+            return
+        lines = ["integrity_checks:"]
+        for check in generated:
+            lines += [f"  - name: '{check.name}'",
+                      f"    source_table: '{check.source_table}'",
+                      f"    target_table: '{check.target_table}'",
+                      f"    source_key: '{check.source_key}'",
+                      f"    target_key: '{check.target_key}'",
+                      f"    severity: '{check.severity}'"]
+        click.echo("\n".join(lines))
+        return
+
+    table_view = Table(show_header=True, header_style="bold cyan")
+    if table:
+        model_table = schema.tables.get(table)
+        if model_table is None:
+            console.print(f"[red]✗ Error:[/red] Table '{table}' not found in the PBI model")
+            sys.exit(1)
+        table_view.add_column("Column")
+        table_view.add_column("Type")
+        table_view.add_column("Kind")
+        for column in model_table.columns.values():
+            table_view.add_row(column.name, column.data_type, column.kind)
+        for measure in model_table.measures:
+            table_view.add_row(measure, "", "measure")
+        console.print(table_view)
+        return
+
+    table_view.add_column("Table")
+    table_view.add_column("Columns", justify="right")
+    table_view.add_column("Measures", justify="right")
+    for name, model_table in schema.tables.items():
+        table_view.add_row(name, str(len(model_table.columns)), str(len(model_table.measures)))
+    console.print(table_view)
+
+    if schema.relationships:
+        console.print(f"\n[bold]Relationships ({len(schema.relationships)}):[/bold]")
+        for rel in schema.relationships:
+            inactive = " [dim](inactive)[/dim]" if not rel.is_active else ""
+            console.print(f"  - {rel.from_table}[{rel.from_column}] ({rel.from_cardinality}) → "
+                          f"{rel.to_table}[{rel.to_column}] ({rel.to_cardinality}){inactive}")
+
+
 @cli.command()
 def status_legend():
     """Muestra la leyenda de estados de validación."""
@@ -293,6 +722,137 @@ def status_legend():
     console.print("[italic]Nunca 'podría ser...' o 'probablemente...'[/italic]\n")
 
 
+def _format_bytes(num_bytes: int) -> str:
+    """Formatea un tamaño en bytes para lectura humana"""
+    size = float(num_bytes)
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.1f} {unit}" if unit != "B" else f"{int(size)} B"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def _print_ingest_stats(engine: IngestEngine, session: SourceSession):
+    """Muestra las métricas de ingesta de cada fuente"""
+    console.print("\n📥 Sources:")
+    for name in engine.config.sources:
+        if name in session.errors:
+            console.print(f"   [red]✗ {name}:[/red] {session.errors[name]}")
+            continue
+        if name not in engine.stats:
+            console.print(f"   - {name}: not loaded (no rule or check uses it)")
+            continue
+
+        stats = engine.stats[name]
+        cache_note = f", cache {stats.metadata['cache']}" if "cache" in stats.metadata else ""
+        if stats.metadata.get("cache") == "append":
+            cache_note += f" +{stats.metadata['rows_appended']:,} new rows"
+        if "compression" in stats.metadata:
+            cache_note += f", {stats.metadata['compression']} stream"
+        console.print(
+            f"   ✓ {name}: {stats.rows:,} rows in {stats.seconds:.2f}s "
+            f"({stats.rows_per_second:,.0f} rows/s, "
+            f"peak frames {_format_bytes(stats.peak_frame_bytes)}{cache_note})"
+        )
+
+        columns_total = stats.metadata.get("columns_total")
+        if columns_total is not None:
+            columns_loaded = stats.metadata.get("columns_loaded", columns_total)
+            console.print(f"     columns: {columns_loaded}/{columns_total} projected")
+        if "dialect" in stats.metadata:
+            dialect = stats.metadata["dialect"]
+            console.print(f"     detected: encoding {dialect['encoding']}, "
+                          f"delimiter {dialect['delimiter']!r}, quote {dialect['quotechar']!r}")
+        if "schema" in stats.metadata:
+            typed = ", ".join(f"{c}: {t}" for c, t in stats.metadata["schema"].items())
+            console.print(f"     typed: {typed}")
+        for column, count in stats.metadata.get("coerce_invalid", {}).items():
+            console.print(f"     [yellow]⚠ {count:,} values in '{column}' could not be converted "
+                          f"to {stats.metadata['schema'][column]}[/yellow]")
+        if stats.metadata.get("dictionary_columns"):
+            encoded = ", ".join(stats.metadata["dictionary_columns"])
+            console.print(f"     dictionary-encoded: {encoded}")
+        if "rows_scanned" in stats.metadata:
+            console.print(
+                f"     filtered: {stats.rows:,}/{stats.metadata['rows_scanned']:,} rows kept "
+                f"{stats.metadata['filters']}"
+            )
+        if "files_pruned" in stats.metadata:
+            console.print(
+                f"     files: {stats.metadata['files_scanned']}/{stats.metadata['files_total']} "
+                f"scanned, {stats.metadata['files_pruned']} pruned by partition"
+            )
+        if "row_groups_total" in stats.metadata:
+            console.print(
+                f"     pushdown: {stats.metadata['files_scanned']}/{stats.metadata['files_total']} "
+                f"files, {stats.metadata['row_groups_scanned']}/"
+                f"{stats.metadata['row_groups_total']} row groups scanned"
+            )
+        if "batches" in stats.metadata:
+            retries = stats.metadata.get("retries", 0)
+            console.print(
+                f"     dataset: {stats.metadata['batches']} batches, {stats.metadata['pages']} "
+                f"pages, {stats.metadata['requests']} requests over "
+                f"{stats.metadata['connections_opened']} connections"
+                + (f", {retries} throttled retries" if retries else "")
+            )
+        for column in stats.metadata.get("columns_missing", []):
+            console.print(f"     [yellow]⚠ column not found: {column}[/yellow]")
+
+    console.print(f"   Peak frame bytes held by shared sources: "
+                  f"{_format_bytes(session.peak_frame_bytes)}")
+
+
+def _restrict_to_report(config, cache_dir: str | None):
+    """Reduce las reglas a los campos PBI que usan los visuales del reporte"""
+    try:
+        model = PbixArchive(config.pbi_model_path,
+                            cache_dir=cache_dir if config.cache_enabled else None)
+        catalog, cached = load_catalog(model, model.cache_dir)
+    except PbiLayoutError as e:
+        console.print(f"\n[yellow]⚠️  Report catalog unavailable ({e}) - "
+                      f"reconciling all mapped fields[/yellow]")
+        return
+
+    source = "cached" if cached else "parsed"
+    console.print(f"\n🧭 Report catalog ({source}): {len(catalog.visuals)} visuals, "
+                  f"{len(catalog.fields)} fields in use")
+    config.validation_rules, skipped = referenced_rules(config, config.validation_rules, catalog)
+    for service_type, fields in skipped.items():
+        state = "kept" if service_type in config.validation_rules else "rule skipped"
+        console.print(f"   - {service_type}: not used by any visual: {', '.join(fields)} "
+                      f"({state})")
+
+
+def _load_model_schema(config, cache_dir: str | None, quiet: bool = False
+                       ) -> ModelSchema | None:
+    """Esquema del modelo PBI, o None si no hay modelo o no incluye DataModelSchema"""
+    if not config.pbi_model_path:
+        return None
+    try:
+        model = PbixArchive(config.pbi_model_path,
+                            cache_dir=cache_dir if config.cache_enabled else None)
+        return read_model_schema(model)
+    except PbiLayoutError as e:
+        if not quiet:
+            console.print(f"\n[yellow]⚠️  PBI model schema unavailable ({e}) - "
+                          f"no model checks added[/yellow]")
+        return None
+
+
+def _print_spill_stats(spill_stats: dict[str, dict]):
+    """Buckets y bytes derramados a disco por regla (modo fuera de memoria)"""
+    if not spill_stats:
+        return
+    console.print("\n💽 Out-of-core comparison")
+    for service_type, stats in spill_stats.items():
+        console.print(
+            f"   {service_type}: {stats['buckets']} buckets, {stats['rows_spilled']:,} rows / "
+            f"{_format_bytes(stats['bytes_spilled'])} spilled, "
+            f"peak bucket pair {_format_bytes(stats['peak_bucket_bytes'])}"
+        )
+
+
 def _display_console_report(report: ReconciliationReport):
     """Muestra el reporte en consola"""
     console.print("\n" + "="*60)
@@ -307,12 +867,43 @@ def _display_console_report(report: ReconciliationReport):
         console.print(f"Filters: {report.filters_applied}")
     
     console.print(f"\n[bold]Summary:[/bold]")
+    console.print(f"  Sources Loaded: {len(report.sources_loaded)}")
     console.print(f"  Integrity Checks: {len(report.integrity_checks)}")
     console.print(f"  Data Quality Tables: {len(report.data_quality)}")
     console.print(f"  Entity Comparisons: {len(report.entity_comparisons)}")
     
+    if report.integrity_checks:
+        console.print("\n[bold]Integrity Checks:[/bold]")
+        table = Table(show_header=True, header_style="bold cyan")
+        table.add_column("Check")
+        table.add_column("Tables")
+        table.add_column("Status")
+        table.add_column("Match %", justify="right")
+        table.add_column("Missing", justify="right")
+        for check in report.integrity_checks:
+            color = get_status_color(check.status)
+            table.add_row(
+                check.check_name,
+                f"{check.source_table} → {check.target_table}",
+                f"[{color}]{check.status.value}[/{color}]",
+                f"{check.match_percentage:.1f}",
+                f"{check.missing_in_target:,}"
+            )
+        console.print(table)
+
+    if report.entity_comparisons:
+        # Conteo de validaciones por estado
+        counts = dict.fromkeys(ValidationStatus, 0)
+        for entity in report.entity_comparisons:
+            for validation in entity.validations:
+                counts[validation.status] += 1
+        console.print("\n[bold]Field Validations:[/bold]")
+        for status, count in counts.items():
+            color = get_status_color(status)
+            console.print(f"  [{color}]{status.value}[/{color}]: {count:,}")
+
     if not report.entity_comparisons and not report.integrity_checks:
-        console.print("\n[yellow]No validation results yet (Sprint 0 skeleton)[/yellow]")
+        console.print("\n[yellow]No validation results (no rules or checks executed)[/yellow]")
 
 
 def main():
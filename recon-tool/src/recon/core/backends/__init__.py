@@ -0,0 +1,36 @@
+"""
+Backends Module - Pluggable execution engines for reconciliation operations
+Motores de ejecución intercambiables: pandas, Polars y DuckDB
+"""
+
+from recon.core.backends.base import ExecutionBackend
+
+ENGINES = ("pandas", "polars", "duckdb")
+
+
+class BackendError(Exception):
+    """Motor de ejecución desconocido o no instalado"""
+    pass
+
+
+def get_backend(name: str = "pandas", **options) -> ExecutionBackend:
+    """
+    Crea el motor indicado. Polars y DuckDB se importan solo al pedirlos, de
+    modo que el motor pandas no requiere ninguna dependencia opcional.
+    """
+    if name == "pandas":
+        from recon.core.backends.pandas_backend import PandasBackend
+        return PandasBackend()
+    try:
+        if name == "polars":
+            from recon.core.backends.polars_backend import PolarsBackend
+            return PolarsBackend()
+        if name == "duckdb":
+            from recon.core.backends.duckdb_backend import DuckDBBackend
+            return DuckDBBackend(**options)
+    except ImportError as e:
+        raise BackendError(str(e)) from e
+    raise BackendError(f"Unknown engine: {name!r} (expected one of: {', '.join(ENGINES)})")
+
+
+__all__ = ['ENGINES', 'BackendError', 'ExecutionBackend', 'get_backend']
@@ -0,0 +1,88 @@
+"""
+Execution Backend Base - Interface for reconciliation operations
+Interfaz de las operaciones de reconciliación (filtrar, agrupar, cruzar)
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+
+class ExecutionBackend(ABC):
+    """
+    Motor que ejecuta las operaciones pesadas de una regla o check.
+
+    Las fuentes llegan y los resultados salen como DataFrames de pandas; cada
+    motor decide cómo ejecutar internamente el filtro, la agrupación por
+    entidad y el cruce. Los resultados son posiciones de fila de los frames
+    de entrada: los validadores proyectan de ahí solo los campos mapeados, de
+    modo que los valores (y sus tipos) son idénticos con cualquier motor.
+
+    Convenciones compartidas por todos los motores:
+
+    - Los filtros comparan como texto (valor o lista de valores); una columna
+      de filtro inexistente descarta todas las filas.
+    - Las claves se normalizan a texto sin espacios al inicio/fin; las filas
+      con alguna clave nula se ignoran.
+    - La fila representativa de una entidad es la primera (menor posición).
+    - El cruce es externo y se ordena por las claves como texto.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def filter_mask(self, frame: pd.DataFrame, filters: dict[str, Any]) -> np.ndarray:
+        """Máscara booleana (una entrada por fila) de las filas que cumplen los filtros"""
+
+    @abstractmethod
+    def entity_rows(self, frame: pd.DataFrame, key_columns: list[str],
+                    filters: dict[str, Any], prefix: str) -> pd.DataFrame:
+        """
+        Agrupa las filas filtradas por entidad.
+
+        Retorna las claves normalizadas, `{prefix}_row` (posición de la primera
+        fila) y `{prefix}n` (filas de la entidad), en orden de aparición.
+        """
+
+    @abstractmethod
+    def join_entities(self, source_rows: pd.DataFrame, pbi_rows: pd.DataFrame,
+                      key_columns: list[str]) -> pd.DataFrame:
+        """Cruce externo de las entidades de ambos lados, ordenado por clave"""
+
+    @abstractmethod
+    def distinct_keys(self, frame: pd.DataFrame, column: str) -> pd.Series:
+        """Claves distintas, no nulas y normalizadas a texto de una columna"""
+
+    def match_entities(self, source: pd.DataFrame, pbi: pd.DataFrame, key_columns: list[str],
+                       source_filters: dict[str, Any],
+                       pbi_filters: dict[str, Any]) -> pd.DataFrame:
+        """
+        Entidades de una regla: claves, `s_row`/`sn` y `p_row`/`pn`.
+
+        Las posiciones faltan (nulo) cuando la entidad no existe de ese lado.
+        Los motores pueden reemplazar este método para ejecutar filtro,
+        agrupación y cruce como un único plan.
+        """
+        return self.join_entities(
+            self.entity_rows(source, key_columns, source_filters, "s"),
+            self.entity_rows(pbi, key_columns, pbi_filters, "p"),
+            key_columns,
+        )
+
+
+def filter_values(value: Any) -> list[str]:
+    """Valores de un filtro de igualdad como lista de textos"""
+    if isinstance(value, (list, tuple, set)):
+        return [str(v) for v in value]
+    return [str(value)]
+
+
+def empty_entities(key_columns: list[str]) -> pd.DataFrame:
+    """Resultado de `match_entities` sin entidades"""
+    columns = {k: pd.Series(dtype=object) for k in key_columns}
+    for prefix in ("s", "p"):
+        columns[f"{prefix}_row"] = pd.Series(dtype="float64")
+        columns[f"{prefix}n"] = pd.Series(dtype="float64")
+    return pd.DataFrame(columns)
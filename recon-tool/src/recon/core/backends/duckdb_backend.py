@@ -0,0 +1,132 @@
+"""
+DuckDB Backend - In-process SQL execution backend
+Motor DuckDB: SQL en proceso, con derrame a disco cuando no alcanza la memoria
+"""
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from recon.core.backends.base import ExecutionBackend, filter_values
+
+try:
+    import duckdb
+except ImportError:  # pragma: no cover - dependencia opcional
+    duckdb = None
+
+
+def _quote(identifier: str) -> str:
+    """Identificador SQL entre comillas (los nombres de columna traen espacios y '$')"""
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _trimmed(column: str) -> str:
+    """Clave como texto sin espacios al inicio/fin (trim() solo quita espacios)"""
+    return rf"regexp_replace(CAST({_quote(column)} AS VARCHAR), '^\s+|\s+$', '', 'g')"
+
+
+class DuckDBBackend(ExecutionBackend):
+    """
+    Motor DuckDB.
+
+    Los frames se registran en una conexión en memoria sin copiarlos (DuckDB
+    los escanea directamente) y cada regla se resuelve con una sola consulta.
+    DuckDB paraleliza la consulta y, si el cruce supera `memory_limit`, derrama
+    a `temp_directory`, por lo que sirve para fuentes que no caben en RAM.
+    """
+
+    name = "duckdb"
+
+    def __init__(self, memory_limit: str | None = None,
+                 temp_directory: str | None = None):
+        if duckdb is None:
+            raise ImportError("engine 'duckdb' requires duckdb (pip install 'recon-tool[duckdb]')")
+        config = {}
+        if memory_limit:
+            config["memory_limit"] = memory_limit
+        if temp_directory:
+            config["temp_directory"] = temp_directory
+        self.connection = duckdb.connect(":memory:", config=config)
+
+    def _register(self, name: str, frame: pd.DataFrame, columns: list[str]) -> None:
+        columns = [c for c in dict.fromkeys(columns) if c in frame.columns]
+        view = frame[columns].assign(__row=np.arange(len(frame)))
+        self.connection.register(name, view)
+
+    @staticmethod
+    def _where(frame: pd.DataFrame, key_columns: list[str], filters: dict[str, Any],
+               params: list) -> str:
+        """Condiciones de filtro y de claves no nulas (agrega los valores a `params`)"""
+        conditions = [f"{_quote(k)} IS NOT NULL" for k in key_columns]
+        for column, value in filters.items():
+            if column not in frame.columns:
+                return "WHERE FALSE"
+            values = filter_values(value)
+            conditions.append(f"CAST({_quote(column)} AS VARCHAR) IN "
+                              f"({', '.join('?' for _ in values)})")
+            params.extend(values)
+        return "WHERE " + " AND ".join(conditions) if conditions else ""
+
+    def _rows_sql(self, table: str, frame: pd.DataFrame, key_columns: list[str],
+                  filters: dict[str, Any], prefix: str, params: list) -> str:
+        keys = ", ".join(f"{_trimmed(k)} AS {_quote(k)}" for k in key_columns)
+        group = ", ".join(str(i + 1) for i in range(len(key_columns)))
+        return (f"SELECT {keys}, min(__row) AS {prefix}_row, count(*) AS {prefix}n "
+                f"FROM {table} {self._where(frame, key_columns, filters, params)} "
+                f"GROUP BY {group}")
+
+    def filter_mask(self, frame: pd.DataFrame, filters: dict[str, Any]) -> np.ndarray:
+        if not filters:
+            return np.ones(len(frame), dtype=bool)
+        if any(c not in frame.columns for c in filters):
+            return np.zeros(len(frame), dtype=bool)
+        params: list = []
+        self._register("recon_filter", frame, list(filters))
+        rows = self.connection.execute(
+            f"SELECT __row FROM recon_filter {self._where(frame, [], filters, params)}", params
+        ).fetchnumpy()["__row"]
+        mask = np.zeros(len(frame), dtype=bool)
+        mask[np.asarray(rows, dtype=np.int64)] = True
+        return mask
+
+    def entity_rows(self, frame: pd.DataFrame, key_columns: list[str],
+                    filters: dict[str, Any], prefix: str) -> pd.DataFrame:
+        params: list = []
+        self._register("recon_side", frame, key_columns + list(filters))
+        sql = self._rows_sql("recon_side", frame, key_columns, filters, prefix, params)
+        return self.connection.execute(f"{sql} ORDER BY {prefix}_row", params).df()
+
+    def join_entities(self, source_rows: pd.DataFrame, pbi_rows: pd.DataFrame,
+                      key_columns: list[str]) -> pd.DataFrame:
+        self.connection.register("recon_s", source_rows)
+        self.connection.register("recon_p", pbi_rows)
+        return self._join("SELECT * FROM recon_s", "SELECT * FROM recon_p", key_columns, [])
+
+    def _join(self, source_sql: str, pbi_sql: str, key_columns: list[str],
+              params: list) -> pd.DataFrame:
+        keys = ", ".join(_quote(k) for k in key_columns)
+        sql = (f"SELECT {keys}, s_row, sn, p_row, pn "
+               f"FROM ({source_sql}) AS s FULL OUTER JOIN ({pbi_sql}) AS p USING ({keys}) "
+               f"ORDER BY {keys}")
+        return self.connection.execute(sql, params).df()
+
+    def match_entities(self, source: pd.DataFrame, pbi: pd.DataFrame, key_columns: list[str],
+                       source_filters: dict[str, Any],
+                       pbi_filters: dict[str, Any]) -> pd.DataFrame:
+        """Filtro, agrupación y cruce de ambos lados en una sola consulta"""
+        params: list = []
+        self._register("recon_source", source, key_columns + list(source_filters))
+        self._register("recon_pbi", pbi, key_columns + list(pbi_filters))
+        source_sql = self._rows_sql("recon_source", source, key_columns, source_filters,
+                                    "s", params)
+        pbi_sql = self._rows_sql("recon_pbi", pbi, key_columns, pbi_filters, "p", params)
+        return self._join(source_sql, pbi_sql, key_columns, params)
+
+    def distinct_keys(self, frame: pd.DataFrame, column: str) -> pd.Series:
+        self._register("recon_keys", frame, [column])
+        keys = self.connection.execute(
+            f"SELECT DISTINCT {_trimmed(column)} AS k FROM recon_keys "
+            f"WHERE {_quote(column)} IS NOT NULL"
+        ).fetchnumpy()["k"]
+        return pd.Series(list(keys), dtype=object)
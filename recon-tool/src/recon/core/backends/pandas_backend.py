@@ -0,0 +1,104 @@
+"""
+Pandas Backend - Reference execution backend
+Motor de referencia: operaciones vectorizadas de pandas en un solo proceso
+"""
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from recon.core.backends.base import ExecutionBackend, filter_values
+
+
+def _is_categorical(series: pd.Series) -> bool:
+    return isinstance(series.dtype, pd.CategoricalDtype)
+
+
+def _key_values(series: pd.Series) -> pd.Series:
+    """Normaliza una columna clave a texto sin espacios (en el diccionario si es categórica)"""
+    if _is_categorical(series):
+        stripped = series.cat.categories.astype(str).str.strip()
+        if stripped.is_unique:
+            return series.cat.rename_categories(stripped)
+    return series.astype(str).str.strip()
+
+
+def _align_keys(left: pd.DataFrame, right: pd.DataFrame,
+                key_columns: list[str]) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Lleva las claves categóricas de ambos lados a un mismo diccionario.
+
+    Con categorías idénticas el merge y el orden operan sobre los códigos
+    enteros; la unión se ordena para conservar el orden alfabético de las
+    entidades. Si solo un lado es categórico, ambos se comparan como texto.
+    """
+    for key in key_columns:
+        left_cat, right_cat = _is_categorical(left[key]), _is_categorical(right[key])
+        if left_cat and right_cat:
+            categories = sorted(set(left[key].cat.categories) | set(right[key].cat.categories))
+            dtype = pd.CategoricalDtype(categories)
+            left = left.astype({key: dtype})
+            right = right.astype({key: dtype})
+        elif left_cat or right_cat:
+            left = left.astype({key: str})
+            right = right.astype({key: str})
+    return left, right
+
+
+class PandasBackend(ExecutionBackend):
+    """
+    Motor por defecto: pandas sobre los frames cargados.
+
+    En columnas categóricas los filtros y el cruce operan sobre los códigos
+    enteros y el diccionario, sin convertir cada fila a texto.
+    """
+
+    name = "pandas"
+
+    def filter_mask(self, frame: pd.DataFrame, filters: dict[str, Any]) -> np.ndarray:
+        mask = np.ones(len(frame), dtype=bool)
+        for column, value in filters.items():
+            if column not in frame.columns:
+                return np.zeros(len(frame), dtype=bool)
+            values = filter_values(value)
+            series = frame[column]
+            if _is_categorical(series):
+                allowed = np.flatnonzero(series.cat.categories.astype(str).isin(values))
+                mask &= np.isin(series.cat.codes.to_numpy(), allowed)
+            else:
+                mask &= series.astype(str).isin(values).to_numpy(dtype=bool)
+        return mask
+
+    def entity_rows(self, frame: pd.DataFrame, key_columns: list[str],
+                    filters: dict[str, Any], prefix: str) -> pd.DataFrame:
+        positions = np.flatnonzero(self.filter_mask(frame, filters))
+        keys = frame[key_columns].iloc[positions].set_axis(positions).dropna()
+        side = pd.DataFrame({k: _key_values(keys[k]) for k in key_columns}, index=keys.index)
+        side[f"{prefix}_row"] = side.index
+        counts = side.groupby(key_columns, sort=False, observed=True).size().rename(f"{prefix}n")
+        side = side.drop_duplicates(subset=key_columns, keep="first")
+        return side.merge(counts.reset_index(), on=key_columns, how="left")
+
+    def join_entities(self, source_rows: pd.DataFrame, pbi_rows: pd.DataFrame,
+                      key_columns: list[str]) -> pd.DataFrame:
+        source_rows, pbi_rows = _align_keys(source_rows, pbi_rows, key_columns)
+        if source_rows.empty or pbi_rows.empty:
+            # pandas no factoriza claves de texto Arrow sin chunks (lado vacío, multi-clave)
+            source_rows = source_rows.astype(dict.fromkeys(key_columns, object))
+            pbi_rows = pbi_rows.astype(dict.fromkeys(key_columns, object))
+        merged = source_rows.merge(pbi_rows, on=key_columns, how="outer")
+        merged = merged.sort_values(key_columns, kind="stable").reset_index(drop=True)
+        return merged.astype(dict.fromkeys(key_columns, str))
+
+    def distinct_keys(self, frame: pd.DataFrame, column: str) -> pd.Series:
+        """
+        En una columna categórica las claves distintas son las categorías en
+        uso, sin recorrer las filas como texto.
+        """
+        keys = frame[column]
+        if _is_categorical(keys):
+            used = keys.cat.categories[np.unique(keys.cat.codes[keys.cat.codes >= 0])]
+            return pd.Series(pd.Index(used).astype(str).str.strip().unique())
+        keys = keys.dropna()
+        return pd.Series(keys.astype(str).str.strip().unique())
@@ -0,0 +1,116 @@
+"""
+Polars Backend - Multi-threaded lazy execution backend
+Motor Polars: filtro, agrupación y cruce como un único plan lazy multihilo
+"""
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from recon.core.backends.base import ExecutionBackend, filter_values
+
+try:
+    import polars as pl
+except ImportError:  # pragma: no cover - dependencia opcional
+    pl = None
+
+
+class PolarsBackend(ExecutionBackend):
+    """
+    Motor Polars.
+
+    Solo las columnas de clave y de filtro pasan de pandas a Polars; el plan
+    lazy (filtro → normalización de claves → group-by → join externo) se
+    optimiza y ejecuta en paralelo, y vuelven a pandas únicamente las claves
+    y las posiciones de fila de cada entidad.
+    """
+
+    name = "polars"
+
+    def __init__(self):
+        if pl is None:
+            raise ImportError("engine 'polars' requires polars (pip install 'recon-tool[polars]')")
+
+    @staticmethod
+    def _lazy(frame: pd.DataFrame, columns: list[str]) -> "pl.LazyFrame":
+        columns = list(dict.fromkeys(columns))
+        return pl.from_pandas(frame[columns]).lazy().with_row_index("__row")
+
+    @staticmethod
+    def _predicate(frame: pd.DataFrame, filters: dict[str, Any]):
+        """Expresión de filtro (None si no hay filtros; False si falta una columna)"""
+        predicate = None
+        for column, value in filters.items():
+            if column not in frame.columns:
+                return pl.lit(False)
+            expr = pl.col(column).cast(pl.String).is_in(filter_values(value))
+            predicate = expr if predicate is None else predicate & expr
+        return predicate
+
+    @staticmethod
+    def _normalized(column: str):
+        return pl.col(column).cast(pl.String).str.strip_chars().alias(column)
+
+    def _rows(self, frame: pd.DataFrame, key_columns: list[str],
+              filters: dict[str, Any], prefix: str) -> "pl.LazyFrame":
+        lazy = self._lazy(frame, key_columns + [c for c in filters if c in frame.columns])
+        predicate = self._predicate(frame, filters)
+        if predicate is not None:
+            lazy = lazy.filter(predicate)
+        return (
+            lazy.drop_nulls(key_columns)
+            .select([self._normalized(k) for k in key_columns] + [pl.col("__row")])
+            .group_by(key_columns, maintain_order=True)
+            .agg(pl.col("__row").min().alias(f"{prefix}_row"),
+                 pl.len().alias(f"{prefix}n"))
+        )
+
+    def filter_mask(self, frame: pd.DataFrame, filters: dict[str, Any]) -> np.ndarray:
+        if not filters:
+            return np.ones(len(frame), dtype=bool)
+        if any(c not in frame.columns for c in filters):
+            return np.zeros(len(frame), dtype=bool)
+        mask = (
+            self._lazy(frame, list(filters))
+            .select(self._predicate(frame, filters).fill_null(False).alias("mask"))
+            .collect()
+        )
+        return mask["mask"].to_numpy().astype(bool)
+
+    def entity_rows(self, frame: pd.DataFrame, key_columns: list[str],
+                    filters: dict[str, Any], prefix: str) -> pd.DataFrame:
+        return self._rows(frame, key_columns, filters, prefix).collect().to_pandas()
+
+    def join_entities(self, source_rows: pd.DataFrame, pbi_rows: pd.DataFrame,
+                      key_columns: list[str]) -> pd.DataFrame:
+        return self._join(pl.from_pandas(source_rows).lazy(), pl.from_pandas(pbi_rows).lazy(),
+                          key_columns)
+
+    @staticmethod
+    def _join(source: "pl.LazyFrame", pbi: "pl.LazyFrame",
+              key_columns: list[str]) -> pd.DataFrame:
+        joined = (
+            source.join(pbi, on=key_columns, how="full", coalesce=True)
+            .sort(key_columns)
+            .collect()
+        )
+        return joined.to_pandas()
+
+    def match_entities(self, source: pd.DataFrame, pbi: pd.DataFrame, key_columns: list[str],
+                       source_filters: dict[str, Any],
+                       pbi_filters: dict[str, Any]) -> pd.DataFrame:
+        """Ambos lados y el cruce se ejecutan como un solo plan lazy"""
+        return self._join(self._rows(source, key_columns, source_filters, "s"),
+                          self._rows(pbi, key_columns, pbi_filters, "p"),
+                          key_columns)
+
+    def distinct_keys(self, frame: pd.DataFrame, column: str) -> pd.Series:
+        keys = (
+            self._lazy(frame, [column])
+            .drop_nulls(column)
+            .select(self._normalized(column))
+            .unique(maintain_order=True)
+            .collect()
+        )
+        return pd.Series(keys[column].to_list(), dtype=object)
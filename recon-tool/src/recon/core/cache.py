@@ -0,0 +1,347 @@
+"""
+Cache Module - Persistent columnar cache of parsed sources
+Caché en disco (Arrow IPC) de fuentes ya parseadas, por huella de archivo
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+from recon.core.table import batch_to_frame
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+except ImportError:  # pragma: no cover - dependencia opcional
+    pa = None
+    pa_ipc = None
+
+
+DEFAULT_CACHE_DIR = ".recon_cache"
+
+# Subdirectorio con los miembros extraídos de cada PBIX (`pbix/<hash>/`)
+MEMBER_CACHE_DIR = "pbix"
+# Metadatos de cada PBIX extraído; su mtime marca el último uso
+MEMBER_META_FILE = ".archive.json"
+
+# Resultados de detección guardados junto a las entradas: formatos CSV, encabezados
+# de fuentes y catálogos de reportes PBI (`cache clear` también los elimina)
+DIALECT_CACHE_FILE = "dialects.json"
+SCHEMA_CACHE_FILE = "schemas.json"
+CATALOG_CACHE_DIR = "catalog"
+
+# Cambiar si cambia el formato de las entradas para invalidar cachés antiguas
+CACHE_FORMAT_VERSION = 1
+
+# Bloques muestreados para el hash de contenido (inicio, medio y final)
+_HASH_BLOCK_BYTES = 1024 * 1024
+
+
+class CacheError(Exception):
+    """Error en la caché de fuentes"""
+    pass
+
+
+def content_hash(path: str | Path, size: int | None = None) -> str:
+    """
+    Hash de contenido muestreado: primer, central y último bloque de 1 MiB.
+
+    Junto con tamaño y mtime detecta reescrituras del archivo sin pagar una
+    lectura completa de varios GB en cada ejecución. Con `size` menor al del
+    archivo se obtiene el hash de ese prefijo.
+    """
+    path = Path(path)
+    size = path.stat().st_size if size is None else size
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        offsets = sorted({0, max(0, size // 2 - _HASH_BLOCK_BYTES // 2),
+                          max(0, size - _HASH_BLOCK_BYTES)})
+        for offset in offsets:
+            f.seek(offset)
+            # Solo bytes dentro de `size` (hash de un prefijo de un archivo que creció)
+            digest.update(f.read(min(_HASH_BLOCK_BYTES, size - offset)))
+    return digest.hexdigest()
+
+
+def file_fingerprint(path: str | Path) -> dict:
+    """Huella de un archivo: ruta, tamaño, mtime y hash de contenido"""
+    path = Path(path).resolve()
+    stat = path.stat()
+    return {
+        "path": str(path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "content_hash": content_hash(path, stat.st_size),
+    }
+
+
+@dataclass
+class CacheEntry:
+    """Entrada de la caché (archivo Arrow + metadatos)"""
+    key: str
+    source_name: str
+    source_path: str
+    rows: int
+    columns: list[str]
+    columns_total: int
+    size_bytes: int
+    created_at: str
+    last_used: float  # epoch; se actualiza en cada lectura (LRU)
+    kind: str = "source"  # 'source' (Arrow) o 'pbix' (miembros extraídos de un PBIX)
+
+    @property
+    def last_used_at(self) -> datetime:
+        return datetime.fromtimestamp(self.last_used)
+
+
+class CacheWriter:
+    """Escribe chunks en un archivo Arrow IPC temporal y lo publica al cerrar"""
+
+    def __init__(self, cache: "SourceCache", key: str, meta: dict):
+        self.cache = cache
+        self.key = key
+        self.meta = meta
+        self.rows = 0
+        self._tmp_path = cache.data_path(key).with_suffix(f".tmp{os.getpid()}")
+        self._sink = None
+        self._writer = None
+        self._schema = None
+
+    def write(self, chunk: pd.DataFrame) -> None:
+        if self._writer is None:
+            schema = pa.Schema.from_pandas(chunk, preserve_index=False)
+            # Columnas vacías en el primer chunk: se guardan como texto
+            self._schema = pa.schema([
+                f.with_type(pa.string()) if pa.types.is_null(f.type) else f
+                for f in schema
+            ]).remove_metadata()
+            self._sink = pa.OSFile(str(self._tmp_path), "wb")
+            self._writer = pa_ipc.new_file(self._sink, self._schema)
+
+        table = pa.Table.from_pandas(chunk, schema=self._schema, preserve_index=False)
+        for batch in table.to_batches():
+            self._writer.write_batch(batch)
+        self.rows += len(chunk)
+
+    def commit(self) -> None:
+        """Publica la entrada de forma atómica"""
+        if self._writer is None:
+            self.abort()
+            return
+        self._writer.close()
+        self._sink.close()
+        os.replace(self._tmp_path, self.cache.data_path(self.key))
+
+        meta = dict(self.meta, rows=self.rows, created_at=datetime.now().isoformat())
+        self.cache.meta_path(self.key).write_text(json.dumps(meta, indent=2), encoding="utf-8")
+
+    def abort(self) -> None:
+        """Descarta una escritura incompleta"""
+        if self._writer is not None:
+            self._writer.close()
+            self._sink.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+
+class SourceCache:
+    """
+    Caché columnar de fuentes parseadas.
+
+    Cada entrada es un archivo Arrow IPC bajo `cache_dir`, identificado por la
+    huella del archivo fuente (ruta, tamaño, mtime y hash de contenido) y por
+    las opciones de lectura. Las lecturas en caliente mapean el archivo en
+    memoria y generan chunks sin volver a parsear el texto.
+    """
+
+    def __init__(self, cache_dir: str | Path = DEFAULT_CACHE_DIR):
+        if pa is None:
+            raise CacheError("Source cache requires pyarrow (pip install 'recon-tool[arrow]')")
+        self.cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def available() -> bool:
+        return pa is not None
+
+    def data_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.arrow"
+
+    def meta_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def make_key(self, fingerprint: dict, options: dict) -> str:
+        """Clave de la entrada a partir de la huella y las opciones de lectura"""
+        payload = json.dumps(
+            {"version": CACHE_FORMAT_VERSION, "file": fingerprint, "options": options},
+            sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+    def get(self, key: str) -> dict | None:
+        """Metadatos de la entrada si existe (y la marca como usada)"""
+        data_path = self.data_path(key)
+        meta_path = self.meta_path(key)
+        if not data_path.exists() or not meta_path.exists():
+            return None
+        self.touch(key)
+        return json.loads(meta_path.read_text(encoding="utf-8"))
+
+    def iter_chunks(self, key: str, chunk_rows: int,
+                    dtype_backend: str = "numpy") -> Iterator[pd.DataFrame]:
+        """
+        Lee una entrada mapeada en memoria, en chunks de `chunk_rows` filas.
+
+        Con `dtype_backend='pyarrow'` los chunks envuelven los buffers del
+        mapeo sin copiarlos (el mapeo sigue vivo mientras existan los frames).
+        """
+        with pa.memory_map(str(self.data_path(key)), "r") as source:
+            reader = pa_ipc.open_file(source)
+            if reader.num_record_batches == 0:
+                yield batch_to_frame(reader.schema.empty_table(), dtype_backend)
+            for i in range(reader.num_record_batches):
+                batch = reader.get_batch(i)
+                for offset in range(0, max(batch.num_rows, 1), chunk_rows):
+                    yield batch_to_frame(batch.slice(offset, chunk_rows), dtype_backend)
+
+    def find_appendable(self, append_key: str) -> tuple[str, dict] | None:
+        """
+        Entrada más reciente de una fuente que admite ingesta incremental.
+
+        `append_key` identifica la fuente sin su huella de contenido (ruta y
+        opciones de lectura), de modo que sobrevive a que el archivo crezca.
+        """
+        found = None
+        for entry in self.entries():
+            meta = json.loads(self.meta_path(entry.key).read_text(encoding="utf-8"))
+            if meta.get("append_key") == append_key and "append" in meta:
+                found = (entry.key, meta)
+                break
+        return found
+
+    def remove_superseded(self, append_key: str, keep: str) -> None:
+        """Elimina versiones anteriores de una fuente al publicar una nueva"""
+        for entry in self.entries():
+            if entry.key == keep:
+                continue
+            meta = json.loads(self.meta_path(entry.key).read_text(encoding="utf-8"))
+            if meta.get("append_key") == append_key:
+                self.remove(entry.key)
+
+    def writer(self, key: str, meta: dict) -> CacheWriter:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        return CacheWriter(self, key, meta)
+
+    def entries(self) -> list[CacheEntry]:
+        """Entradas de la caché, de la más a la menos recientemente usada"""
+        if not self.cache_dir.exists():
+            return []
+
+        entries = []
+        for meta_path in self.cache_dir.glob("*.json"):
+            data_path = meta_path.with_suffix(".arrow")
+            if not data_path.exists():
+                continue
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            stat = data_path.stat()
+            entries.append(CacheEntry(
+                key=meta_path.stem,
+                source_name=meta.get("source_name", ""),
+                source_path=meta.get("source_path", ""),
+                rows=meta.get("rows", 0),
+                columns=meta.get("columns", []),
+                columns_total=meta.get("columns_total", 0),
+                size_bytes=stat.st_size,
+                created_at=meta.get("created_at", ""),
+                last_used=stat.st_mtime,
+            ))
+        return sorted(entries, key=lambda e: e.last_used, reverse=True)
+
+    def member_entries(self) -> list[CacheEntry]:
+        """Miembros extraídos de cada PBIX, una entrada por archivo, más recientes primero"""
+        root = self.cache_dir / MEMBER_CACHE_DIR
+        if not root.is_dir():
+            return []
+
+        entries = []
+        for directory in root.iterdir():
+            if not directory.is_dir():
+                continue
+            meta_path = directory / MEMBER_META_FILE
+            meta = json.loads(meta_path.read_text(encoding="utf-8")) \
+                if meta_path.exists() else {}
+            files = [p for p in directory.rglob("*") if p.is_file()]
+            members = sorted(p.relative_to(directory).as_posix() for p in files
+                             if p != meta_path)
+            source_path = meta.get("source_path", "")
+            entries.append(CacheEntry(
+                key=directory.name,
+                source_name=Path(source_path).name if source_path else directory.name[:12],
+                source_path=source_path,
+                rows=0,
+                columns=members,
+                columns_total=len(members),
+                size_bytes=sum(p.stat().st_size for p in files),
+                created_at=meta.get("created_at", ""),
+                last_used=(meta_path if meta_path.exists() else directory).stat().st_mtime,
+                kind="pbix",
+            ))
+        return sorted(entries, key=lambda e: e.last_used, reverse=True)
+
+    def all_entries(self) -> list[CacheEntry]:
+        """Fuentes y PBIX extraídos, de la más a la menos recientemente usada"""
+        return sorted(self.entries() + self.member_entries(),
+                      key=lambda e: e.last_used, reverse=True)
+
+    def remove(self, key: str) -> None:
+        self.data_path(key).unlink(missing_ok=True)
+        self.meta_path(key).unlink(missing_ok=True)
+
+    def remove_entry(self, entry: CacheEntry) -> None:
+        if entry.kind == "pbix":
+            shutil.rmtree(self.cache_dir / MEMBER_CACHE_DIR / entry.key, ignore_errors=True)
+        else:
+            self.remove(entry.key)
+
+    def clear(self) -> int:
+        """
+        Elimina todas las entradas (fuentes y PBIX extraídos) y los resultados
+        de detección guardados (formatos, encabezados y catálogos); retorna
+        cuántas entradas se eliminaron.
+        """
+        entries = self.all_entries()
+        for entry in entries:
+            self.remove_entry(entry)
+        for tmp in self.cache_dir.glob("*.tmp*") if self.cache_dir.exists() else []:
+            tmp.unlink(missing_ok=True)
+        shutil.rmtree(self.cache_dir / MEMBER_CACHE_DIR, ignore_errors=True)
+        shutil.rmtree(self.cache_dir / CATALOG_CACHE_DIR, ignore_errors=True)
+        for name in (DIALECT_CACHE_FILE, SCHEMA_CACHE_FILE):
+            (self.cache_dir / name).unlink(missing_ok=True)
+        return len(entries)
+
+    def prune(self, max_size: int) -> list[CacheEntry]:
+        """
+        Elimina entradas menos recientemente usadas (fuentes y PBIX extraídos)
+        hasta quedar bajo `max_size` bytes.
+        """
+        entries = self.all_entries()
+        total = sum(e.size_bytes for e in entries)
+        removed = []
+        while entries and total > max_size:
+            entry = entries.pop()
+            self.remove_entry(entry)
+            total -= entry.size_bytes
+            removed.append(entry)
+        return removed
+
+    def touch(self, key: str, when: float | None = None) -> None:
+        """Marca una entrada como usada en `when` (por defecto, ahora)"""
+        when = time.time() if when is None else when
+        os.utime(self.data_path(key), (when, when))
@@ -10,16 +10,53 @@ from typing import Any, Optional
 
 import yaml
 
+# Tipos admitidos en el bloque `schema:` de una fuente
+SCHEMA_TYPES = ("int", "decimal", "money", "date", "category", "string")
+
+
+@dataclass
+class ColumnType:
+    """Tipo declarado de una columna; se aplica al ingerir la fuente"""
+    type: str  # int, decimal, money, date, category, string
+    format: str | None = None  # Formato strftime para 'date' (ej: '%d/%m/%Y')
+
+
+@dataclass
+class DatasetOptions:
+    """Consulta de una tabla de un dataset de Power BI (fuentes `type: powerbi`)"""
+    token_env: str = "POWERBI_TOKEN"  # Variable de entorno con el token de acceso
+    batch_size: int = 500  # Valores de filtro (ej: sitios) por consulta DAX
+    page_rows: int = 50_000  # Filas por página de resultados
+    connections: int = 4  # Conexiones keep-alive / lotes consultados en paralelo
+    timeout: float = 120.0  # Segundos por request
+    page_column: str | None = None  # Clave de paginación (None = primera key_column)
+
 
 @dataclass
 class SourceConfig:
     """Configuración de una fuente de datos"""
     name: str
     path: str
-    type: str  # csv, excel, parquet
-    encoding: str = "utf-8"
-    delimiter: str = ","
+    type: str  # csv, excel, parquet, powerbi (path = URL del dataset)
+    encoding: str = "utf-8"  # 'auto' = detectar desde una muestra del archivo
+    delimiter: str = ","  # 'auto' = detectar desde una muestra del archivo
+    quotechar: str = '"'  # 'auto' = detectar desde una muestra del archivo
     key_columns: list[str] = field(default_factory=list)
+    # Filtros lógicos del CLI → columna física (ej: site_id → Site_Location_Key)
+    filter_columns: dict[str, str] = field(default_factory=dict)
+    compression: str = "infer"  # infer (por extensión), none, gzip, bz2, zstd, zip
+    member: str | None = None  # Archivo a leer dentro de un .zip
+    sheet: str | None = None  # Hoja de Excel (None = primera hoja)
+    header_row: int = 1  # Fila de encabezados en Excel (1 = primera fila)
+    # Columna → tipo; las columnas no declaradas se mantienen como texto
+    schema: dict[str, ColumnType] = field(default_factory=dict)
+    pbi_table: str | None = None  # Tabla del modelo PBI (None = nombre del archivo)
+    dataset: DatasetOptions = field(default_factory=DatasetOptions)
+
+    @property
+    def model_table(self) -> str:
+        """Tabla del modelo PBI que representa la fuente (factQuotes.csv → factQuotes)"""
+        return self.pbi_table or Path(self.path).name.split(".", 1)[0]
     
     def resolve_path(self, base_path: Path) -> Path:
         """Resuelve la ruta relativa a la base del proyecto"""
@@ -43,6 +80,7 @@ class ValidationRule:
     """Regla de validación para un tipo de servicio/entidad"""
     service_type: str
     source_name: str  # Qué source usar como referencia
+    pbi_source: str = ""  # Tabla del modelo PBI contra la que se compara
     field_mappings: list[FieldMapping] = field(default_factory=list)
     
     # Filtros para aplicar al extraer datos
@@ -86,6 +124,27 @@ class ProjectConfig:
     default_encoding: str = "utf-8"
     numeric_tolerance: float = 0.01
     
+    # Ingesta por chunks
+    chunk_rows: int = 50_000
+    max_memory: str | None = None  # ej: '512MB' por chunk en memoria
+    column_projection: bool = True  # Leer solo las columnas que usan reglas y checks
+    jobs: int = 1  # Fuentes cargadas en paralelo
+    executor: str = "thread"  # thread o process
+    dictionary_encoding: bool = True  # Columnas de baja cardinalidad como category
+    dictionary_max_ratio: float = 0.5  # Máximo de valores distintos / filas para codificar
+    csv_scanner: str = "auto"  # auto, pandas o mmap (escáner de columnas sobre mmap)
+    dtype_backend: str = "numpy"  # numpy o pyarrow (columnas ArrowDtype, sin copias desde la caché)
+    engine: str = "pandas"  # Motor de reglas y checks: pandas, polars o duckdb
+    referenced_fields_only: bool = False  # Solo campos PBI usados por visuales del reporte
+    model_checks: bool = False  # Agregar checks de integridad desde relaciones del modelo
+    unpivot_rules: bool = True  # Reglas por servicio de una fuente ancha en un solo cruce
+    out_of_core: bool = False  # Comparar por buckets en disco sin materializar fuentes
+    spill_dir: str | None = None  # Directorio de los buckets (temporal del sistema si None)
+
+    # Caché columnar de fuentes parseadas
+    cache_enabled: bool = True
+    cache_dir: str = ".recon_cache"
+
     @property
     def base_path(self) -> Path:
         return Path(self.sources_base_path)
@@ -126,8 +185,21 @@ class ConfigLoader:
                 type=src_config.get('type', 'csv'),
                 encoding=src_config.get('encoding', 'utf-8'),
                 delimiter=src_config.get('delimiter', ','),
-                key_columns=src_config.get('key_columns', [])
+                quotechar=src_config.get('quotechar', '"'),
+                key_columns=src_config.get('key_columns', []),
+                filter_columns=src_config.get('filter_columns') or {},
+                compression=src_config.get('compression', 'infer'),
+                member=src_config.get('member'),
+                sheet=src_config.get('sheet'),
+                header_row=src_config.get('header_row', 1),
+                schema=self._parse_schema(name, src_config.get('schema') or {}),
+                pbi_table=src_config.get('pbi_table'),
+                dataset=self._parse_dataset(name, src_config.get('dataset') or {})
             )
+            if sources[name].type == 'powerbi' and not sources[name].pbi_table:
+                raise ConfigurationError(
+                    f"Source '{name}': type 'powerbi' requires pbi_table (the dataset table)"
+                )
         
         # Cargar reglas de validación
         validation_rules = {}
@@ -145,9 +217,10 @@ class ConfigLoader:
             validation_rules[service_type] = ValidationRule(
                 service_type=service_type,
                 source_name=rule_config.get('source_name', ''),
+                pbi_source=rule_config.get('pbi_source', ''),
                 field_mappings=mappings,
-                source_filters=rule_config.get('source_filters', {}),
-                pbi_filters=rule_config.get('pbi_filters', {})
+                source_filters=rule_config.get('source_filters') or {},
+                pbi_filters=rule_config.get('pbi_filters') or {}
             )
         
         # Cargar verificaciones de integridad
@@ -173,9 +246,58 @@ class ConfigLoader:
             validation_rules=validation_rules,
             integrity_checks=integrity_checks,
             default_encoding=raw.get('settings', {}).get('default_encoding', 'utf-8'),
-            numeric_tolerance=raw.get('settings', {}).get('numeric_tolerance', 0.01)
+            numeric_tolerance=raw.get('settings', {}).get('numeric_tolerance', 0.01),
+            chunk_rows=raw.get('settings', {}).get('chunk_rows', 50_000),
+            max_memory=raw.get('settings', {}).get('max_memory'),
+            column_projection=raw.get('settings', {}).get('column_projection', True),
+            jobs=raw.get('settings', {}).get('jobs', 1),
+            executor=raw.get('settings', {}).get('executor', 'thread'),
+            dictionary_encoding=raw.get('settings', {}).get('dictionary_encoding', True),
+            dictionary_max_ratio=raw.get('settings', {}).get('dictionary_max_ratio', 0.5),
+            csv_scanner=raw.get('settings', {}).get('csv_scanner', 'auto'),
+            dtype_backend=raw.get('settings', {}).get('dtype_backend', 'numpy'),
+            engine=raw.get('settings', {}).get('engine', 'pandas'),
+            referenced_fields_only=raw.get('settings', {}).get('referenced_fields_only', False),
+            model_checks=raw.get('settings', {}).get('model_checks', False),
+            unpivot_rules=raw.get('settings', {}).get('unpivot_rules', True),
+            out_of_core=raw.get('settings', {}).get('out_of_core', False),
+            spill_dir=raw.get('settings', {}).get('spill_dir'),
+            cache_enabled=raw.get('settings', {}).get('cache', True),
+            cache_dir=raw.get('settings', {}).get('cache_dir', '.recon_cache')
         )
     
+    @staticmethod
+    def _parse_schema(source_name: str, raw: dict) -> dict[str, ColumnType]:
+        """
+        Parsea el `schema:` de una fuente. Cada columna acepta el tipo como
+        texto (`money`) o un mapeo con formato (`{type: date, format: '%d/%m/%Y'}`).
+        """
+        schema = {}
+        for column, spec in raw.items():
+            if isinstance(spec, dict):
+                column_type = ColumnType(type=spec.get('type', ''), format=spec.get('format'))
+            else:
+                column_type = ColumnType(type=str(spec))
+            if column_type.type not in SCHEMA_TYPES:
+                raise ConfigurationError(
+                    f"Source '{source_name}': invalid type '{column_type.type}' for column "
+                    f"'{column}' (expected one of: {', '.join(SCHEMA_TYPES)})"
+                )
+            schema[column] = column_type
+        return schema
+
+    @staticmethod
+    def _parse_dataset(source_name: str, raw: dict) -> DatasetOptions:
+        """Parsea el bloque `dataset:` de una fuente powerbi"""
+        known = DatasetOptions.__dataclass_fields__
+        unknown = sorted(set(raw) - set(known))
+        if unknown:
+            raise ConfigurationError(
+                f"Source '{source_name}': unknown dataset option(s) {', '.join(unknown)} "
+                f"(expected: {', '.join(known)})"
+            )
+        return DatasetOptions(**raw)
+
     @staticmethod
     def get_available_projects(configs_dir: str | Path) -> list[str]:
         """Lista los proyectos disponibles en el directorio de configs"""
@@ -0,0 +1,56 @@
+"""
+Dialect Module - Resolves 'auto' encoding/delimiter/quotechar of CSV sources
+Resolución de encoding, separador y comillas 'auto' con caché por huella
+"""
+
+from dataclasses import replace
+from pathlib import Path
+
+from recon.core.cache import DIALECT_CACHE_FILE
+from recon.core.config import SourceConfig
+from recon.core.schema import SchemaCache
+
+AUTO = "auto"
+
+
+class DialectCache(SchemaCache):
+    """Formatos detectados por archivo, en `dialects.json` del directorio de caché"""
+
+    file_name = DIALECT_CACHE_FILE
+
+
+def needs_sniffing(source: SourceConfig) -> bool:
+    return source.type == "csv" and AUTO in (source.encoding, source.delimiter,
+                                             source.quotechar)
+
+
+def resolve_dialect(source: SourceConfig, path: Path,
+                    cache: DialectCache | None = None) -> SourceConfig:
+    """
+    Copia de la fuente con los valores 'auto' reemplazados por los detectados.
+
+    La detección lee una muestra del inicio del archivo (descomprimida si hace
+    falta) y se cachea por ruta, tamaño y mtime, de modo que el lector por
+    chunks recibe el formato correcto desde el primer intento.
+    """
+    if not needs_sniffing(source):
+        return source
+
+    from recon.adapters.compressed import resolve_compression
+    from recon.adapters.csv_sniffer import sniff_csv
+
+    key = cache.make_key(source, path) if cache else None
+    dialect = cache.get(key) if cache else None
+    if dialect is None:
+        dialect = sniff_csv(path, resolve_compression(path, source.compression),
+                            source.member).to_dict()
+        if cache:
+            cache.put(key, dialect)
+            cache.save()
+
+    return replace(
+        source,
+        encoding=dialect["encoding"] if source.encoding == AUTO else source.encoding,
+        delimiter=dialect["delimiter"] if source.delimiter == AUTO else source.delimiter,
+        quotechar=dialect["quotechar"] if source.quotechar == AUTO else source.quotechar,
+    )
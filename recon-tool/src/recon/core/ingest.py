@@ -2,3 +2,747 @@
 Ingest Module - Data loading and ingestion
 Módulo para carga e ingestión de datos desde diversas fuentes
 """
+
+import re
+import time
+import zipfile
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pandas as pd
+
+from recon.adapters.powerbi_dataset import DatasetError
+from recon.core.cache import SourceCache, content_hash, file_fingerprint
+from recon.core.config import ProjectConfig, SourceConfig
+from recon.core.dialect import DialectCache, needs_sniffing, resolve_dialect
+from recon.core.normalize import coerce_frame
+from recon.core.partitions import is_multi_file, list_source_files, prune_files
+from recon.core.planner import SourcePlan
+from recon.core.table import check_backend, to_backend
+
+DEFAULT_CHUNK_ROWS = 50_000
+
+# `csv_scanner: auto` usa el escáner mmap si se lee como mucho 1 de cada N columnas
+MMAP_AUTO_COLUMN_RATIO = 4
+
+# Filas del primer chunk usadas para estimar la cardinalidad de cada columna
+DICTIONARY_SAMPLE_ROWS = 10_000
+
+_MEMORY_UNITS = {
+    "": 1,
+    "B": 1,
+    "KB": 1024,
+    "MB": 1024 ** 2,
+    "GB": 1024 ** 3,
+}
+
+
+class IngestError(Exception):
+    """Error al cargar una fuente de datos"""
+    pass
+
+
+def parse_memory_size(value: str | int | None) -> int | None:
+    """
+    Convierte un tamaño de memoria ('512MB', '2GB', 1048576) a bytes.
+
+    Retorna None si no se indicó tamaño.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, int):
+        return value
+
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMG]?B?)\s*", str(value).upper())
+    if not match:
+        raise IngestError(f"Invalid memory size: {value!r}")
+
+    number, unit = match.groups()
+    if unit and not unit.endswith("B"):
+        unit += "B"
+    return int(float(number) * _MEMORY_UNITS[unit])
+
+
+@dataclass
+class IngestOptions:
+    """Opciones de ingesta compartidas por todas las fuentes"""
+    chunk_rows: int = DEFAULT_CHUNK_ROWS
+    max_memory: int | None = None  # Bytes máximos por chunk en memoria
+    jobs: int = 1  # Fuentes cargadas en paralelo
+    executor: str = "thread"  # thread (I/O) o process (parseo CSV intensivo en CPU)
+    dictionary_encoding: bool = True  # Codificar columnas de baja cardinalidad
+    dictionary_max_ratio: float = 0.5  # Máximo de valores distintos / filas
+    dtype_backend: str = "numpy"  # numpy o pyarrow (ver recon.core.table)
+
+    @classmethod
+    def from_config(cls, config: ProjectConfig,
+                    chunk_rows: int | None = None,
+                    max_memory: str | int | None = None,
+                    jobs: int | None = None,
+                    executor: str | None = None,
+                    dictionary_encoding: bool | None = None,
+                    dtype_backend: str | None = None) -> "IngestOptions":
+        """Construye las opciones desde `settings`, con overrides del CLI"""
+        executor = executor or config.executor
+        if executor not in ("thread", "process"):
+            raise IngestError(f"Invalid executor: {executor!r} (expected 'thread' or 'process')")
+        dtype_backend = dtype_backend or config.dtype_backend
+        try:
+            check_backend(dtype_backend)
+        except (ValueError, ImportError) as e:
+            raise IngestError(str(e)) from e
+        return cls(
+            chunk_rows=chunk_rows or config.chunk_rows or DEFAULT_CHUNK_ROWS,
+            max_memory=parse_memory_size(max_memory or config.max_memory),
+            jobs=max(1, jobs or config.jobs or 1),
+            executor=executor,
+            dictionary_encoding=config.dictionary_encoding if dictionary_encoding is None
+            else dictionary_encoding,
+            dictionary_max_ratio=config.dictionary_max_ratio,
+            dtype_backend=dtype_backend
+        )
+
+
+@dataclass
+class IngestStats:
+    """Métricas de ingesta de una fuente"""
+    source_name: str
+    rows: int = 0
+    chunks: int = 0
+    seconds: float = 0.0
+    # Máximo de bytes de frames retenidos a la vez (estimado de pandas, no el RSS)
+    peak_frame_bytes: int = 0
+    metadata: dict = field(default_factory=dict)
+
+    @property
+    def rows_per_second(self) -> float:
+        if self.seconds <= 0:
+            return 0.0
+        return self.rows / self.seconds
+
+    def to_dict(self) -> dict:
+        return {
+            "rows": self.rows,
+            "chunks": self.chunks,
+            "seconds": round(self.seconds, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+            "peak_frame_bytes": self.peak_frame_bytes,
+            **self.metadata
+        }
+
+
+@dataclass
+class LoadResult:
+    """Resultado de cargar varias fuentes"""
+    frames: dict[str, pd.DataFrame] = field(default_factory=dict)
+    errors: dict[str, IngestError] = field(default_factory=dict)
+    seconds: float = 0.0  # Tiempo total (reloj) de la fase de carga
+
+
+def frame_bytes(frame: pd.DataFrame) -> int:
+    return int(frame.memory_usage(deep=True).sum())
+
+
+def dictionary_candidates(frame: pd.DataFrame, max_ratio: float,
+                          sample_rows: int = DICTIONARY_SAMPLE_ROWS) -> list[str]:
+    """
+    Columnas de texto con pocos valores distintos respecto de las filas.
+
+    La cardinalidad se estima sobre una muestra (las primeras `sample_rows`
+    filas); una columna se codifica si `distintos <= max_ratio * filas`.
+    """
+    sample = frame.head(sample_rows)
+    if sample.empty:
+        return []
+    candidates = []
+    for column in sample.columns:
+        series = sample[column]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            candidates.append(column)
+        elif pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+            if series.nunique(dropna=True) <= max_ratio * len(sample):
+                candidates.append(column)
+    return candidates
+
+
+def encode_dictionary(frame: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+    """Convierte las columnas indicadas a `category` (códigos enteros + diccionario)"""
+    columns = [c for c in columns
+               if c in frame.columns and not isinstance(frame[c].dtype, pd.CategoricalDtype)]
+    if not columns:
+        return frame
+    return frame.astype(dict.fromkeys(columns, "category"))
+
+
+def concat_chunks(chunks: list[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatena chunks conservando las columnas categóricas.
+
+    Cada chunk trae su propio diccionario; antes del concat se unifican a la
+    unión ordenada de categorías (si difieren, pandas volvería a `object`).
+    """
+    if len(chunks) == 1:
+        return chunks[0]
+    first = chunks[0]
+    for column in first.columns:
+        if not isinstance(first[column].dtype, pd.CategoricalDtype):
+            continue
+        if not all(isinstance(c[column].dtype, pd.CategoricalDtype) for c in chunks):
+            continue
+        categories = sorted(set().union(*(c[column].cat.categories for c in chunks)))
+        dtype = pd.CategoricalDtype(categories)
+        chunks = [c.astype({column: dtype}) for c in chunks]
+    return pd.concat(chunks, ignore_index=True)
+
+
+def _load_in_worker(engine: "IngestEngine",
+                    source_name: str) -> tuple[pd.DataFrame, "IngestStats"]:
+    """Carga una fuente en un proceso del pool y retorna el frame y sus métricas"""
+    frame = engine.load(source_name)
+    return frame, engine.stats[source_name]
+
+
+class IngestEngine:
+    """
+    Motor de ingesta por chunks.
+
+    Cada fuente se lee como un generador de DataFrames de tamaño acotado, de
+    modo que la memoria pico depende de `chunk_rows`/`max_memory` y no del
+    tamaño del archivo. Las métricas de cada lectura quedan en `stats`.
+
+    Si se entrega un plan (ver `recon.core.planner`), cada fuente se lee
+    proyectada a las columnas que el plan declara. Si se entrega una caché,
+    las fuentes sin cambios se leen desde su copia columnar en disco.
+
+    Las columnas de texto de baja cardinalidad (Vendor, Service_Type, ...) se
+    entregan como `category`: códigos enteros más un diccionario de valores.
+
+    Los CSV con `encoding`, `delimiter` o `quotechar` en 'auto' se leen con el
+    formato detectado sobre una muestra (cacheado en `dialect_cache`).
+
+    Las columnas declaradas en el `schema:` de la fuente se convierten a su
+    tipo (Int64, float64, datetime64, category) una sola vez por chunk, luego
+    de los filtros de lectura, que siguen comparando el texto original.
+    """
+
+    def __init__(self, config: ProjectConfig, options: IngestOptions | None = None,
+                 plan: dict[str, SourcePlan] | None = None,
+                 cache: SourceCache | None = None,
+                 dialect_cache: DialectCache | None = None):
+        self.config = config
+        self.options = options or IngestOptions.from_config(config)
+        self.plan = plan or {}
+        self.cache = cache
+        self.dialect_cache = dialect_cache
+        self.stats: dict[str, IngestStats] = {}
+
+    def get_source(self, source_name: str) -> SourceConfig:
+        if source_name not in self.config.sources:
+            raise IngestError(f"Unknown source: {source_name}")
+        return self.config.sources[source_name]
+
+    def iter_chunks(self, source_name: str) -> Iterator[pd.DataFrame]:
+        """Genera los chunks de una fuente registrando sus métricas"""
+        source = self.get_source(source_name)
+        stats = IngestStats(source_name=source_name)
+        self.stats[source_name] = stats
+
+        # Solo se mide el tiempo de lectura, no el del consumidor de los chunks
+        chunks = self._read_chunks(source, stats)
+        if source.schema:
+            stats.metadata["schema"] = {c: t.type for c, t in source.schema.items()}
+        encoded: list[str] | None = None
+        while True:
+            start = time.perf_counter()
+            try:
+                chunk = next(chunks)
+            except StopIteration:
+                break
+            finally:
+                stats.seconds += time.perf_counter() - start
+
+            if source.schema:
+                start = time.perf_counter()
+                coerced = coerce_frame(chunk, source.schema)
+                chunk = coerced.frame
+                invalid = stats.metadata.setdefault("coerce_invalid", {})
+                for column, count in coerced.invalid.items():
+                    invalid[column] = invalid.get(column, 0) + count
+                stats.seconds += time.perf_counter() - start
+
+            if self.options.dtype_backend != "numpy":
+                start = time.perf_counter()
+                chunk = to_backend(chunk, self.options.dtype_backend)
+                stats.seconds += time.perf_counter() - start
+
+            if self.options.dictionary_encoding:
+                start = time.perf_counter()
+                # Las columnas se eligen con el primer chunk y se mantienen en los siguientes
+                if encoded is None:
+                    # Una columna declarada 'string' se deja como texto
+                    candidates = dictionary_candidates(chunk, self.options.dictionary_max_ratio)
+                    encoded = [c for c in candidates if c not in source.schema]
+                    stats.metadata["dictionary_columns"] = encoded
+                chunk = encode_dictionary(chunk, encoded)
+                stats.seconds += time.perf_counter() - start
+
+            stats.rows += len(chunk)
+            stats.chunks += 1
+            stats.peak_frame_bytes = max(stats.peak_frame_bytes, frame_bytes(chunk))
+            yield chunk
+
+    def load(self, source_name: str) -> pd.DataFrame:
+        """Materializa una fuente completa en un único DataFrame"""
+        chunks = []
+        held = 0
+        for chunk in self.iter_chunks(source_name):
+            chunks.append(chunk)
+            held += frame_bytes(chunk)
+
+        stats = self.stats[source_name]
+        if not chunks:
+            return pd.DataFrame()
+
+        frame = concat_chunks(chunks)
+        # Durante el concat conviven los chunks y el frame resultante
+        concat_peak = held + frame_bytes(frame) if len(chunks) > 1 else held
+        stats.peak_frame_bytes = max(stats.peak_frame_bytes, concat_peak)
+        return frame
+
+    def load_many(self, source_names: list[str] | None = None) -> LoadResult:
+        """
+        Carga varias fuentes (por defecto todas) de forma concurrente.
+
+        Con `jobs > 1` usa un pool de threads (lectores limitados por I/O) o,
+        con `executor='process'`, un pool de procesos para el parseo de CSV
+        limitado por CPU. Los errores de cada fuente se reportan por separado
+        sin detener la carga de las demás.
+        """
+        names = list(source_names if source_names is not None else self.config.sources)
+        result = LoadResult()
+        start = time.perf_counter()
+
+        jobs = min(self.options.jobs, len(names))
+        if jobs <= 1:
+            for name in names:
+                try:
+                    result.frames[name] = self.load(name)
+                except IngestError as e:
+                    result.errors[name] = e
+        elif self.options.executor == "process":
+            # El trabajador recibe una copia del motor sin métricas previas
+            worker_engine = IngestEngine(self.config, self.options, self.plan, self.cache,
+                                         self.dialect_cache)
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                futures = {pool.submit(_load_in_worker, worker_engine, n): n for n in names}
+                for future in as_completed(futures):
+                    name = futures[future]
+                    try:
+                        result.frames[name], self.stats[name] = future.result()
+                    except IngestError as e:
+                        result.errors[name] = e
+        else:
+            with ThreadPoolExecutor(max_workers=jobs) as pool:
+                futures = {pool.submit(self.load, n): n for n in names}
+                for future in as_completed(futures):
+                    name = futures[future]
+                    try:
+                        result.frames[name] = future.result()
+                    except IngestError as e:
+                        result.errors[name] = e
+
+        # Orden estable (el de la configuración) independiente del paralelismo
+        result.frames = {n: result.frames[n] for n in names if n in result.frames}
+        result.errors = {n: result.errors[n] for n in names if n in result.errors}
+        result.seconds = time.perf_counter() - start
+        return result
+
+    def columns_for(self, source_name: str) -> set[str] | None:
+        """Columnas a cargar según el plan (None = todas)"""
+        plan = self.plan.get(source_name)
+        return plan.columns if plan else None
+
+    def filters_for(self, source_name: str) -> dict[str, set[str]]:
+        """Filtros de lectura según el plan (columna física → valores)"""
+        plan = self.plan.get(source_name)
+        return plan.filters if plan else {}
+
+    def _read_chunks(self, source: SourceConfig,
+                     stats: IngestStats) -> Iterator[pd.DataFrame]:
+        """Lee una fuente aplicando los filtros del plan"""
+        path = source.resolve_path(self.config.base_path)
+        columns = self.columns_for(source.name)
+
+        # Dataset de Power BI: filtros y proyección se resuelven en la consulta DAX
+        if source.type == "powerbi":
+            yield from self._parse_chunks(source, source.path, columns, stats)
+            return
+
+        if is_multi_file(source, self.config.base_path):
+            chunks = self._read_files(source, columns, stats)
+        else:
+            if not path.exists():
+                raise IngestError(f"Source file not found for '{source.name}': {path}")
+            # Parquet ya es columnar: se lee directo con pushdown, sin pasar por la caché
+            if source.type == "parquet":
+                yield from self._parse_chunks(source, path, columns, stats)
+                return
+            chunks = self._read_unfiltered(source, path, columns, stats)
+
+        filters = self.filters_for(source.name)
+        if not filters:
+            yield from chunks
+            return
+
+        # Filtrado al vuelo: cada chunk se reduce antes de llegar al consumidor
+        stats.metadata["filters"] = {c: sorted(v) for c, v in filters.items()}
+        stats.metadata["rows_scanned"] = 0
+        empty = None
+        yielded = False
+        for chunk in chunks:
+            stats.metadata["rows_scanned"] += len(chunk)
+            # El chunk sin filtrar también ocupa memoria mientras se filtra
+            stats.peak_frame_bytes = max(stats.peak_frame_bytes, frame_bytes(chunk))
+            mask = pd.Series(True, index=chunk.index)
+            for column, values in filters.items():
+                if column in chunk.columns:
+                    mask &= chunk[column].isin(values)
+                else:
+                    # La fuente no tiene la columna: ninguna fila puede cumplir el filtro
+                    mask &= False
+            filtered = chunk[mask]
+            if filtered.empty:
+                empty = filtered if empty is None else empty
+                continue
+            yielded = True
+            yield filtered
+        if not yielded and empty is not None:
+            yield empty
+
+    def _read_files(self, source: SourceConfig, columns: set[str] | None,
+                    stats: IngestStats) -> Iterator[pd.DataFrame]:
+        """
+        Lee una fuente de varios archivos (glob o directorio `key=value`).
+
+        Los archivos cuyas particiones no pueden cumplir los filtros del plan se
+        descartan sin abrirlos. Con `jobs > 1` se leen hasta `jobs` archivos a
+        la vez (cada uno completo en memoria); los chunks se entregan siempre en
+        el orden de los archivos. Las claves de partición se agregan como
+        columnas de texto cuando el archivo no las trae.
+        """
+        files = list_source_files(source, self.config.base_path)
+        if not files:
+            raise IngestError(f"No files match source '{source.name}': "
+                              f"{source.resolve_path(self.config.base_path)}")
+
+        kept, pruned = prune_files(files, self.filters_for(source.name))
+        stats.metadata.update(files_total=len(files), files_scanned=len(kept),
+                              files_pruned=len(pruned))
+        partition_keys = sorted({key for f in files for key in f.partitions})
+        file_stats = [IngestStats(source_name=source.name) for _ in kept]
+        added_keys: set[str] = set()
+
+        def _file_chunks(index: int) -> Iterator[pd.DataFrame]:
+            source_file = kept[index]
+            for chunk in self._read_unfiltered(source, source_file.path, columns,
+                                               file_stats[index]):
+                added = {key: source_file.partitions.get(key) for key in partition_keys
+                         if key not in chunk.columns and (columns is None or key in columns)}
+                added_keys.update(added)
+                yield chunk.assign(**added) if added else chunk
+
+        jobs = min(self.options.jobs, len(kept))
+        if jobs <= 1:
+            for index in range(len(kept)):
+                yield from _file_chunks(index)
+        else:
+            with ThreadPoolExecutor(max_workers=jobs) as pool:
+                pending = {}
+                for index in range(len(kept)):
+                    pending[index] = pool.submit(lambda i: list(_file_chunks(i)), index)
+                    # Ventana acotada: como máximo `jobs` archivos en vuelo
+                    if len(pending) >= jobs:
+                        first = min(pending)
+                        yield from pending.pop(first).result()
+                for index in sorted(pending):
+                    yield from pending.pop(index).result()
+
+        self._merge_file_stats(stats, file_stats, partition_keys, added_keys)
+
+    @staticmethod
+    def _merge_file_stats(stats: IngestStats, file_stats: list[IngestStats],
+                          partition_keys: list[str], added_keys: set[str]) -> None:
+        """Resume en la fuente las métricas de lectura de cada archivo"""
+        metadata = [s.metadata for s in file_stats]
+        if not metadata:
+            return
+        for name in ("columns_total", "columns_loaded"):
+            values = [m[name] for m in metadata if name in m]
+            if values:
+                # Las particiones agregadas cuentan como columnas de la fuente
+                stats.metadata[name] = max(values) + len(added_keys)
+        missing = set().union(*(m.get("columns_missing", []) for m in metadata))
+        missing.difference_update(partition_keys)
+        if missing:
+            stats.metadata["columns_missing"] = sorted(missing)
+
+        dialects = [m["dialect"] for m in metadata if "dialect" in m]
+        if dialects:
+            stats.metadata["dialect"] = dialects[0]
+
+        caches = [m["cache"] for m in metadata if "cache" in m]
+        if caches:
+            hits = caches.count("hit")
+            stats.metadata["cache"] = caches[0] if len(set(caches)) == 1 \
+                else f"{hits}/{len(caches)} files hit"
+        appended = [m["rows_appended"] for m in metadata if "rows_appended" in m]
+        if appended:
+            stats.metadata["rows_appended"] = sum(appended)
+
+    def _read_unfiltered(self, source: SourceConfig, path, columns: set[str] | None,
+                         stats: IngestStats) -> Iterator[pd.DataFrame]:
+        """
+        Lee una fuente desde la caché si es posible; si no, la parsea y la cachea.
+
+        Si el archivo solo creció desde la última entrada cacheada (mismo
+        checksum del prefijo ya leído), se reutiliza la entrada y se parsea
+        únicamente la cola agregada.
+        """
+        source = self._resolve_dialect(source, path, stats)
+        if self.cache is None:
+            yield from self._parse_chunks(source, path, columns, stats)
+            return
+
+        options = {
+            "type": source.type,
+            "encoding": source.encoding,
+            "delimiter": source.delimiter,
+            "quotechar": source.quotechar,
+            "compression": source.compression,
+            "member": source.member,
+            "sheet": source.sheet,
+            "header_row": source.header_row,
+            "columns": sorted(columns) if columns is not None else None,
+        }
+        key = self.cache.make_key(file_fingerprint(path), options)
+        meta = self.cache.get(key)
+        if meta is not None:
+            stats.metadata.update(
+                cache="hit",
+                columns_total=meta["columns_total"],
+                columns_loaded=len(meta["columns"]),
+            )
+            yield from self.cache.iter_chunks(key, self.options.chunk_rows,
+                                              self.options.dtype_backend)
+            return
+
+        # La clave de append omite la huella: identifica la fuente aunque crezca
+        append_key = self.cache.make_key({"path": str(Path(path).resolve())}, options)
+        previous = self._appendable_entry(source, path, append_key)
+        size_before = Path(path).stat().st_size
+
+        if previous is not None:
+            stats.metadata["cache"] = "append"
+            chunks = self._append_chunks(source, path, columns, previous, stats)
+        else:
+            stats.metadata["cache"] = "miss"
+            chunks = self._parse_chunks(source, path, columns, stats)
+
+        writer = None
+        try:
+            for chunk in chunks:
+                if writer is None:
+                    writer = self.cache.writer(key, {
+                        "source_name": source.name,
+                        "source_path": str(path),
+                        "columns": list(chunk.columns),
+                        "columns_total": stats.metadata.get("columns_total", len(chunk.columns)),
+                        "append_key": append_key,
+                    })
+                writer.write(chunk)
+                yield chunk
+        except BaseException:
+            # Error o consumidor que abandona la lectura: no publicar entrada parcial
+            if writer is not None:
+                writer.abort()
+            raise
+        if writer is not None:
+            append_state = self._append_state(source, path, size_before)
+            if append_state is not None:
+                writer.meta["append"] = append_state
+            writer.commit()
+            self.cache.remove_superseded(append_key, keep=key)
+
+    def _resolve_dialect(self, source: SourceConfig, path,
+                         stats: IngestStats) -> SourceConfig:
+        """Fuente con el formato detectado en lugar de los valores 'auto'"""
+        if not needs_sniffing(source):
+            return source
+        try:
+            resolved = resolve_dialect(source, Path(path), self.dialect_cache)
+        except (ValueError, OSError, EOFError, zipfile.BadZipFile) as e:
+            raise IngestError(
+                f"Could not detect CSV format of '{source.name}' ({path}): {e}") from e
+        except ImportError as e:
+            raise IngestError(str(e)) from e
+        stats.metadata["dialect"] = {
+            "encoding": resolved.encoding,
+            "delimiter": resolved.delimiter,
+            "quotechar": resolved.quotechar,
+        }
+        return resolved
+
+    def _append_state(self, source: SourceConfig, path, size: int) -> dict | None:
+        """
+        Estado para la próxima ingesta incremental: offset en bytes y checksum
+        del prefijo leído. None si la fuente no admite lectura desde un offset
+        o si el archivo cambió mientras se leía.
+        """
+        from recon.adapters.compressed import resolve_compression
+
+        if source.type != "csv" or resolve_compression(path, source.compression):
+            return None
+        if size == 0 or Path(path).stat().st_size != size:
+            return None
+        with open(path, "rb") as f:
+            f.seek(size - 1)
+            ends_with_newline = f.read(1) == b"\n"
+        # Sin salto de línea final la última fila podría estar incompleta
+        if not ends_with_newline:
+            return None
+        return {"byte_offset": size, "prefix_hash": content_hash(path, size)}
+
+    def _appendable_entry(self, source: SourceConfig, path,
+                          append_key: str) -> tuple[str, dict] | None:
+        """Entrada previa reutilizable si el archivo solo creció al final"""
+        found = self.cache.find_appendable(append_key)
+        if found is None:
+            return None
+        _, meta = found
+        offset = meta["append"]["byte_offset"]
+        size = Path(path).stat().st_size
+        if size <= offset:
+            return None
+        if content_hash(path, offset) != meta["append"]["prefix_hash"]:
+            return None  # El prefijo cambió: recarga completa
+        return found
+
+    def _append_chunks(self, source: SourceConfig, path, columns: set[str] | None,
+                       previous: tuple[str, dict], stats: IngestStats) -> Iterator[pd.DataFrame]:
+        """Filas ya cacheadas seguidas de las filas agregadas al final del archivo"""
+        from recon.adapters.csv_model import CsvSourceReader
+
+        previous_key, meta = previous
+        stats.metadata.update(
+            columns_total=meta["columns_total"],
+            columns_loaded=len(meta["columns"]),
+            rows_cached=meta["rows"],
+            rows_appended=0,
+        )
+        yield from self.cache.iter_chunks(previous_key, self.options.chunk_rows,
+                                          self.options.dtype_backend)
+
+        reader = CsvSourceReader(path, encoding=source.encoding, delimiter=source.delimiter,
+                                 columns=columns, quotechar=source.quotechar)
+        try:
+            for chunk in reader.iter_chunks(self.options.chunk_rows, self.options.max_memory,
+                                            start_offset=meta["append"]["byte_offset"]):
+                stats.metadata["rows_appended"] += len(chunk)
+                yield chunk[meta["columns"]]
+        except (ValueError, OSError) as e:
+            raise IngestError(f"Could not parse '{source.name}' ({path}): {e}") from e
+
+    def _use_mmap_scanner(self, source: SourceConfig, path, columns: set[str] | None,
+                          reader) -> bool:
+        """
+        Elige el escáner sobre mmap para CSV anchos de los que se usan pocas
+        columnas (`csv_scanner: auto`), o siempre que sea posible (`mmap`).
+        """
+        from recon.adapters.csv_model import MmapFieldScanner
+
+        mode = self.config.csv_scanner
+        if mode not in ("auto", "mmap"):
+            return False
+        if columns is None or not MmapFieldScanner.supports(path, source.encoding,
+                                                            source.delimiter,
+                                                            source.quotechar):
+            return False
+        if mode == "mmap":
+            return True
+        header = reader.read_header()
+        return 0 < len(columns.intersection(header)) * MMAP_AUTO_COLUMN_RATIO <= len(header)
+
+    def _parse_chunks(self, source: SourceConfig, path, columns: set[str] | None,
+                      stats: IngestStats) -> Iterator[pd.DataFrame]:
+        """Despacha el parseo al adaptador correspondiente al tipo de fuente"""
+        if source.type == "csv":
+            from recon.adapters.compressed import resolve_compression
+            from recon.adapters.csv_model import CsvSourceReader
+            try:
+                compression = resolve_compression(path, source.compression)
+            except ValueError as e:
+                raise IngestError(f"Source '{source.name}': {e}") from e
+            if compression:
+                stats.metadata["compression"] = compression
+            reader = CsvSourceReader(path, encoding=source.encoding, delimiter=source.delimiter,
+                                     columns=columns, compression=compression,
+                                     member=source.member, quotechar=source.quotechar)
+            if not compression and self._use_mmap_scanner(source, path, columns, reader):
+                from recon.adapters.csv_model import MmapFieldScanner
+                reader = MmapFieldScanner(path, columns, encoding=source.encoding,
+                                          delimiter=source.delimiter,
+                                          quotechar=source.quotechar)
+                stats.metadata["scanner"] = "mmap"
+        elif source.type == "parquet":
+            from recon.adapters.parquet_source import ParquetSourceReader
+            filters = self.filters_for(source.name)
+            try:
+                reader = ParquetSourceReader(path, columns=columns, filters=filters)
+            except ImportError as e:
+                raise IngestError(str(e)) from e
+            if filters:
+                stats.metadata["filters"] = {c: sorted(v) for c, v in filters.items()}
+        elif source.type == "excel":
+            from recon.adapters.excel_source import ExcelSourceReader
+            try:
+                reader = ExcelSourceReader(path, sheet=source.sheet, header_row=source.header_row,
+                                           columns=columns)
+            except ImportError as e:
+                raise IngestError(str(e)) from e
+        elif source.type == "powerbi":
+            from recon.adapters.powerbi_dataset import reader_for_source
+            # Los filtros viajan en la consulta (TREATAS por lotes de valores)
+            filters = self.filters_for(source.name)
+            try:
+                reader = reader_for_source(source, columns=columns, filters=filters)
+            except DatasetError as e:
+                raise IngestError(f"Source '{source.name}': {e}") from e
+            if filters:
+                stats.metadata["filters"] = {c: sorted(v) for c, v in filters.items()}
+        else:
+            raise IngestError(f"Unsupported source type '{source.type}' for '{source.name}'")
+
+        try:
+            header = reader.read_header()
+            stats.metadata["columns_total"] = len(header)
+            if columns is None:
+                stats.metadata["columns_loaded"] = len(header)
+            else:
+                stats.metadata["columns_loaded"] = len(columns.intersection(header))
+                missing = sorted(columns.difference(header))
+                if missing:
+                    stats.metadata["columns_missing"] = missing
+
+            yield from reader.iter_chunks(self.options.chunk_rows, self.options.max_memory)
+            stats.metadata.update(getattr(reader, "metrics", {}))
+        except pd.errors.EmptyDataError:
+            return
+        except DatasetError as e:
+            raise IngestError(f"Could not query '{source.name}' ({path}): {e}") from e
+        except ImportError as e:
+            raise IngestError(str(e)) from e
+        except (ValueError, OSError, EOFError, zipfile.BadZipFile) as e:
+            # Incluye errores de parseo/encoding y archivos comprimidos corruptos
+            raise IngestError(f"Could not parse '{source.name}' ({path}): {e}") from e
@@ -162,6 +162,8 @@ class ReconciliationReport:
     
     # Metadatos
     sources_loaded: dict[str, int] = field(default_factory=dict)  # {source_name: row_count}
+    # {source_name: métricas de ingesta}
+    source_stats: dict[str, dict] = field(default_factory=dict)
     execution_time_seconds: float = 0.0
     filters_applied: dict = field(default_factory=dict)
     
@@ -172,6 +174,7 @@ class ReconciliationReport:
             "config_file": self.config_file,
             "execution_time_seconds": self.execution_time_seconds,
             "sources_loaded": self.sources_loaded,
+            "source_stats": self.source_stats,
             "filters_applied": self.filters_applied,
             "summary": {
                 "integrity_checks": len(self.integrity_checks),
@@ -2,3 +2,118 @@
 Normalize Module - Data normalization and transformation
 Módulo para normalización y transformación de datos
 """
+
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from recon.core.config import ColumnType
+
+# Separadores de miles y espacios que se ignoran al leer números
+_DECIMAL_NOISE = r"[,\s]"
+# Además, símbolos de moneda ($1,234.50, € 99)
+_MONEY_NOISE = r"[$€£,\s]"
+# Montos contables negativos: (1,234.50)
+_NEGATIVE_PARENS = r"^\((.*)\)$"
+
+
+@dataclass
+class CoercionResult:
+    """Frame con columnas tipadas y cantidad de valores no convertibles por columna"""
+    frame: pd.DataFrame
+    invalid: dict[str, int] = field(default_factory=dict)
+
+
+def _as_text(series: pd.Series) -> pd.Series:
+    return series.astype("string").str.strip()
+
+
+def parse_decimal(series: pd.Series, money: bool = False) -> pd.Series:
+    """Texto → float64; los valores no numéricos quedan NaN"""
+    if pd.api.types.is_numeric_dtype(series):
+        return series.astype("float64")
+    text = _as_text(series)
+    if money:
+        text = text.str.replace(_NEGATIVE_PARENS, r"-\1", regex=True)
+    text = text.str.replace(_MONEY_NOISE if money else _DECIMAL_NOISE, "", regex=True)
+    return pd.to_numeric(text, errors="coerce").astype("float64")
+
+
+def _int64_or_none(text: str) -> int | None:
+    value = int(text)
+    return value if -2 ** 63 <= value < 2 ** 63 else None
+
+
+def parse_int(series: pd.Series) -> pd.Series:
+    """
+    Texto → Int64 (entero con nulos); decimales con fracción quedan nulos.
+
+    Los textos enteros se convierten sin pasar por float64 (una clave de 17
+    dígitos no pierde precisión); los que no caben en int64 quedan nulos.
+    Solo los valores con parte decimal o exponente ("146.0", "1e3") pasan por
+    float64, y únicamente si el entero es exacto en float64 (hasta 2**53).
+    """
+    if pd.api.types.is_integer_dtype(series):
+        return series.astype("Int64")
+    text = _as_text(series).str.replace(_DECIMAL_NOISE, "", regex=True)
+    integral = text.str.fullmatch(r"[+-]?\d+").fillna(False).astype(bool)
+    digits = text.where(integral)
+    exact = pd.to_numeric(digits, errors="coerce", dtype_backend="numpy_nullable")
+    if not pd.api.types.is_integer_dtype(exact):
+        exact = digits.map(_int64_or_none, na_action="ignore").astype("Int64")
+
+    numbers = parse_decimal(series.where(~integral))
+    numbers = numbers.where(np.isfinite(numbers) & (numbers % 1 == 0)
+                            & (numbers.abs() <= 2 ** 53))
+    return exact.astype("Int64").fillna(numbers.astype("Int64"))
+
+
+def parse_date(series: pd.Series, date_format: str | None = None) -> pd.Series:
+    """Texto → datetime64; con `format` el parseo no infiere por fila"""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+    return pd.to_datetime(_as_text(series), format=date_format, errors="coerce")
+
+
+def coerce_column(series: pd.Series, column_type: ColumnType) -> pd.Series:
+    """Convierte una columna de texto al tipo declarado en el `schema` de la fuente"""
+    kind = column_type.type
+    if kind == "int":
+        return parse_int(series)
+    if kind == "decimal":
+        return parse_decimal(series)
+    if kind == "money":
+        return parse_decimal(series, money=True)
+    if kind == "date":
+        return parse_date(series, column_type.format)
+    if kind == "category":
+        return series if isinstance(series.dtype, pd.CategoricalDtype) \
+            else series.astype("category")
+    return series  # string: se conserva el texto tal cual
+
+
+def coerce_frame(frame: pd.DataFrame, schema: dict[str, ColumnType]) -> CoercionResult:
+    """
+    Aplica el `schema` de una fuente columna por columna (vectorizado).
+
+    Las columnas del schema ausentes en el frame (por proyección) se omiten.
+    Un valor no vacío que no se puede convertir queda nulo y se cuenta en
+    `invalid` para reportarlo.
+    """
+    columns = {}
+    invalid = {}
+    for column, column_type in schema.items():
+        if column not in frame.columns:
+            continue
+        original = frame[column]
+        coerced = coerce_column(original, column_type)
+        if coerced is original:
+            continue
+        lost = int((coerced.isna() & original.notna()).sum())
+        if lost:
+            invalid[column] = lost
+        columns[column] = coerced
+    if not columns:
+        return CoercionResult(frame=frame)
+    return CoercionResult(frame=frame.assign(**columns), invalid=invalid)
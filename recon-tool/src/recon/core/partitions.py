@@ -0,0 +1,99 @@
+"""
+Partitions Module - Multi-file sources (glob patterns and key=value directories)
+Fuentes de varios archivos: patrones glob y directorios particionados key=value
+"""
+
+import glob
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.parse import unquote
+
+from recon.core.config import SourceConfig
+
+_GLOB_CHARS = "*?["
+
+# Archivos que se toman de un directorio según el tipo de la fuente
+_DIRECTORY_PATTERNS = {
+    "csv": ("*.csv", "*.csv.gz", "*.csv.gzip", "*.csv.bz2", "*.csv.zst", "*.csv.zstd"),
+    "excel": ("*.xlsx", "*.xlsm"),
+}
+
+
+@dataclass
+class SourceFile:
+    """Archivo de una fuente con los valores de partición de su ruta"""
+    path: Path
+    partitions: dict[str, str] = field(default_factory=dict)
+
+
+def is_glob(path: str) -> bool:
+    return any(char in path for char in _GLOB_CHARS)
+
+
+def is_multi_file(source: SourceConfig, base_path: Path) -> bool:
+    """
+    La fuente es un patrón glob o un directorio de archivos.
+
+    Los directorios Parquet se excluyen: su lector ya trata el dataset
+    particionado completo. Tampoco aplica a datasets de Power BI (path = URL).
+    """
+    if source.type in ("parquet", "powerbi"):
+        return False
+    return is_glob(source.path) or source.resolve_path(base_path).is_dir()
+
+
+def _root(pattern: Path) -> Path:
+    """Directorio base de un patrón: los segmentos anteriores al primer comodín"""
+    parts = []
+    for part in pattern.parts:
+        if is_glob(part):
+            break
+        parts.append(part)
+    return Path(*parts) if parts else Path(".")
+
+
+def parse_partitions(path: Path, root: Path) -> dict[str, str]:
+    """Valores `key=value` de los directorios entre `root` y el archivo"""
+    try:
+        relative = path.relative_to(root)
+    except ValueError:
+        relative = path
+    partitions = {}
+    for part in relative.parts[:-1]:
+        if "=" in part:
+            key, value = part.split("=", 1)
+            partitions[unquote(key)] = unquote(value)
+    return partitions
+
+
+def list_source_files(source: SourceConfig, base_path: Path) -> list[SourceFile]:
+    """Archivos de una fuente multi-archivo, en orden de ruta"""
+    target = source.resolve_path(base_path)
+    if is_glob(source.path):
+        root = _root(target)
+        paths = [Path(p) for p in glob.glob(str(target), recursive=True)]
+    else:
+        root = target
+        paths = [p for pattern in _DIRECTORY_PATTERNS.get(source.type, ("*",))
+                 for p in target.rglob(pattern)]
+    files = sorted({p for p in paths if p.is_file()})
+    return [SourceFile(path=p, partitions=parse_partitions(p, root)) for p in files]
+
+
+def prune_files(files: list[SourceFile],
+                filters: dict[str, set[str]]) -> tuple[list[SourceFile], list[SourceFile]]:
+    """
+    Separa los archivos que pueden contener filas válidas de los descartables.
+
+    Un archivo se descarta si alguna de sus particiones es una columna
+    filtrada y su valor no está entre los permitidos.
+    """
+    kept, pruned = [], []
+    for source_file in files:
+        matches = all(
+            source_file.partitions[column] in values
+            for column, values in filters.items()
+            if column in source_file.partitions
+        )
+        (kept if matches else pruned).append(source_file)
+    return kept, pruned
@@ -0,0 +1,155 @@
+"""
+Planner Module - Derives what each source must load from the project config
+Módulo que deriva, desde la configuración, qué debe cargarse de cada fuente
+"""
+
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from recon.core.config import ProjectConfig
+
+
+@dataclass
+class SourcePlan:
+    """Plan de carga de una fuente"""
+    source_name: str
+    columns: set[str] | None = None  # None = todas las columnas
+    consumers: list[str] = field(default_factory=list)  # Reglas/checks que la usan
+    # Filtros aplicables en la lectura: columna física → valores permitidos
+    filters: dict[str, set[str]] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return {
+            "source_name": self.source_name,
+            "columns": sorted(self.columns) if self.columns is not None else None,
+            "consumers": self.consumers,
+            "filters": {c: sorted(v) for c, v in self.filters.items()}
+        }
+
+
+def _as_values(value: Any) -> set[str]:
+    """Normaliza un valor de filtro (escalar o lista) a un conjunto de textos"""
+    if isinstance(value, (list, tuple, set)):
+        return {str(v) for v in value}
+    return {str(value)}
+
+
+def _merge_filter(filters: dict[str, set[str]], column: str, values: set[str]) -> None:
+    """Agrega un filtro; dos filtros sobre la misma columna se intersectan"""
+    if column in filters:
+        filters[column] = filters[column] & values
+    else:
+        filters[column] = set(values)
+
+
+def _references(config: ProjectConfig) -> Iterator[tuple[str, str, list[str], dict[str, Any]]]:
+    """
+    Recorre las reglas y checks del proyecto.
+
+    Genera (fuente, consumidor, columnas referenciadas, filtros de filas) por
+    cada uso de una fuente.
+    """
+    for service_type, rule in config.validation_rules.items():
+        consumer = f"rule:{service_type}"
+        yield (rule.source_name, consumer,
+               [m.source_field for m in rule.field_mappings] + list(rule.source_filters),
+               rule.source_filters)
+        if rule.pbi_source:
+            # La tabla PBI se cruza con el source por las claves del source
+            source = config.sources.get(rule.source_name)
+            key_columns = source.key_columns if source else []
+            yield (rule.pbi_source, consumer,
+                   [m.pbi_field for m in rule.field_mappings] + list(rule.pbi_filters)
+                   + key_columns,
+                   rule.pbi_filters)
+
+    for check in config.integrity_checks:
+        consumer = f"check:{check.name}"
+        yield check.source_table, consumer, [check.source_key], {}
+        yield check.target_table, consumer, [check.target_key], {}
+
+
+def column_references(config: ProjectConfig) -> dict[str, dict[str, list[str]]]:
+    """
+    Columnas que la configuración referencia en cada fuente.
+
+    Retorna fuente → columna → quiénes la referencian (`key_columns`,
+    `filter:<filtro lógico>`, `rule:<tipo>` o `check:<nombre>`).
+    """
+    references: dict[str, dict[str, list[str]]] = {name: {} for name in config.sources}
+
+    def _add(source_name: str, column: str, referrer: str) -> None:
+        if source_name not in references or not column:
+            return
+        referrers = references[source_name].setdefault(column, [])
+        if referrer not in referrers:
+            referrers.append(referrer)
+
+    for name, source in config.sources.items():
+        for column in source.key_columns:
+            _add(name, column, "key_columns")
+        for logical, column in source.filter_columns.items():
+            _add(name, column, f"filter:{logical}")
+
+    for source_name, consumer, columns, _ in _references(config):
+        for column in columns:
+            _add(source_name, column, consumer)
+
+    return references
+
+
+def build_plan(config: ProjectConfig,
+               filters: dict[str, Any] | None = None) -> dict[str, SourcePlan]:
+    """
+    Construye el plan de carga de todas las fuentes del proyecto.
+
+    Las columnas de cada fuente son sus `key_columns` más las que referencian
+    las reglas de validación (campos mapeados y filtros) y los checks de
+    integridad. Si `column_projection` está desactivado, o la fuente no tiene
+    ninguna columna referenciada, se cargan todas las columnas.
+
+    Los filtros de lectura combinan:
+    - Los filtros lógicos del CLI (`site_id`, `vendor`, `service_type`),
+      traducidos con el `filter_columns` de cada fuente.
+    - Los filtros de las reglas (`source_filters`/`pbi_filters`), solo cuando
+      todos los consumidores de la fuente filtran esa columna; en ese caso se
+      lee la unión de los valores que pide cada consumidor.
+    """
+    plans = {
+        name: SourcePlan(source_name=name, columns=set(source.key_columns))
+        for name, source in config.sources.items()
+    }
+    consumer_filters: dict[str, list[dict[str, Any]]] = {name: [] for name in plans}
+
+    for source_name, consumer, columns, row_filters in _references(config):
+        plan = plans.get(source_name)
+        if plan is None:
+            continue
+        plan.columns.update(c for c in columns if c)
+        if consumer not in plan.consumers:
+            plan.consumers.append(consumer)
+        consumer_filters[source_name].append(row_filters)
+
+    for name, plan in plans.items():
+        source = config.sources[name]
+
+        # Filtros de reglas: solo columnas filtradas por todos los consumidores
+        per_consumer = consumer_filters[name]
+        if per_consumer:
+            shared = set.intersection(*(set(f) for f in per_consumer))
+            for column in shared:
+                values = set().union(*(_as_values(f[column]) for f in per_consumer))
+                _merge_filter(plan.filters, column, values)
+
+        # Filtros del CLI traducidos a la columna física de la fuente
+        for logical, value in (filters or {}).items():
+            column = source.filter_columns.get(logical)
+            if column and value is not None:
+                _merge_filter(plan.filters, column, _as_values(value))
+                plan.columns.add(column)
+
+        if not config.column_projection or not plan.columns:
+            plan.columns = None
+
+    return plans
@@ -2,3 +2,251 @@
 Rules Module - Validation rules engine
 Módulo del motor de reglas de validación
 """
+
+import dataclasses
+import tempfile
+from pathlib import Path
+
+from recon.adapters.pbi_catalog import LayoutCatalog, field_id
+from recon.core.backends import ExecutionBackend, get_backend
+from recon.core.config import IntegrityCheck, ProjectConfig, ValidationRule
+from recon.core.ingest import IngestError
+from recon.core.models import (
+    EntityComparison,
+    IntegrityCheckResult,
+    ReconciliationReport,
+    Severity,
+    ValidationResult,
+    ValidationStatus,
+)
+from recon.core.session import SourceSession
+from recon.core.spill import bucket_count, compare_rule_spilled, distinct_key_frame, source_bytes
+from recon.core.validators.entity_compare import compare_rule
+from recon.core.validators.referential import check_referential_integrity
+from recon.core.validators.service_unpivot import (
+    ServiceGroup,
+    compare_service_group,
+    plan_service_groups,
+)
+
+
+class RulesEngine:
+    """
+    Ejecuta los checks de integridad y las reglas de validación del proyecto.
+
+    Las fuentes se piden a la `SourceSession`, que las carga una sola vez y
+    las libera cuando termina su último consumidor. El filtrado, la agrupación
+    y los cruces los ejecuta el motor de `settings.engine` (ver
+    `recon.core.backends`).
+
+    Las reglas que solo difieren en el servicio filtrado en PBI (una columna
+    por servicio en la fuente, una fila por servicio en PBI) se resuelven
+    juntas con un único cruce si `settings.unpivot_rules` está activo.
+
+    Con `spill_memory` (modo fuera de memoria) ninguna fuente se materializa:
+    las reglas se comparan por buckets en disco (ver `recon.core.spill`) y
+    los checks reducen cada fuente a sus claves distintas.
+    """
+
+    def __init__(self, config: ProjectConfig, session: SourceSession,
+                 backend: ExecutionBackend | None = None,
+                 spill_memory: int | None = None, spill_dir: str | None = None):
+        self.config = config
+        self.session = session
+        self.backend = backend or get_backend(config.engine)
+        self.spill_memory = spill_memory
+        self.spill_dir = spill_dir
+        self.spill_stats: dict[str, dict] = {}
+
+    def run(self, report: ReconciliationReport) -> ReconciliationReport:
+        """Ejecuta checks y reglas agregando los resultados al reporte"""
+        for check in self.config.integrity_checks:
+            report.integrity_checks.append(self.run_check(check))
+
+        groups = {}
+        if self.config.unpivot_rules and self.spill_memory is None:
+            key_columns = {name: source.key_columns
+                           for name, source in self.config.sources.items()}
+            groups = {rule.service_type: group
+                      for group in plan_service_groups(self.config.validation_rules.values(),
+                                                       key_columns)
+                      for rule in group.rules}
+
+        grouped: dict[str, list[EntityComparison]] = {}
+        for rule in self.config.validation_rules.values():
+            group = groups.get(rule.service_type)
+            if group is None:
+                report.entity_comparisons.extend(self.run_rule(rule))
+                continue
+            if rule.service_type not in grouped:
+                grouped.update(self.run_service_group(group))
+            report.entity_comparisons.extend(grouped.pop(rule.service_type))
+
+        return report
+
+    def run_check(self, check: IntegrityCheck) -> IntegrityCheckResult:
+        """Ejecuta un check de integridad referencial"""
+        if self.spill_memory is not None:
+            try:
+                source = distinct_key_frame(self.session.iter_chunks(check.source_table),
+                                            check.source_key, self.backend)
+                target = distinct_key_frame(self.session.iter_chunks(check.target_table),
+                                            check.target_key, self.backend)
+            except IngestError:
+                return _check_not_verifiable(check)
+            return check_referential_integrity(check, source, target, self.backend)
+
+        with self.session.use(check.source_table, check.target_table) as (source, target):
+            if source is None or target is None:
+                return _check_not_verifiable(check)
+            return check_referential_integrity(check, source, target, self.backend)
+
+    def run_rule(self, rule: ValidationRule) -> list[EntityComparison]:
+        """Ejecuta la comparación entidad a entidad de una regla"""
+        if not rule.source_name and not rule.field_mappings:
+            return [_rule_level_result(
+                rule, ValidationStatus.RULE_NOT_DEFINED,
+                f"No validation rule defined for '{rule.service_type}'"
+            )]
+        if not rule.pbi_source:
+            return [_rule_level_result(
+                rule, ValidationStatus.RULE_NOT_DEFINED,
+                f"Rule '{rule.service_type}' has no pbi_source configured"
+            )]
+
+        source_config = self.config.sources.get(rule.source_name)
+        key_columns = source_config.key_columns if source_config else []
+        if self.spill_memory is not None:
+            return self._run_rule_spilled(rule, key_columns)
+
+        with self.session.use(rule.source_name, rule.pbi_source) as (source, pbi):
+            if source is None or pbi is None:
+                missing = rule.source_name if source is None else rule.pbi_source
+                return [_rule_level_result(
+                    rule, ValidationStatus.NOT_VERIFIABLE,
+                    f"Source '{missing}' could not be loaded"
+                )]
+            return compare_rule(rule, source, pbi, key_columns,
+                                default_tolerance=self.config.numeric_tolerance,
+                                backend=self.backend)
+
+    def run_service_group(self, group: ServiceGroup) -> dict[str, list[EntityComparison]]:
+        """Ejecuta juntas las reglas de un grupo de servicios (resultados por regla)"""
+        source_config = self.config.sources.get(group.source_name)
+        key_columns = source_config.key_columns if source_config else []
+        with self.session.use(group.source_name, group.pbi_source,
+                              consumers=len(group.rules)) as (source, pbi):
+            if source is None or pbi is None:
+                missing = group.source_name if source is None else group.pbi_source
+                return {rule.service_type: [_rule_level_result(
+                    rule, ValidationStatus.NOT_VERIFIABLE,
+                    f"Source '{missing}' could not be loaded"
+                )] for rule in group.rules}
+            return compare_service_group(group, source, pbi, key_columns,
+                                         default_tolerance=self.config.numeric_tolerance,
+                                         backend=self.backend)
+
+    def _run_rule_spilled(self, rule: ValidationRule,
+                          key_columns: list[str]) -> list[EntityComparison]:
+        """Comparación de una regla por buckets en disco bajo `spill_memory`"""
+        buckets = bucket_count(source_bytes(self.config, rule.source_name)
+                               + source_bytes(self.config, rule.pbi_source),
+                               self.spill_memory)
+        if self.spill_dir:
+            Path(self.spill_dir).mkdir(parents=True, exist_ok=True)
+        stats: dict = {}
+        with tempfile.TemporaryDirectory(prefix="recon_spill_", dir=self.spill_dir) as tmp:
+            try:
+                comparisons = compare_rule_spilled(
+                    rule, self.session.iter_chunks(rule.source_name),
+                    self.session.iter_chunks(rule.pbi_source), key_columns, Path(tmp),
+                    buckets, default_tolerance=self.config.numeric_tolerance,
+                    backend=self.backend, stats=stats
+                )
+            except IngestError:
+                missing = (rule.source_name if rule.source_name in self.session.errors
+                           else rule.pbi_source)
+                return [_rule_level_result(
+                    rule, ValidationStatus.NOT_VERIFIABLE,
+                    f"Source '{missing}' could not be loaded"
+                )]
+        if stats:
+            self.spill_stats[rule.service_type] = stats
+        return comparisons
+
+
+def _check_not_verifiable(check: IntegrityCheck) -> IntegrityCheckResult:
+    """Resultado de un check cuyas fuentes no pudieron cargarse"""
+    return IntegrityCheckResult(
+        check_name=check.name,
+        source_table=check.source_table,
+        target_table=check.target_table,
+        source_key=check.source_key,
+        target_key=check.target_key,
+        status=ValidationStatus.NOT_VERIFIABLE,
+        total_source_keys=0,
+        matched_keys=0,
+        missing_in_target=0,
+        severity=Severity.WARNING
+    )
+
+
+def _rule_level_result(rule: ValidationRule, status: ValidationStatus,
+                       message: str) -> EntityComparison:
+    """Resultado único para una regla que no pudo evaluarse por entidad"""
+    return EntityComparison(
+        entity_type="service_type",
+        entity_id=rule.service_type,
+        entity_filters={"service_type": rule.service_type},
+        validations=[ValidationResult(
+            status=status,
+            field_name=rule.service_type,
+            source_value=None,
+            pbi_value=None,
+            message=message,
+            severity=Severity.WARNING
+        )]
+    )
+
+
+def select_rules(config: ProjectConfig,
+                 service_type: str | None = None) -> dict[str, ValidationRule]:
+    """
+    Reglas a ejecutar para un filtro de tipo de servicio.
+
+    Un tipo de servicio sin regla se devuelve como regla vacía para que el
+    reporte lo clasifique como RULE_NOT_DEFINED en lugar de omitirlo.
+    """
+    if not service_type:
+        return dict(config.validation_rules)
+    if service_type in config.validation_rules:
+        return {service_type: config.validation_rules[service_type]}
+    return {service_type: ValidationRule(service_type=service_type, source_name="")}
+
+
+def referenced_rules(config: ProjectConfig, rules: dict[str, ValidationRule],
+                     catalog: LayoutCatalog
+                     ) -> tuple[dict[str, ValidationRule], dict[str, list[str]]]:
+    """
+    Reglas reducidas a los mapeos cuyo campo PBI usa algún visual o filtro
+    del reporte (según el catálogo del Layout).
+
+    Retorna (reglas, campos omitidos por regla). Una regla sin ningún campo
+    referenciado se omite; las reglas sin tabla PBI o sin mapeos se conservan
+    para que el reporte siga clasificándolas.
+    """
+    selected = {}
+    skipped: dict[str, list[str]] = {}
+    for name, rule in rules.items():
+        pbi_source = config.sources.get(rule.pbi_source)
+        if pbi_source is None or not rule.field_mappings:
+            selected[name] = rule
+            continue
+        table = pbi_source.model_table
+        mappings = [m for m in rule.field_mappings if catalog.is_referenced(table, m.pbi_field)]
+        dropped = [field_id(table, m.pbi_field) for m in rule.field_mappings if m not in mappings]
+        if dropped:
+            skipped[name] = dropped
+        if mappings:
+            selected[name] = dataclasses.replace(rule, field_mappings=mappings)
+    return selected, skipped
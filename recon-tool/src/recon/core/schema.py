@@ -0,0 +1,251 @@
+"""
+Schema Module - Header-only schema probe of project sources
+Sondeo de esquema (solo encabezados) y validación de columnas referenciadas
+"""
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from recon.core.cache import SCHEMA_CACHE_FILE
+from recon.core.config import ProjectConfig, SourceConfig
+from recon.core.partitions import is_multi_file, list_source_files
+from recon.core.planner import column_references
+
+
+class SchemaError(Exception):
+    """Error al leer el esquema de una fuente"""
+    pass
+
+
+@dataclass
+class SourceSchema:
+    """Columnas de una fuente obtenidas sin leer sus datos"""
+    source_name: str
+    path: str
+    columns: list[str] = field(default_factory=list)
+    error: str | None = None  # Archivo inexistente o ilegible
+    found: bool = True  # False si el archivo (o ningún archivo del glob) existe
+    cached: bool = False  # Esquema tomado de la caché
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class SchemaIssue:
+    """Columna referenciada por la configuración que no existe en la fuente"""
+    source_name: str
+    column: str
+    referrers: list[str]
+
+    @property
+    def message(self) -> str:
+        return (f"Column '{self.column}' not found in source '{self.source_name}' "
+                f"(used by {', '.join(self.referrers)})")
+
+
+class SchemaCache:
+    """
+    Caché de esquemas en un JSON dentro del directorio de caché.
+
+    La clave combina ruta, tamaño y mtime del archivo con las opciones de
+    lectura: leer el encabezado ya es barato, así que la huella evita el hash
+    de contenido que sí usa la caché de datos.
+    """
+
+    file_name = SCHEMA_CACHE_FILE
+
+    def __init__(self, cache_dir: str | Path):
+        self.path = Path(cache_dir) / self.file_name
+        self._entries: dict[str, Any] | None = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        # El lock no se puede copiar a otro proceso
+        state = dict(self.__dict__)
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(source: SourceConfig, path: Path) -> str | None:
+        """Clave de un archivo (None para directorios, que no se cachean)"""
+        if not path.is_file():
+            return None
+        stat = path.stat()
+        payload = json.dumps({
+            "path": str(path.resolve()),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "type": source.type,
+            "encoding": source.encoding,
+            "delimiter": source.delimiter,
+            "quotechar": source.quotechar,
+            "compression": source.compression,
+            "member": source.member,
+            "sheet": source.sheet,
+            "header_row": source.header_row,
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @property
+    def entries(self) -> dict[str, Any]:
+        if self._entries is None:
+            try:
+                self._entries = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def get(self, key: str | None) -> Any | None:
+        with self._lock:
+            return self.entries.get(key) if key else None
+
+    def put(self, key: str | None, value: Any) -> None:
+        if key:
+            with self._lock:
+                self.entries[key] = value
+
+    def save(self) -> None:
+        """Escribe el JSON de forma atómica (ignora errores: la caché es opcional)"""
+        with self._lock:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_suffix(f".tmp{os.getpid()}")
+                tmp_path.write_text(json.dumps(self.entries, indent=2), encoding="utf-8")
+                os.replace(tmp_path, self.path)
+            except OSError:
+                pass
+
+
+def read_source_header(source: SourceConfig, path: Path) -> list[str]:
+    """Lee solo los nombres de columna de una fuente según su tipo"""
+    try:
+        if source.type == "csv":
+            from recon.adapters.compressed import resolve_compression
+            from recon.adapters.csv_model import CsvSourceReader
+            reader = CsvSourceReader(path, encoding=source.encoding, delimiter=source.delimiter,
+                                     compression=resolve_compression(path, source.compression),
+                                     member=source.member, quotechar=source.quotechar)
+        elif source.type == "parquet":
+            from recon.adapters.parquet_source import ParquetSourceReader
+            reader = ParquetSourceReader(path)
+        elif source.type == "excel":
+            from recon.adapters.excel_source import ExcelSourceReader
+            reader = ExcelSourceReader(path, sheet=source.sheet, header_row=source.header_row)
+        elif source.type == "powerbi":
+            # Una consulta de metadatos (COLUMNSTATISTICS), sin leer filas
+            from recon.adapters.powerbi_dataset import reader_for_source
+            reader = reader_for_source(source)
+            try:
+                return reader.read_header()
+            finally:
+                reader.client.close()
+        else:
+            raise SchemaError(f"Unsupported source type '{source.type}'")
+        return reader.read_header()
+    except pd.errors.EmptyDataError:
+        return []
+    except SchemaError:
+        raise
+    except Exception as e:
+        raise SchemaError(f"Could not read header of {path}: {e}") from e
+
+
+def probe_sources(config: ProjectConfig, source_names: list[str] | None = None,
+                  cache: SchemaCache | None = None) -> dict[str, SourceSchema]:
+    """
+    Lee el esquema de las fuentes indicadas (por defecto todas).
+
+    Solo se lee el encabezado del CSV, el footer del Parquet o la primera fila
+    de la hoja Excel; nunca los datos. En fuentes glob o particionadas se lee
+    el primer archivo y se agregan las claves de partición.
+    """
+    # Import diferido: dialect depende de este módulo
+    from recon.core.dialect import DialectCache, needs_sniffing, resolve_dialect
+
+    dialects = DialectCache(cache.path.parent) if cache else None
+    schemas = {}
+    for name in source_names if source_names is not None else config.sources:
+        source = config.sources[name]
+        path = source.resolve_path(config.base_path)
+        schema = SourceSchema(source_name=name, path=str(path))
+        schemas[name] = schema
+
+        if source.type == "powerbi":
+            schema.path = source.path
+            try:
+                schema.columns = read_source_header(source, source.path)
+            except SchemaError as e:
+                schema.error = str(e)
+            continue
+
+        # Fuente multi-archivo: encabezado del primer archivo más las particiones
+        partition_keys: list[str] = []
+        if is_multi_file(source, config.base_path):
+            files = list_source_files(source, config.base_path)
+            if not files:
+                schema.error = f"No files match: {path}"
+                schema.found = False
+                continue
+            path = files[0].path
+            partition_keys = sorted({key for f in files for key in f.partitions})
+        elif not path.exists():
+            schema.error = f"Source file not found: {path}"
+            schema.found = False
+            continue
+
+        key = SchemaCache.make_key(source, path) if cache else None
+        cached = cache.get(key) if cache else None
+        if cached is None and needs_sniffing(source):
+            # Formato 'auto': se detecta antes de leer el encabezado
+            try:
+                source = resolve_dialect(source, path, dialects)
+            except Exception as e:
+                schema.error = f"Could not detect CSV format of {path}: {e}"
+                continue
+        if cached is not None:
+            header = list(cached)
+            schema.cached = True
+        else:
+            try:
+                header = read_source_header(source, path)
+            except SchemaError as e:
+                schema.error = str(e)
+                continue
+            if cache:
+                cache.put(key, header)
+        schema.columns = header + [k for k in partition_keys if k not in header]
+
+    if cache:
+        cache.save()
+    return schemas
+
+
+def check_columns(config: ProjectConfig,
+                  schemas: dict[str, SourceSchema]) -> list[SchemaIssue]:
+    """
+    Columnas referenciadas (key_columns, filter_columns, reglas y checks) que
+    no existen en el esquema de su fuente. Las fuentes sin esquema se omiten.
+    """
+    issues = []
+    for source_name, columns in column_references(config).items():
+        schema = schemas.get(source_name)
+        if schema is None or not schema.ok:
+            continue
+        available = set(schema.columns)
+        for column, referrers in columns.items():
+            if column not in available:
+                issues.append(SchemaIssue(source_name, column, referrers))
+    return issues
@@ -0,0 +1,137 @@
+"""
+Session Module - Shared source registry for a reconciliation run
+Registro de fuentes compartido: carga única y liberación por conteo de referencias
+"""
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import pandas as pd
+
+from recon.core.ingest import IngestEngine, IngestError, LoadResult, frame_bytes
+from recon.core.planner import SourcePlan
+
+
+def copy_on_write_enabled() -> bool:
+    """Copy-on-Write activo (siempre desde pandas 3.0; opción global en 2.x)"""
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    return bool(pd.get_option("mode.copy_on_write"))
+
+
+class SourceSession:
+    """
+    Registro de fuentes de una ejecución.
+
+    Cada fuente se carga una sola vez y se entrega a las reglas y checks como
+    vista de solo lectura: una modificación del consumidor nunca alcanza al
+    frame compartido. Con Copy-on-Write (siempre activo desde pandas 3.0) la
+    vista es una copia superficial; en pandas 2.x sin `mode.copy_on_write`
+    (el módulo no cambia esa opción global) es una copia completa. El número de consumidores de cada
+    fuente se toma del plan; cuando el último libera la fuente, el frame se
+    descarta para bajar la memoria pico.
+    """
+
+    def __init__(self, engine: IngestEngine, plan: dict[str, SourcePlan]):
+        self.engine = engine
+        self._lock = threading.Lock()
+        self._frames: dict[str, pd.DataFrame] = {}
+        self.errors: dict[str, IngestError] = {}
+        self.refcounts = {name: len(p.consumers) for name, p in plan.items()}
+        self.load_counts: dict[str, int] = {}
+        self.peak_frame_bytes = 0
+        self._held_bytes: dict[str, int] = {}
+
+    @property
+    def needed_sources(self) -> list[str]:
+        """Fuentes con al menos un consumidor pendiente"""
+        return [name for name, count in self.refcounts.items() if count > 0]
+
+    def preload(self, source_names: list[str] | None = None) -> LoadResult:
+        """Carga por adelantado (en paralelo según `jobs`) las fuentes con consumidores"""
+        names = [n for n in (source_names or self.needed_sources)
+                 if n not in self._frames and n not in self.errors]
+        result = self.engine.load_many(names)
+        with self._lock:
+            for name, frame in result.frames.items():
+                self._store(name, frame)
+            self.errors.update(result.errors)
+        return result
+
+    def _store(self, name: str, frame: pd.DataFrame) -> None:
+        self._frames[name] = frame
+        self.load_counts[name] = self.load_counts.get(name, 0) + 1
+        self._held_bytes[name] = frame_bytes(frame)
+        self.peak_frame_bytes = max(self.peak_frame_bytes, sum(self._held_bytes.values()))
+
+    def acquire(self, source_name: str) -> pd.DataFrame:
+        """
+        Vista de solo lectura de una fuente (la carga si aún no está en memoria).
+
+        Lanza IngestError si la fuente no pudo cargarse.
+        """
+        with self._lock:
+            if source_name in self.errors:
+                raise self.errors[source_name]
+            if source_name not in self._frames:
+                try:
+                    self._store(source_name, self.engine.load(source_name))
+                except IngestError as e:
+                    self.errors[source_name] = e
+                    raise
+            return self._frames[source_name].copy(deep=not copy_on_write_enabled())
+
+    def release(self, source_name: str) -> None:
+        """Un consumidor terminó con la fuente; se libera al llegar a cero"""
+        with self._lock:
+            if self.refcounts.get(source_name, 0) > 0:
+                self.refcounts[source_name] -= 1
+            if self.refcounts.get(source_name, 0) == 0:
+                self._frames.pop(source_name, None)
+                self._held_bytes.pop(source_name, None)
+
+    def iter_chunks(self, source_name: str) -> Iterator[pd.DataFrame]:
+        """
+        Lee una fuente por chunks sin retenerla (modo fuera de memoria).
+
+        Un error de carga queda registrado como en `acquire` y se propaga.
+        """
+        with self._lock:
+            if source_name in self.errors:
+                raise self.errors[source_name]
+            self.load_counts[source_name] = self.load_counts.get(source_name, 0) + 1
+        try:
+            yield from self.engine.iter_chunks(source_name)
+        except IngestError as e:
+            with self._lock:
+                self.errors[source_name] = e
+            raise
+
+    def is_loaded(self, source_name: str) -> bool:
+        return source_name in self._frames
+
+    @contextmanager
+    def use(self, *source_names: str,
+            consumers: int = 1) -> Iterator[list[pd.DataFrame | None]]:
+        """
+        Entrega vistas de varias fuentes y las libera al salir del bloque.
+
+        Las fuentes que no pudieron cargarse se entregan como None; la
+        referencia se libera igual para no retener las demás fuentes.
+        `consumers` es el número de consumidores del plan que atiende el
+        bloque (ej: todas las reglas de un grupo de servicios).
+        """
+        views = []
+        for name in source_names:
+            try:
+                views.append(self.acquire(name))
+            except IngestError:
+                views.append(None)
+        try:
+            yield views
+        finally:
+            del views
+            for name in source_names:
+                for _ in range(consumers):
+                    self.release(name)
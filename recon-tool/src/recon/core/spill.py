@@ -0,0 +1,190 @@
+"""
+Spill Module - Out-of-core entity comparison over hash-partitioned buckets
+Comparación fuera de memoria: particiones en disco por hash de la clave
+"""
+
+import math
+import pickle
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from recon.core.backends import ExecutionBackend
+from recon.core.config import ProjectConfig, ValidationRule
+from recon.core.ingest import concat_chunks, frame_bytes
+from recon.core.models import EntityComparison
+from recon.core.partitions import is_multi_file, list_source_files
+from recon.core.validators.entity_compare import compare_rule
+
+# Presupuesto por par de buckets si no se indica --max-memory
+DEFAULT_SPILL_MEMORY = 256 * 1024 ** 2
+
+# Bytes en memoria (pandas) por byte de archivo de texto, para estimar buckets
+MEMORY_EXPANSION = 4
+
+MAX_BUCKETS = 1024
+
+
+def source_bytes(config: ProjectConfig, source_name: str) -> int:
+    """Tamaño en disco de una fuente (suma de archivos si es multi-archivo)"""
+    source = config.sources.get(source_name)
+    if source is None:
+        return 0
+    path = source.resolve_path(config.base_path)
+    if is_multi_file(source, config.base_path):
+        return sum(f.path.stat().st_size for f in list_source_files(source, config.base_path))
+    if path.is_dir():
+        return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+    return path.stat().st_size if path.exists() else 0
+
+
+def bucket_count(input_bytes: int, max_memory: int) -> int:
+    """Buckets necesarios para que cada par quepa en `max_memory`"""
+    needed = math.ceil(input_bytes * MEMORY_EXPANSION / max(1, max_memory))
+    return max(1, min(MAX_BUCKETS, needed))
+
+
+def key_buckets(frame: pd.DataFrame, key_columns: list[str], buckets: int) -> np.ndarray:
+    """
+    Bucket de cada fila según el hash de sus claves normalizadas (texto sin
+    espacios, como en el cruce); -1 para filas con alguna clave nula.
+    """
+    keys = pd.DataFrame({k: frame[k].astype(str).str.strip() for k in key_columns})
+    hashes = pd.util.hash_pandas_object(keys, index=False).to_numpy()
+    result = (hashes % np.uint64(buckets)).astype(np.int64)
+    result[frame[key_columns].isna().any(axis=1).to_numpy()] = -1
+    return result
+
+
+class BucketSpill:
+    """
+    Un lado de la comparación repartido en archivos por bucket.
+
+    Cada chunk se divide por bucket y se agrega (pickle, conserva los dtypes)
+    al archivo del bucket, en el orden de lectura: la primera fila de cada
+    entidad dentro del bucket es también su primera fila en la fuente.
+    """
+
+    def __init__(self, directory: Path, side: str, key_columns: list[str],
+                 columns: list[str], buckets: int):
+        self.directory = Path(directory)
+        self.side = side
+        self.key_columns = key_columns
+        self.wanted = columns
+        self.buckets = buckets
+        self.columns: list[str] | None = None  # Columnas presentes en la fuente
+        self.template: pd.DataFrame | None = None  # Frame vacío con los dtypes de la fuente
+        self.rows = 0
+        self.bytes_spilled = 0
+
+    def _path(self, bucket: int) -> Path:
+        return self.directory / f"{self.side}_{bucket:04d}.pkl"
+
+    def write(self, chunk: pd.DataFrame) -> None:
+        if self.columns is None:
+            self.columns = [c for c in self.wanted if c in chunk.columns]
+            self.template = chunk[self.columns].iloc[:0].reset_index(drop=True)
+        if any(k not in chunk.columns for k in self.key_columns):
+            return
+        chunk = chunk[self.columns]
+        self.rows += len(chunk)
+        assigned = key_buckets(chunk, self.key_columns, self.buckets)
+        for bucket in np.unique(assigned[assigned >= 0]):
+            part = chunk[assigned == bucket]
+            with open(self._path(int(bucket)), "ab") as f:
+                pickle.dump(part, f, protocol=pickle.HIGHEST_PROTOCOL)
+            self.bytes_spilled += frame_bytes(part)
+
+    def empty(self) -> pd.DataFrame:
+        """Frame sin filas con las columnas (y dtypes) del lado"""
+        if self.template is None:
+            return pd.DataFrame(columns=self.columns or [])
+        return self.template.copy()
+
+    def read(self, bucket: int) -> pd.DataFrame:
+        """Filas del bucket (frame vacío con las columnas si no hay ninguna)"""
+        path = self._path(bucket)
+        parts = []
+        if path.exists():
+            with open(path, "rb") as f:
+                while True:
+                    try:
+                        parts.append(pickle.load(f))
+                    except EOFError:
+                        break
+            path.unlink()
+        if not parts:
+            return self.empty()
+        return concat_chunks(parts).reset_index(drop=True)
+
+
+def compare_rule_spilled(rule: ValidationRule, source_chunks: Iterator[pd.DataFrame],
+                         pbi_chunks: Iterator[pd.DataFrame], key_columns: list[str],
+                         directory: Path, buckets: int, default_tolerance: float = 0.01,
+                         backend: ExecutionBackend | None = None,
+                         stats: dict | None = None) -> list[EntityComparison]:
+    """
+    `compare_rule` sin materializar las fuentes completas.
+
+    Ambos lados se reparten por hash de la clave en `buckets` archivos; todas
+    las filas de una entidad caen en el mismo bucket, así que comparar bucket
+    a bucket y ordenar al final por clave produce el mismo resultado que la
+    comparación en memoria. La memoria pico es la de un par de buckets.
+    """
+    source_columns = key_columns + [m.source_field for m in rule.field_mappings] \
+        + list(rule.source_filters)
+    pbi_columns = key_columns + [m.pbi_field for m in rule.field_mappings] \
+        + list(rule.pbi_filters)
+    source_spill = BucketSpill(directory, "source", key_columns,
+                               list(dict.fromkeys(source_columns)), buckets)
+    pbi_spill = BucketSpill(directory, "pbi", key_columns,
+                            list(dict.fromkeys(pbi_columns)), buckets)
+    for chunk in source_chunks:
+        source_spill.write(chunk)
+    for chunk in pbi_chunks:
+        pbi_spill.write(chunk)
+
+    def _compare(source: pd.DataFrame, pbi: pd.DataFrame) -> list[EntityComparison]:
+        return compare_rule(rule, source, pbi, key_columns,
+                            default_tolerance=default_tolerance, backend=backend)
+
+    # Resultados a nivel de regla (claves o mapeos faltantes) no dependen de las filas
+    rule_level = _compare(source_spill.empty(), pbi_spill.empty())
+    if rule_level:
+        return rule_level
+
+    comparisons = []
+    peak = 0
+    for bucket in range(buckets):
+        source, pbi = source_spill.read(bucket), pbi_spill.read(bucket)
+        peak = max(peak, frame_bytes(source) + frame_bytes(pbi))
+        comparisons.extend(_compare(source, pbi))
+
+    if stats is not None:
+        stats.update(buckets=buckets, rows_spilled=source_spill.rows + pbi_spill.rows,
+                     bytes_spilled=source_spill.bytes_spilled + pbi_spill.bytes_spilled,
+                     peak_bucket_bytes=peak)
+    # Mismo orden que el cruce en memoria: por claves como texto
+    comparisons.sort(key=lambda c: [c.entity_filters[k] for k in key_columns])
+    return comparisons
+
+
+def distinct_key_frame(chunks: Iterator[pd.DataFrame], column: str,
+                       backend: ExecutionBackend) -> pd.DataFrame:
+    """
+    Claves distintas de una fuente leída por chunks, como frame de una columna.
+
+    Un check de integridad solo necesita el conjunto de claves de cada lado,
+    que suele ser mucho menor que la fuente; las claves ya vienen normalizadas.
+    """
+    keys: dict[str, None] = {}
+    columns: list[str] = []
+    for chunk in chunks:
+        columns = list(chunk.columns)
+        if column in chunk.columns:
+            keys.update(dict.fromkeys(backend.distinct_keys(chunk, column).tolist()))
+    if column not in columns:
+        return pd.DataFrame(columns=columns)
+    return pd.DataFrame({column: pd.Series(list(keys), dtype=object)})
@@ -0,0 +1,72 @@
+"""
+Table Module - Arrow-backed in-memory tables
+Frames respaldados por arrays Arrow (pandas ArrowDtype) a lo largo del pipeline
+"""
+
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - dependencia opcional
+    pa = None
+
+
+# numpy: dtypes clásicos de pandas; pyarrow: columnas ArrowDtype sobre buffers Arrow
+DTYPE_BACKENDS = ("numpy", "pyarrow")
+
+
+def check_backend(dtype_backend: str) -> None:
+    """Valida el backend pedido (pyarrow requiere la dependencia opcional)"""
+    if dtype_backend not in DTYPE_BACKENDS:
+        raise ValueError(f"Invalid dtype_backend: {dtype_backend!r} "
+                         f"(expected one of: {', '.join(DTYPE_BACKENDS)})")
+    if dtype_backend == "pyarrow" and pa is None:
+        raise ImportError("dtype_backend 'pyarrow' requires pyarrow "
+                          "(pip install 'recon-tool[arrow]')")
+
+
+def arrow_types_mapper(arrow_type) -> pd.ArrowDtype | None:
+    """
+    Tipo pandas para cada tipo Arrow al convertir un batch.
+
+    Los diccionarios siguen siendo `category` (códigos enteros), que es lo
+    que esperan los validadores; el resto se envuelve sin copiar como ArrowDtype.
+    """
+    if pa.types.is_dictionary(arrow_type):
+        return None
+    return pd.ArrowDtype(arrow_type)
+
+
+def batch_to_frame(batch, dtype_backend: str = "numpy") -> pd.DataFrame:
+    """
+    RecordBatch → DataFrame.
+
+    Con `pyarrow` las columnas referencian los buffers del batch (por ejemplo,
+    los de un archivo mapeado en memoria) en lugar de copiarlos a numpy.
+    """
+    if dtype_backend == "pyarrow":
+        return batch.to_pandas(types_mapper=arrow_types_mapper)
+    return batch.to_pandas()
+
+
+def is_arrow_backed(series: pd.Series) -> bool:
+    return isinstance(series.dtype, (pd.ArrowDtype, pd.CategoricalDtype))
+
+
+def to_backend(frame: pd.DataFrame, dtype_backend: str = "numpy") -> pd.DataFrame:
+    """
+    Lleva las columnas de un chunk al backend pedido.
+
+    Solo se convierten las columnas que no están ya en Arrow (texto de Excel,
+    columnas tipadas por el `schema`); las categóricas se conservan.
+    """
+    if dtype_backend != "pyarrow":
+        return frame
+    pending = [c for c in frame.columns if not is_arrow_backed(frame[c])]
+    if not pending:
+        return frame
+    table = pa.Table.from_pandas(frame[pending], preserve_index=False)
+    converted = table.to_pandas(types_mapper=arrow_types_mapper)
+    converted.index = frame.index
+    return frame.assign(**{c: converted[c] for c in pending})
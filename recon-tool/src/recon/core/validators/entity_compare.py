@@ -2,3 +2,254 @@
 Entity Compare Validator
 Validador de comparación entidad a entidad (ej: Site 146, Verizon)
 """
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from recon.core.backends import ExecutionBackend, get_backend
+from recon.core.config import FieldMapping, ValidationRule
+from recon.core.models import EntityComparison, Severity, ValidationResult, ValidationStatus
+
+SUPPORTED_COMPARE_TYPES = ("exact", "numeric", "substring")
+
+# Caracteres de formato que se ignoran al leer montos ($1,234.50)
+_NUMERIC_NOISE = r"[$,\s]"
+
+
+def _gather(frame: pd.DataFrame, column: str, rows: pd.Series) -> pd.Series:
+    """
+    Valores de `column` en las posiciones `rows` (nulo donde la entidad no
+    existe de ese lado). Conserva el tipo de la columna original.
+    """
+    present = rows.notna().to_numpy()
+    if column not in frame.columns or not present.any():
+        return pd.Series(np.nan, index=range(len(rows)), dtype=object)
+    positions = rows.fillna(0).astype("int64").to_numpy()
+    values = frame[column].iloc[positions].reset_index(drop=True)
+    return values.where(present)
+
+
+def to_numeric(series: pd.Series) -> pd.Series:
+    """Convierte a número ignorando símbolos de moneda y separadores de miles"""
+    if pd.api.types.is_numeric_dtype(series):
+        return series.astype(float)
+    cleaned = series.astype("string").str.replace(_NUMERIC_NOISE, "", regex=True)
+    return pd.to_numeric(cleaned, errors="coerce").astype(float)
+
+
+def _field_statuses(mapping: FieldMapping, source_values: pd.Series, pbi_values: pd.Series,
+                    tolerance: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Clasifica vectorialmente un campo para entidades presentes en ambos lados.
+
+    Retorna (estado, mensaje) por fila.
+    """
+    source_null = source_values.isna().to_numpy()
+    pbi_null = pbi_values.isna().to_numpy()
+
+    if mapping.compare_type == "numeric":
+        source_num = to_numeric(source_values)
+        pbi_num = to_numeric(pbi_values)
+        unparsable = ((source_num.isna() & ~source_values.isna())
+                      | (pbi_num.isna() & ~pbi_values.isna())).to_numpy(dtype=bool)
+        equal = ((source_num - pbi_num).abs() <= tolerance + 1e-9).to_numpy(dtype=bool)
+        match_message = f"Values match within tolerance {tolerance}"
+    else:
+        source_text = source_values.astype("string").str.strip()
+        pbi_text = pbi_values.astype("string").str.strip()
+        unparsable = np.zeros(len(source_values), dtype=bool)
+        if mapping.compare_type == "substring":
+            equal = np.array([
+                p in s if isinstance(s, str) and isinstance(p, str) else False
+                for s, p in zip(source_text.tolist(), pbi_text.tolist(), strict=True)
+            ], dtype=bool)
+            match_message = "PBI value found in source value"
+        else:
+            equal = (source_text == pbi_text).fillna(False).to_numpy(dtype=bool)
+            match_message = "Values match exactly"
+
+    conditions = [
+        source_null & pbi_null,
+        pbi_null,
+        source_null,
+        unparsable,
+        equal,
+    ]
+    statuses = np.select(conditions, [
+        ValidationStatus.NOT_VERIFIABLE.value,
+        ValidationStatus.MISSING_IN_PBI.value,
+        ValidationStatus.MISSING_IN_SOURCE.value,
+        ValidationStatus.NOT_VERIFIABLE.value,
+        ValidationStatus.MATCH.value,
+    ], default=ValidationStatus.MISMATCH.value)
+    messages = np.select(conditions, [
+        "No value on either side",
+        "Value present in source, empty in PBI",
+        "Value present in PBI, empty in source",
+        "Value is not numeric",
+        match_message,
+    ], default="Values differ")
+    return statuses, messages
+
+
+def _python_value(value: Any) -> Any:
+    """Convierte escalares numpy/pandas a tipos nativos (None para nulos)"""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    return value.item() if hasattr(value, "item") else value
+
+
+def compare_rule(rule: ValidationRule, source: pd.DataFrame, pbi: pd.DataFrame,
+                 key_columns: list[str], default_tolerance: float = 0.01,
+                 entity_type: str | None = None,
+                 backend: ExecutionBackend | None = None) -> list[EntityComparison]:
+    """
+    Compara entidad por entidad los campos mapeados de una regla.
+
+    Cada entidad (valor de `key_columns`) genera un `EntityComparison` con un
+    `ValidationResult` por campo mapeado. El motor de ejecución (pandas por
+    defecto) filtra, agrupa y cruza las entidades; aquí solo se toman los
+    campos mapeados de las filas elegidas. Los estados posibles son:
+
+    - MATCH / MISMATCH: ambos lados tienen valor
+    - MISSING_IN_PBI / MISSING_IN_SOURCE: la entidad o el valor falta de un lado
+    - NOT_VERIFIABLE: sin valores, valor no numérico o entidad duplicada
+    - RULE_NOT_DEFINED: el `compare_type`/`transform` del mapeo no está soportado
+    """
+    entity_type = entity_type or ",".join(key_columns)
+    rule_level = rule_level_comparisons(rule, source, pbi, key_columns, entity_type)
+    if rule_level is not None:
+        return rule_level
+
+    backend = backend or get_backend()
+    merged = backend.match_entities(source, pbi, key_columns,
+                                    rule.source_filters, rule.pbi_filters)
+    return compare_matched(rule, merged, source, pbi, key_columns,
+                           default_tolerance=default_tolerance, entity_type=entity_type)
+
+
+def rule_level_comparisons(rule: ValidationRule, source: pd.DataFrame, pbi: pd.DataFrame,
+                           key_columns: list[str],
+                           entity_type: str) -> list[EntityComparison] | None:
+    """
+    Resultado único de una regla que no puede compararse por entidad (claves
+    ausentes o sin mapeos); None si la regla es comparable.
+    """
+    filters_base = {"service_type": rule.service_type}
+    missing_keys = [k for k in key_columns
+                    if k not in source.columns or k not in pbi.columns]
+    if not key_columns or missing_keys:
+        return [EntityComparison(
+            entity_type=entity_type,
+            entity_id=rule.service_type,
+            entity_filters=filters_base,
+            validations=[ValidationResult(
+                status=ValidationStatus.NOT_VERIFIABLE,
+                field_name=",".join(missing_keys or key_columns) or "key_columns",
+                source_value=None,
+                pbi_value=None,
+                message="Entity key columns not available on both sides",
+                severity=Severity.WARNING
+            )]
+        )]
+
+    mappings = rule.field_mappings
+    if not mappings:
+        return [EntityComparison(
+            entity_type=entity_type,
+            entity_id=rule.service_type,
+            entity_filters=filters_base,
+            validations=[ValidationResult(
+                status=ValidationStatus.RULE_NOT_DEFINED,
+                field_name="field_mappings",
+                source_value=None,
+                pbi_value=None,
+                message=f"Rule '{rule.service_type}' has no field mappings",
+                severity=Severity.WARNING
+            )]
+        )]
+
+    return None
+
+
+def compare_matched(rule: ValidationRule, merged: pd.DataFrame, source: pd.DataFrame,
+                    pbi: pd.DataFrame, key_columns: list[str], default_tolerance: float = 0.01,
+                    entity_type: str | None = None) -> list[EntityComparison]:
+    """
+    Compara los campos mapeados de entidades ya cruzadas.
+
+    `merged` tiene el formato de `ExecutionBackend.match_entities` (claves,
+    `s_row`/`sn`, `p_row`/`pn`), ordenado por clave.
+    """
+    entity_type = entity_type or ",".join(key_columns)
+    filters_base = {"service_type": rule.service_type}
+    mappings = rule.field_mappings
+
+    in_source = merged["s_row"].notna().to_numpy()
+    in_pbi = merged["p_row"].notna().to_numpy()
+    ambiguous = ((merged["sn"].fillna(0) > 1) | (merged["pn"].fillna(0) > 1)).to_numpy()
+
+    per_field = []
+    for mapping in mappings:
+        source_values = _gather(source, mapping.source_field, merged["s_row"])
+        pbi_values = _gather(pbi, mapping.pbi_field, merged["p_row"])
+        tolerance = mapping.tolerance if mapping.tolerance is not None else default_tolerance
+
+        if mapping.compare_type not in SUPPORTED_COMPARE_TYPES or mapping.transform:
+            unsupported = mapping.transform and f"transform '{mapping.transform}'" \
+                or f"compare_type '{mapping.compare_type}'"
+            statuses = np.full(len(merged), ValidationStatus.RULE_NOT_DEFINED.value, dtype=object)
+            messages = np.full(len(merged), f"No comparison defined for {unsupported}",
+                               dtype=object)
+        elif mapping.source_field not in source.columns or mapping.pbi_field not in pbi.columns:
+            side, column = ("source", mapping.source_field) \
+                if mapping.source_field not in source.columns else ("PBI", mapping.pbi_field)
+            statuses = np.full(len(merged), ValidationStatus.NOT_VERIFIABLE.value, dtype=object)
+            messages = np.full(len(merged), f"Column '{column}' not found in {side}",
+                               dtype=object)
+        else:
+            statuses, messages = _field_statuses(mapping, source_values, pbi_values, tolerance)
+            statuses = statuses.astype(object)
+            messages = messages.astype(object)
+
+        # Presencia de la entidad y duplicados prevalecen sobre la comparación de valores
+        statuses[~in_pbi] = ValidationStatus.MISSING_IN_PBI.value
+        messages[~in_pbi] = "Entity exists in source, not in PBI"
+        statuses[~in_source] = ValidationStatus.MISSING_IN_SOURCE.value
+        messages[~in_source] = "Entity exists in PBI, not in source"
+        both_ambiguous = ambiguous & in_source & in_pbi
+        statuses[both_ambiguous] = ValidationStatus.NOT_VERIFIABLE.value
+        messages[both_ambiguous] = "Multiple rows for entity; cannot pair values"
+
+        per_field.append((
+            mapping, statuses, messages,
+            source_values.tolist(), pbi_values.tolist(),
+            tolerance if mapping.compare_type == "numeric" else None
+        ))
+
+    keys = merged[key_columns].astype(str).to_numpy()
+    comparisons = []
+    for row in range(len(merged)):
+        key_values = keys[row].tolist()
+        validations = []
+        for mapping, statuses, messages, source_values, pbi_values, tolerance in per_field:
+            status = ValidationStatus(statuses[row])
+            validations.append(ValidationResult(
+                status=status,
+                field_name=mapping.pbi_field or mapping.source_field,
+                source_value=_python_value(source_values[row]),
+                pbi_value=_python_value(pbi_values[row]),
+                message=str(messages[row]),
+                severity=Severity.INFO if status == ValidationStatus.MATCH else Severity.WARNING,
+                tolerance_used=tolerance,
+                metadata={"source_field": mapping.source_field}
+            ))
+        comparisons.append(EntityComparison(
+            entity_type=entity_type,
+            entity_id="|".join(key_values),
+            entity_filters={**dict(zip(key_columns, key_values, strict=True)), **filters_base},
+            validations=validations
+        ))
+    return comparisons
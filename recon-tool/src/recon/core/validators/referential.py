@@ -2,3 +2,60 @@
 Referential Integrity Validator
 Validador de integridad referencial entre tablas
 """
+
+
+import pandas as pd
+
+from recon.core.backends import ExecutionBackend, get_backend
+from recon.core.config import IntegrityCheck
+from recon.core.models import IntegrityCheckResult, Severity, ValidationStatus
+
+# Claves huérfanas conservadas como muestra en el resultado
+ORPHAN_SAMPLE_SIZE = 50
+
+
+def check_referential_integrity(check: IntegrityCheck, source: pd.DataFrame,
+                                target: pd.DataFrame,
+                                backend: ExecutionBackend | None = None
+                                ) -> IntegrityCheckResult:
+    """
+    Verifica que cada clave de `source_key` exista en `target_key`.
+
+    - MATCH: todas las claves del source existen en el target
+    - MISMATCH: hay claves huérfanas (se guarda una muestra)
+    - NOT_VERIFIABLE: falta alguna columna o el source no tiene claves
+    """
+    severity = Severity(check.severity) if check.severity in Severity.__members__ \
+        else Severity.WARNING
+
+    def _result(status: ValidationStatus, total: int = 0, matched: int = 0,
+                orphans: list[str] | None = None) -> IntegrityCheckResult:
+        return IntegrityCheckResult(
+            check_name=check.name,
+            source_table=check.source_table,
+            target_table=check.target_table,
+            source_key=check.source_key,
+            target_key=check.target_key,
+            status=status,
+            total_source_keys=total,
+            matched_keys=matched,
+            missing_in_target=total - matched,
+            orphan_keys=orphans or [],
+            severity=severity
+        )
+
+    if check.source_key not in source.columns or check.target_key not in target.columns:
+        return _result(ValidationStatus.NOT_VERIFIABLE)
+
+    backend = backend or get_backend()
+    source_keys = backend.distinct_keys(source, check.source_key)
+    if source_keys.empty:
+        return _result(ValidationStatus.NOT_VERIFIABLE)
+
+    target_keys = backend.distinct_keys(target, check.target_key)
+    found = source_keys.isin(target_keys)
+    matched = int(found.sum())
+    orphans = sorted(source_keys[~found].tolist())[:ORPHAN_SAMPLE_SIZE]
+
+    status = ValidationStatus.MATCH if matched == len(source_keys) else ValidationStatus.MISMATCH
+    return _result(status, len(source_keys), matched, orphans)
@@ -0,0 +1,124 @@
+"""
+Service Unpivot - Wide source vs. long PBI comparison in a single join
+Compara de una vez todas las reglas de servicio de una fuente ancha (una
+columna por servicio) contra una tabla PBI larga (una fila por servicio)
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+from recon.core.backends import ExecutionBackend, get_backend
+from recon.core.config import ValidationRule
+from recon.core.models import EntityComparison
+from recon.core.validators.entity_compare import (
+    compare_matched,
+    compare_rule,
+    rule_level_comparisons,
+)
+
+
+@dataclass
+class ServiceGroup:
+    """
+    Reglas que comparten fuente, tabla PBI y filtros de fuente, y que solo se
+    diferencian por el valor de una misma columna de servicio en PBI
+    (ej: `Service_Type: 'Broadband'` / `'DIA'` / ...).
+    """
+    source_name: str
+    pbi_source: str
+    service_column: str
+    rules: list[ValidationRule] = field(default_factory=list)
+
+    def value(self, rule: ValidationRule) -> str:
+        """Valor de servicio de una regla, normalizado como las claves"""
+        return str(rule.pbi_filters[self.service_column]).strip()
+
+
+def _service_column(rule: ValidationRule) -> str | None:
+    """Columna del único filtro PBI de igualdad de la regla (None si no aplica)"""
+    if len(rule.pbi_filters) != 1:
+        return None
+    column, value = next(iter(rule.pbi_filters.items()))
+    if isinstance(value, (list, tuple, set, dict)) or value is None:
+        return None
+    return column
+
+
+def plan_service_groups(rules: Iterable[ValidationRule],
+                        key_columns: dict[str, list[str]]) -> list[ServiceGroup]:
+    """
+    Agrupa las reglas que pueden resolverse con un único cruce por
+    (claves, columna de servicio). Solo se devuelven grupos de dos o más
+    reglas; `key_columns` son las claves de cada fuente.
+    """
+    groups: dict[tuple, ServiceGroup] = {}
+    for rule in rules:
+        column = _service_column(rule)
+        if not rule.source_name or not rule.pbi_source or not rule.field_mappings \
+                or column is None or column in key_columns.get(rule.source_name, []):
+            continue
+        group_key = (rule.source_name, rule.pbi_source, column,
+                     tuple(sorted((k, repr(v)) for k, v in rule.source_filters.items())))
+        group = groups.setdefault(group_key, ServiceGroup(rule.source_name, rule.pbi_source,
+                                                          column))
+        # Dos reglas con el mismo servicio no pueden separarse después del cruce
+        if all(group.value(r) != group.value(rule) for r in group.rules):
+            group.rules.append(rule)
+    return [group for group in groups.values() if len(group.rules) > 1]
+
+
+def compare_service_group(group: ServiceGroup, source: pd.DataFrame, pbi: pd.DataFrame,
+                          key_columns: list[str], default_tolerance: float = 0.01,
+                          backend: ExecutionBackend | None = None
+                          ) -> dict[str, list[EntityComparison]]:
+    """
+    Resultados de cada regla del grupo (por `service_type`), idénticos a
+    `compare_rule` regla por regla.
+
+    Las entidades de la fuente se agrupan una sola vez y se despivotan: una
+    fila por (entidad, servicio). Del lado PBI se agrupan juntas las filas de
+    todos los servicios del grupo, y ambos lados se cruzan en un único join
+    por (claves, columna de servicio). Cada regla toma después su tramo del
+    cruce, ya ordenado por clave, y compara sus campos mapeados.
+    """
+    backend = backend or get_backend()
+    entity_type = ",".join(key_columns)
+    results: dict[str, list[EntityComparison]] = {}
+    pending = []
+    for rule in group.rules:
+        rule_level = rule_level_comparisons(rule, source, pbi, key_columns, entity_type)
+        if rule_level is not None:
+            results[rule.service_type] = rule_level
+        else:
+            pending.append(rule)
+
+    column = group.service_column
+    if column not in pbi.columns:
+        # Sin columna de servicio cada regla descarta todo PBI; no hay nada que agrupar
+        for rule in pending:
+            results[rule.service_type] = compare_rule(rule, source, pbi, key_columns,
+                                                      default_tolerance=default_tolerance,
+                                                      backend=backend)
+        return results
+    if not pending:
+        return results
+
+    values = [group.value(rule) for rule in pending]
+    source_rows = backend.entity_rows(source, key_columns, pending[0].source_filters, "s")
+    long_source = pd.concat([source_rows.assign(**{column: value}) for value in values],
+                            ignore_index=True)
+    pbi_rows = backend.entity_rows(
+        pbi, key_columns + [column],
+        {column: [str(rule.pbi_filters[column]) for rule in pending]}, "p"
+    )
+    merged = backend.join_entities(long_source, pbi_rows, key_columns + [column])
+
+    services = merged[column].astype(str).to_numpy()
+    for rule, value in zip(pending, values, strict=True):
+        part = merged[services == value].drop(columns=column).reset_index(drop=True)
+        results[rule.service_type] = compare_matched(rule, part, source, pbi, key_columns,
+                                                     default_tolerance=default_tolerance,
+                                                     entity_type=entity_type)
+    return results
@@ -130,18 +130,27 @@ class MarkdownReporter:
         if not report.sources_loaded:
             return """## 📁 Fuentes de Datos
 
-*No se cargaron fuentes (Sprint 0 skeleton)*
+*No se cargaron fuentes*
 
 ---"""
         
         rows = []
         for source_name, row_count in report.sources_loaded.items():
-            rows.append(f"| {source_name} | {row_count:,} |")
+            stats = report.source_stats.get(source_name, {})
+            rows_per_second = stats.get("rows_per_second")
+            peak_mb = stats.get("peak_frame_bytes", 0) / (1024 ** 2)
+            throughput = f"{rows_per_second:,.0f}" if rows_per_second is not None else "*N/A*"
+            peak = f"{peak_mb:,.1f} MB" if stats else "*N/A*"
+            columns = (
+                f"{stats['columns_loaded']}/{stats['columns_total']}"
+                if "columns_total" in stats else "*N/A*"
+            )
+            rows.append(f"| {source_name} | {row_count:,} | {columns} | {throughput} | {peak} |")
         
         return f"""## 📁 Fuentes de Datos Cargadas
 
-| Fuente | Registros |
-|--------|-----------|
+| Fuente | Registros | Columnas | Filas/s | Pico de frames |
+|--------|-----------|----------|---------|----------------|
 {chr(10).join(rows)}
 
 ---"""
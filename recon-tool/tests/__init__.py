@@ -1,4 +1,25 @@
 """
-Tests for Rules Engine
-Pruebas del motor de reglas
+Tests - Shared helpers
+Utilidades compartidas por las pruebas
 """
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from recon.core.config import ProjectConfig, SourceConfig
+
+
+def project_config(base: Path, *sources: SourceConfig, **fields) -> ProjectConfig:
+    """ProjectConfig mínimo de pruebas con las fuentes dadas, indexadas por nombre"""
+    return ProjectConfig(
+        name='test',
+        description='',
+        version='0.1.0',
+        sources_base_path=str(base),
+        pbi_model_path='',
+        reports_output_path='',
+        sources={source.name: source for source in sources},
+        **fields
+    )
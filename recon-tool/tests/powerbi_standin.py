@@ -0,0 +1,229 @@
+"""
+Power BI Stand-in - Local executeQueries endpoint for tests and benchmarks
+Servidor local que emula la API executeQueries sobre DataFrames en memoria
+"""
+
+import json
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import pandas as pd
+
+from recon.adapters.powerbi_dataset import MAX_QUERY_ROWS
+
+_STRING = r'"(?:[^"]|"")*"'
+_DATE = r'DATE\((\d+), (\d+), (\d+)\)(?: \+ TIME\((\d+), (\d+), (\d+)\))?'
+_LITERAL = re.compile(
+    rf'{_STRING}|{_DATE}|BLANK\(\)|TRUE\(\)|FALSE\(\)|-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?')
+_TABLE = re.compile(r"SELECTCOLUMNS\('((?:[^']|'')*)'")
+_SELECTED = re.compile(rf"({_STRING}), '(?:[^']|'')*'\[((?:[^\]]|\]\])*)\]")
+_TREATAS = re.compile(r"TREATAS\(\{(.*?)\}, '(?:[^']|'')*'\[((?:[^\]]|\]\])*)\]\)")
+_AFTER = re.compile(rf"\[((?:[^\]]|\]\])*)\] > ({_LITERAL.pattern})\)")
+_TOPN = re.compile(r"^EVALUATE TOPN\((\d+), .*, \[((?:[^\]]|\]\])*)\], ASC\) ORDER BY")
+_COLUMNSTATISTICS = re.compile(rf"COLUMNSTATISTICS\(\), \[Table Name\] = ({_STRING})\)")
+
+
+def _literal(token: str) -> Any:
+    if token.startswith('"'):
+        return token[1:-1].replace('""', '"')
+    if token == "BLANK()":
+        return None
+    if token in ("TRUE()", "FALSE()"):
+        return token == "TRUE()"
+    moment = re.fullmatch(_DATE, token)
+    if moment:
+        return pd.Timestamp(*(int(part or 0) for part in moment.groups()))
+    return float(token) if any(c in token for c in ".eE") else int(token)
+
+
+def _sort_key(value: Any) -> tuple:
+    """Orden de DAX: BLANK primero y texto sin distinguir mayúsculas"""
+    if isinstance(value, pd.Timestamp):
+        value = _json_value(value)
+    if value is None:
+        return (0, "")
+    if isinstance(value, str):
+        return (1, value.casefold())
+    return (1, value)
+
+
+class _QueryError(Exception):
+    pass
+
+
+class StandInDataset:
+    """
+    Dataset de Power BI simulado: tablas en DataFrames servidas por HTTP/1.1
+    keep-alive en `127.0.0.1`.
+
+    Interpreta solo las consultas DAX que genera
+    `recon.adapters.powerbi_dataset` (SELECTCOLUMNS, TREATAS, keyset sobre
+    TOPN y COLUMNSTATISTICS). Cuenta requests y conexiones TCP, puede
+    agregar latencia por request y rechaza, como el servicio, las consultas
+    que superan `max_rows`.
+
+        with StandInDataset({'factQuotes': frame}) as dataset:
+            reader = DatasetSourceReader(dataset.url, 'factQuotes')
+    """
+
+    def __init__(self, tables: dict[str, pd.DataFrame], latency: float = 0.0,
+                 max_rows: int = MAX_QUERY_ROWS, token: str | None = None):
+        self.tables = tables
+        self.latency = latency
+        self.max_rows = max_rows
+        self.token = token
+        self.requests = 0
+        self.connections = 0
+        self.queries: list[str] = []
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1.0/myorg/datasets/standin"
+
+    def start(self) -> "StandInDataset":
+        dataset = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive: la conexión sigue abierta
+            # Encabezados y cuerpo van en writes separados: sin TCP_NODELAY, Nagle y
+            # el ACK diferido del cliente agregan ~40 ms a cada respuesta
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with dataset._lock:
+                    dataset.connections += 1
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                status, payload = dataset._handle(self.path, self.headers, body)
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        # Intervalo de sondeo corto: stop() no espera el medio segundo por defecto
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,),
+                                        daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "StandInDataset":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _handle(self, path: str, headers, body: bytes) -> tuple[int, dict]:
+        with self._lock:
+            self.requests += 1
+        if self.latency:
+            time.sleep(self.latency)
+        if not path.endswith("/executeQueries"):
+            return 404, {"error": {"code": "NotFound", "message": path}}
+        if self.token and headers.get("Authorization") != f"Bearer {self.token}":
+            return 401, {"error": {"code": "TokenExpired"}}
+        query = json.loads(body)["queries"][0]["query"]
+        with self._lock:
+            self.queries.append(query)
+        try:
+            rows = self.evaluate(query)
+        except _QueryError as e:
+            return 400, {"error": {"code": "DatasetExecuteQueriesError",
+                                   "pbi.error": {"details": [{"detail": {"value": str(e)}}]}}}
+        return 200, {"results": [{"tables": [{"rows": rows}]}]}
+
+    def evaluate(self, query: str) -> list[dict[str, Any]]:
+        """Filas de una consulta DAX generada por el adaptador"""
+        statistics = _COLUMNSTATISTICS.search(query)
+        if statistics:
+            name = _literal(statistics.group(1))
+            frame = self._table(name)
+            return [self._statistics(name, frame, column) for column in frame.columns]
+
+        table = _TABLE.search(query)
+        if table is None:
+            raise _QueryError(f"Unsupported query: {query[:80]}")
+        frame = self._table(table.group(1).replace("''", "'"))
+        selected = [(_literal(name), column.replace("]]", "]"))
+                    for name, column in _SELECTED.findall(query)]
+        for _, column in selected:
+            if column not in frame.columns:
+                raise _QueryError(f"Column '{column}' cannot be found")
+
+        mask = pd.Series(True, index=frame.index)
+        for values, column in _TREATAS.findall(query):
+            # Comparación con tipo, como el motor: "146" no coincide con el entero 146
+            allowed = [_literal(match.group(0)) for match in _LITERAL.finditer(values)]
+            mask &= frame[column].isin(allowed)
+        names = [f"[{name}]" for name, _ in selected]
+        records = [
+            {name: _json_value(value) for name, value in zip(names, row, strict=True)}
+            for row in frame.loc[mask, [c for _, c in selected]].itertuples(index=False)
+        ]
+
+        topn = _TOPN.search(query)
+        if topn:
+            limit, key = int(topn.group(1)), f"[{topn.group(2).replace(']]', ']')}]"
+            after = _AFTER.search(query)
+            if after:
+                bound = _sort_key(_literal(after.group(2)))
+                records = [r for r in records if _sort_key(r[key]) > bound]
+            records.sort(key=lambda r: _sort_key(r[key]))
+            if len(records) > limit:
+                # TOPN incluye todos los empates del último valor
+                last = _sort_key(records[limit - 1][key])
+                records = [r for r in records if _sort_key(r[key]) <= last]
+
+        if len(records) > self.max_rows:
+            raise _QueryError(f"The result set of a query exceeded the maximum of "
+                              f"{self.max_rows} rows")
+        return records
+
+    @staticmethod
+    def _statistics(name: str, frame: pd.DataFrame, column: str) -> dict[str, Any]:
+        """Fila de COLUMNSTATISTICS() con Min/Max en el formato JSON del servicio"""
+        values = sorted((v for v in frame[column] if _json_value(v) is not None), key=_sort_key)
+        return {"[Table Name]": name, "[Column Name]": column,
+                "[Min]": _json_value(values[0]) if values else None,
+                "[Max]": _json_value(values[-1]) if values else None}
+
+    def _table(self, name: str) -> pd.DataFrame:
+        if name not in self.tables:
+            raise _QueryError(f"Table '{name}' cannot be found")
+        return self.tables[name]
+
+
+def _json_value(value: Any) -> Any:
+    """Valor de pandas/numpy como valor JSON (NaN → null)"""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if hasattr(value, "item"):
+        return value.item()
+    return value
@@ -0,0 +1,155 @@
+"""
+Tests for Execution Backends
+Pruebas de paridad entre los motores pandas, Polars y DuckDB
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from recon.core.backends import BackendError, get_backend
+from recon.core.config import ConfigLoader, FieldMapping, IntegrityCheck, ValidationRule
+from recon.core.ingest import IngestEngine, IngestOptions
+from recon.core.models import ReconciliationReport
+from recon.core.planner import build_plan
+from recon.core.rules import RulesEngine
+from recon.core.session import SourceSession
+from recon.core.validators.entity_compare import compare_rule
+from recon.core.validators.referential import check_referential_integrity
+
+CONFIG_PATH = Path(__file__).parent.parent / 'configs' / 'mvh.yaml'
+
+def _engine_params():
+    """Motores disponibles; los no instalados se omiten"""
+    params = []
+    for name in ('polars', 'duckdb'):
+        try:
+            __import__(name)
+            params.append(name)
+        except ImportError:
+            skip = pytest.mark.skip(reason=f'{name} not installed')
+            params.append(pytest.param(name, marks=skip))
+    return params
+
+
+def _rule(**kwargs) -> ValidationRule:
+    defaults = {
+        'service_type': 'Broadband',
+        'source_name': 'sharepoint',
+        'pbi_source': 'fact_quotes',
+        'pbi_filters': {'Service_Type': 'Broadband'},
+        'field_mappings': [
+            FieldMapping(source_field='Broadband Circuit MRC $/Month', pbi_field='Total MRC',
+                         compare_type='numeric', tolerance=0.01),
+            FieldMapping(source_field='Vendor', pbi_field='Vendor'),
+            FieldMapping(source_field='Install_Date', pbi_field='Install_Date'),
+        ]
+    }
+    defaults.update(kwargs)
+    return ValidationRule(**defaults)
+
+
+def _frames() -> tuple[pd.DataFrame, pd.DataFrame]:
+    source = pd.DataFrame({
+        'Site_Location_Key': ['146', ' 147', '148', '149', None, '151', '151'],
+        'Vendor': ['Verizon', 'ATT', 'Verizon', 'Verizon', 'ATT', 'ATT', 'ATT'],
+        'Broadband Circuit MRC $/Month': [1069.0, 50.0, np.nan, 10.0, 1.0, 2.0, 3.0],
+        'Install_Date': pd.to_datetime(['2024-01-15', None, '2024-02-01', '2024-03-01',
+                                        None, None, None]),
+    })
+    pbi = pd.DataFrame({
+        'Site_Location_Key': ['146', '147 ', '148', '150', '146', '151'],
+        'Service_Type': ['Broadband', 'Broadband', 'Broadband', 'Broadband', 'DIA', 'Broadband'],
+        'Vendor': ['Verizon', 'Verizon', 'Verizon', 'ATT', 'Verizon', 'ATT'],
+        'Total MRC': ['1069.004', '60', '10', '5', '933.48', '2'],
+        'Install_Date': pd.to_datetime(['2024-01-15', None, '2024-02-02', None, None, None]),
+    })
+    return source, pbi
+
+
+def _dump(comparisons) -> list[dict]:
+    return [c.to_dict() for c in comparisons]
+
+
+class TestBackendParity:
+    """Test suite asserting every engine yields the pandas results"""
+
+    @pytest.mark.parametrize('engine', _engine_params())
+    @pytest.mark.parametrize('encode', [False, True])
+    def test_compare_rule_parity(self, engine, encode):
+        source, pbi = _frames()
+        if encode:
+            source = source.astype({'Site_Location_Key': 'category', 'Vendor': 'category'})
+            pbi = pbi.astype({'Site_Location_Key': 'category', 'Service_Type': 'category'})
+
+        expected = compare_rule(_rule(), source, pbi, ['Site_Location_Key'])
+        actual = compare_rule(_rule(), source, pbi, ['Site_Location_Key'],
+                              backend=get_backend(engine))
+
+        assert _dump(actual) == _dump(expected)
+        assert [c.entity_id for c in actual] == ['146', '147', '148', '149', '150', '151']
+
+    @pytest.mark.parametrize('engine', _engine_params())
+    def test_multi_key_and_missing_filter_column(self, engine):
+        source, pbi = _frames()
+        keys = ['Site_Location_Key', 'Vendor']
+        backend = get_backend(engine)
+
+        assert _dump(compare_rule(_rule(), source, pbi, keys, backend=backend)) == \
+            _dump(compare_rule(_rule(), source, pbi, keys))
+        missing = _rule(pbi_filters={'Region': 'West'})
+        assert _dump(compare_rule(missing, source, pbi, keys, backend=backend)) == \
+            _dump(compare_rule(missing, source, pbi, keys))
+
+    @pytest.mark.parametrize('engine', _engine_params())
+    def test_referential_parity(self, engine):
+        source, pbi = _frames()
+        check = IntegrityCheck(name='sites', source_table='sharepoint', target_table='fact_quotes',
+                               source_key='Site_Location_Key', target_key='Site_Location_Key')
+
+        expected = check_referential_integrity(check, source, pbi)
+        actual = check_referential_integrity(check, source, pbi, get_backend(engine))
+
+        assert actual.to_dict() == expected.to_dict()
+        assert actual.orphan_keys == ['149']
+
+    @pytest.mark.parametrize('engine', _engine_params())
+    def test_report_parity(self, engine, tmp_path):
+        (tmp_path / 'factQuotes.csv').write_text(
+            'Site_Location_Key,Service_Type,Vendor,Total MRC\n'
+            + ''.join(f'{i},{"Broadband" if i % 3 else "DIA"},{"ATT" if i % 2 else "Verizon"},'
+                      f'{i * 1.5}\n' for i in range(100, 400)),
+            encoding='utf-8')
+        (tmp_path / 'dimSite.csv').write_text(
+            'Site_Location_Key\n' + ''.join(f'{i}\n' for i in range(100, 390)), encoding='utf-8')
+        (tmp_path / 'dimServiceType.csv').write_text('Service_Type\nBroadband\n', encoding='utf-8')
+        (tmp_path / 'Broadband DIA_Archetype 1_sharepoint.csv').write_text(
+            'Site_Location_Key,Vendor,Broadband Circuit MRC $/Month,DIA Circuit MRC $/Month,'
+            'CPE Recurring - Primary DIA,LTE MRC $/Month\n'
+            + ''.join(f'{i},{"ATT" if i % 2 else "Verizon"},"${i * 1.5 + (i % 7 == 0):,.2f}",'
+                      f'{i},,\n' for i in range(150, 450)),
+            encoding='utf-8')
+        config = ConfigLoader(CONFIG_PATH).load()
+        config.sources_base_path = str(tmp_path)
+
+        reports = {}
+        for name in ('pandas', engine):
+            plan = build_plan(config)
+            session = SourceSession(IngestEngine(config, IngestOptions(), plan=plan), plan)
+            report = ReconciliationReport(project_name=config.name,
+                                          generated_at=datetime(2024, 1, 1),
+                                          config_file=str(CONFIG_PATH))
+            reports[name] = RulesEngine(config, session, get_backend(name)).run(report).to_dict()
+
+        assert reports[engine] == reports['pandas']
+        assert reports['pandas']['entity_comparisons']
+
+    def test_unknown_engine(self):
+        with pytest.raises(BackendError, match='Unknown engine'):
+            get_backend('spark')
@@ -0,0 +1,174 @@
+"""
+Tests for Source Cache
+Pruebas de la caché columnar de fuentes
+"""
+
+import sys
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import pytest
+
+pytest.importorskip('pyarrow')
+
+from recon.adapters.pbi_layout import PbixArchive
+from recon.core.cache import SourceCache
+from recon.core.config import ProjectConfig, SourceConfig
+from recon.core.ingest import IngestEngine, IngestOptions
+from tests import project_config
+
+
+def _make_config(base: Path) -> ProjectConfig:
+    return project_config(base, SourceConfig(name='quotes', path='quotes.csv', type='csv'))
+
+
+def _write_csv(path: Path, rows: int) -> None:
+    lines = ['Site_Location_Key,Vendor,Total MRC']
+    lines += [f'{i:04d},Verizon,{i * 1.5}' for i in range(rows)]
+    path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+
+class TestSourceCache:
+    """Test suite for the persistent source cache"""
+
+    def test_warm_run_reads_from_cache(self, tmp_path):
+        _write_csv(tmp_path / 'quotes.csv', 300)
+        cache = SourceCache(tmp_path / '.recon_cache')
+        config = _make_config(tmp_path)
+
+        cold = IngestEngine(config, IngestOptions(chunk_rows=100), cache=cache)
+        cold_frame = cold.load('quotes')
+        warm = IngestEngine(config, IngestOptions(chunk_rows=100), cache=cache)
+        warm_frame = warm.load('quotes')
+
+        assert cold.stats['quotes'].metadata['cache'] == 'miss'
+        assert warm.stats['quotes'].metadata['cache'] == 'hit'
+        assert warm.stats['quotes'].chunks == 3
+        assert warm_frame.equals(cold_frame)
+        assert warm_frame['Site_Location_Key'].iloc[0] == '0000'
+
+    def test_changed_file_invalidates_entry(self, tmp_path):
+        _write_csv(tmp_path / 'quotes.csv', 10)
+        cache = SourceCache(tmp_path / '.recon_cache')
+        config = _make_config(tmp_path)
+        IngestEngine(config, cache=cache).load('quotes')
+
+        # Las 10 filas originales se conservan: el cambio se ingiere como append
+        _write_csv(tmp_path / 'quotes.csv', 20)
+        engine = IngestEngine(config, cache=cache)
+        frame = engine.load('quotes')
+
+        assert engine.stats['quotes'].metadata['cache'] == 'append'
+        assert len(frame) == 20
+
+    def test_abandoned_read_leaves_no_entry(self, tmp_path):
+        _write_csv(tmp_path / 'quotes.csv', 300)
+        cache = SourceCache(tmp_path / '.recon_cache')
+        engine = IngestEngine(_make_config(tmp_path), IngestOptions(chunk_rows=100), cache=cache)
+
+        chunks = engine.iter_chunks('quotes')
+        next(chunks)
+        chunks.close()
+
+        assert cache.entries() == []
+        assert list((tmp_path / '.recon_cache').iterdir()) == []
+
+    def test_prune_evicts_least_recently_used(self, tmp_path):
+        cache = SourceCache(tmp_path / '.recon_cache')
+        for name in ['old', 'new']:
+            csv_path = tmp_path / f'{name}.csv'
+            _write_csv(csv_path, 100)
+            config = _make_config(tmp_path)
+            config.sources['quotes'].path = csv_path.name
+            IngestEngine(config, cache=cache).load('quotes')
+        entries = {Path(e.source_path).stem: e for e in cache.entries()}
+        cache.touch(entries['old'].key, when=1_000_000)
+
+        removed = cache.prune(max_size=entries['new'].size_bytes)
+
+        assert [Path(e.source_path).stem for e in removed] == ['old']
+        assert [Path(e.source_path).stem for e in cache.entries()] == ['new']
+        assert cache.clear() == 1
+
+    def test_extracted_pbix_members_are_cache_entries(self, tmp_path):
+        cache_dir = tmp_path / '.recon_cache'
+        pbix = tmp_path / 'report.pbix'
+        with zipfile.ZipFile(pbix, 'w') as archive:
+            archive.writestr('DataModelSchema', b'x' * 5000)
+            archive.writestr('Report/Layout', b'{}')
+        PbixArchive(pbix, cache_dir=cache_dir).read('DataModelSchema')
+        config = _make_config(tmp_path)
+        _write_csv(tmp_path / 'quotes.csv', 100)
+        cache = SourceCache(cache_dir)
+        IngestEngine(config, cache=cache).load('quotes')
+
+        entries = cache.all_entries()
+        assert [e.kind for e in entries] == ['source', 'pbix']
+        assert entries[1].source_name == 'report.pbix'
+        assert entries[1].columns == ['DataModelSchema']
+        assert entries[1].size_bytes > 5000
+
+        # El PBIX es el menos usado: el LRU lo desaloja primero
+        removed = cache.prune(max_size=entries[0].size_bytes)
+        assert [e.kind for e in removed] == ['pbix']
+        assert not (cache_dir / 'pbix' / entries[1].key).exists()
+
+        PbixArchive(pbix, cache_dir=cache_dir).read('Report/Layout')
+        assert cache.clear() == 2
+        assert cache.all_entries() == []
+        assert not (cache_dir / 'pbix').exists()
+
+    def test_clear_removes_cached_detection_results(self, tmp_path):
+        cache_dir = tmp_path / '.recon_cache'
+        (cache_dir / 'catalog').mkdir(parents=True)
+        (cache_dir / 'catalog' / 'abc.json').write_text('{}', encoding='utf-8')
+        for name in ['dialects.json', 'schemas.json']:
+            (cache_dir / name).write_text('{}', encoding='utf-8')
+
+        assert SourceCache(cache_dir).clear() == 0
+        assert list(cache_dir.iterdir()) == []
+
+    def test_appended_rows_are_parsed_incrementally(self, tmp_path):
+        csv_path = tmp_path / 'quotes.csv'
+        _write_csv(csv_path, 1_000)
+        cache = SourceCache(tmp_path / 'cache')
+        IngestEngine(_make_config(tmp_path), IngestOptions(chunk_rows=300), cache=cache) \
+            .load('quotes')
+
+        with open(csv_path, 'a', encoding='utf-8') as f:
+            f.write('9998,ATT,1.0\n9999,ATT,2.0\n')
+        engine = IngestEngine(_make_config(tmp_path), IngestOptions(chunk_rows=300), cache=cache)
+        frame = engine.load('quotes')
+
+        metadata = engine.stats['quotes'].metadata
+        assert metadata['cache'] == 'append'
+        assert metadata['rows_cached'] == 1_000
+        assert metadata['rows_appended'] == 2
+        assert len(frame) == 1_002
+        assert frame['Site_Location_Key'].tolist()[-2:] == ['9998', '9999']
+        # La entrada anterior se reemplaza por la fusionada
+        [entry] = cache.entries()
+        assert entry.rows == 1_002
+
+        warm = IngestEngine(_make_config(tmp_path), IngestOptions(), cache=cache)
+        assert warm.load('quotes')['Vendor'].tolist() == frame['Vendor'].tolist()
+        assert warm.stats['quotes'].metadata['cache'] == 'hit'
+
+    def test_changed_prefix_falls_back_to_full_reload(self, tmp_path):
+        csv_path = tmp_path / 'quotes.csv'
+        _write_csv(csv_path, 100)
+        cache = SourceCache(tmp_path / 'cache')
+        IngestEngine(_make_config(tmp_path), IngestOptions(), cache=cache).load('quotes')
+
+        # Se edita una fila existente y además se agrega una nueva
+        content = csv_path.read_text(encoding='utf-8').replace('0000,Verizon', '0000,Lumen')
+        csv_path.write_text(content + '0100,ATT,1.0\n', encoding='utf-8')
+        engine = IngestEngine(_make_config(tmp_path), IngestOptions(), cache=cache)
+        frame = engine.load('quotes')
+
+        assert engine.stats['quotes'].metadata['cache'] == 'miss'
+        assert frame['Vendor'].iloc[0] == 'Lumen'
+        assert len(frame) == 101
+        assert len(cache.entries()) == 1
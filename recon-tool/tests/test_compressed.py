@@ -0,0 +1,80 @@
+"""
+Tests for Compressed Sources
+Pruebas de lectura en streaming de fuentes comprimidas
+"""
+
+import bz2
+import gzip
+import sys
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import pytest
+
+from recon.core.config import SourceConfig
+from recon.core.ingest import IngestEngine, IngestError, IngestOptions
+from tests import project_config
+
+CSV_TEXT = 'Site_Location_Key,Vendor,Total MRC\n' + ''.join(
+    f'{i},{"Verizon" if i % 2 else "ATT"},{i * 1.5}\n' for i in range(1_200)
+)
+
+
+def _engine(base: Path, path: str, **source_options) -> IngestEngine:
+    config = project_config(base, SourceConfig(name='quotes', path=path, type='csv',
+                                               **source_options))
+    return IngestEngine(config, IngestOptions(chunk_rows=500))
+
+
+def _write_zstd(path: Path, data: bytes) -> None:
+    zstandard = pytest.importorskip('zstandard')
+    path.write_bytes(zstandard.ZstdCompressor().compress(data))
+
+
+class TestCompressedSources:
+    """Test suite for streaming decompression into the chunked ingest"""
+
+    @pytest.mark.parametrize('file_name, write', [
+        ('quotes.csv.gz', lambda p, d: p.write_bytes(gzip.compress(d))),
+        ('quotes.csv.bz2', lambda p, d: p.write_bytes(bz2.compress(d))),
+        ('quotes.csv.zst', _write_zstd),
+    ])
+    def test_compressed_csv_matches_plain(self, tmp_path, file_name, write):
+        (tmp_path / 'quotes.csv').write_text(CSV_TEXT, encoding='utf-8')
+        write(tmp_path / file_name, CSV_TEXT.encode('utf-8'))
+
+        plain = _engine(tmp_path, 'quotes.csv').load('quotes')
+        engine = _engine(tmp_path, file_name)
+        frame = engine.load('quotes')
+
+        assert frame.equals(plain)
+        assert engine.stats['quotes'].chunks == 3
+        assert sorted(p.name for p in tmp_path.iterdir()) == sorted(['quotes.csv', file_name])
+
+    def test_zip_member_is_streamed(self, tmp_path):
+        with zipfile.ZipFile(tmp_path / 'exports.zip', 'w', zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr('readme.txt', 'SharePoint export')
+            archive.writestr('arch1/quotes.csv', CSV_TEXT)
+
+        frame = _engine(tmp_path, 'exports.zip', member='arch1/quotes.csv').load('quotes')
+
+        assert len(frame) == 1_200
+        assert frame['Vendor'].iloc[1] == 'Verizon'
+
+        with pytest.raises(IngestError, match='set \'member\''):
+            _engine(tmp_path, 'exports.zip').load('quotes')
+
+    def test_explicit_compression_overrides_extension(self, tmp_path):
+        (tmp_path / 'quotes.dat').write_bytes(gzip.compress(CSV_TEXT.encode('utf-8')))
+
+        frame = _engine(tmp_path, 'quotes.dat', compression='gzip').load('quotes')
+
+        assert len(frame) == 1_200
+
+    def test_corrupt_archive_raises_ingest_error(self, tmp_path):
+        (tmp_path / 'quotes.csv.gz').write_bytes(b'not gzip data')
+
+        with pytest.raises(IngestError):
+            _engine(tmp_path, 'quotes.csv.gz').load('quotes')
@@ -0,0 +1,79 @@
+"""
+Tests for mmap CSV Field Scanner
+Pruebas del escáner de columnas sobre archivos mapeados en memoria
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import pandas as pd
+import pytest
+
+from recon.adapters.csv_model import CsvSourceReader, MmapFieldScanner
+from recon.core.config import SourceConfig
+from recon.core.ingest import IngestEngine, IngestOptions
+from recon.core.planner import SourcePlan
+from tests import project_config
+
+TRICKY_CSV = (
+    '﻿Site_Location_Key,Vendor,Total MRC,Notes\r\n'
+    '146,Verizon,69.00,NA\r\n'
+    '\r\n'
+    '147,,933.48,ok\r\n'
+    '148,"Lumen, Inc",10,x\n'
+    '149,Verizon,null,é\n'
+    '150,ATT,5,last'
+)
+
+
+def _read_all(reader, chunk_rows: int = 2) -> pd.DataFrame:
+    return pd.concat(list(reader.iter_chunks(chunk_rows)), ignore_index=True)
+
+
+class TestMmapFieldScanner:
+    """Test suite for the mmap field scanner"""
+
+    @pytest.mark.parametrize('block_bytes', [16, 1024])
+    def test_matches_pandas_usecols(self, tmp_path, block_bytes):
+        path = tmp_path / 'quotes.csv'
+        path.write_text(TRICKY_CSV, encoding='utf-8')
+        columns = {'Site_Location_Key', 'Vendor', 'Notes'}
+
+        scanner = MmapFieldScanner(path, columns, block_bytes=block_bytes)
+        scanned = _read_all(scanner)
+        expected = _read_all(CsvSourceReader(path, columns=columns))
+
+        assert scanned.astype(object).equals(expected.astype(object))
+        # Solo el bloque con comillas se delega a pandas
+        if block_bytes == 16:
+            assert scanner.metrics['blocks_fallback'] == 1
+            assert scanner.metrics['blocks_scanned'] > 1
+
+    def test_header_with_quotes_is_not_supported(self, tmp_path):
+        path = tmp_path / 'quotes.csv'
+        path.write_text('"Site, Key",Vendor\n1,ATT\n', encoding='utf-8')
+
+        assert not MmapFieldScanner.supports(path, 'utf-8', ',')
+        assert not MmapFieldScanner.supports(path, 'utf-16', ',')
+
+    def test_ingest_uses_scanner_for_key_only_reads(self, tmp_path):
+        header = ['Site_Location_Key'] + [f'Field {i}' for i in range(11)]
+        rows = [','.join([str(i)] + ['1.5'] * 11) for i in range(500)]
+        (tmp_path / 'wide.csv').write_text('\n'.join([','.join(header)] + rows) + '\n',
+                                           encoding='utf-8')
+        config = project_config(tmp_path, SourceConfig(name='wide', path='wide.csv', type='csv'))
+        plan = {'wide': SourcePlan('wide', columns={'Site_Location_Key'})}
+
+        engine = IngestEngine(config, IngestOptions(chunk_rows=200), plan=plan)
+        frame = engine.load('wide')
+
+        assert engine.stats['wide'].metadata['scanner'] == 'mmap'
+        assert engine.stats['wide'].chunks == 3
+        assert frame['Site_Location_Key'].tolist() == [str(i) for i in range(500)]
+
+        config.csv_scanner = 'pandas'
+        engine = IngestEngine(config, IngestOptions(chunk_rows=200), plan=plan)
+        assert engine.load('wide').equals(frame)
+        assert 'scanner' not in engine.stats['wide'].metadata
@@ -0,0 +1,115 @@
+"""
+Tests for CSV Dialect Sniffing
+Pruebas de detección de encoding, separador y comillas
+"""
+
+import gzip
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import pytest
+
+from recon.adapters.csv_sniffer import detect_delimiter, detect_encoding, sniff_csv
+from recon.core.config import ProjectConfig, SourceConfig
+from recon.core.dialect import DIALECT_CACHE_FILE, DialectCache
+from recon.core.ingest import IngestEngine, IngestOptions
+from recon.core.schema import SchemaCache, probe_sources
+from tests import project_config
+
+ROWS = [('146', 'Telefónica', '1.234,50'), ('147', 'Claro; Chile', '99,90'), ('148', 'Entel', '10')]
+
+
+def _csv_text(delimiter: str, quotechar: str = '"') -> str:
+    lines = [delimiter.join(['Site_Location_Key', 'Vendor', 'Total MRC'])]
+    for row in ROWS:
+        lines.append(delimiter.join(
+            f'{quotechar}{v}{quotechar}' if delimiter in v or ',' in v else v for v in row
+        ))
+    return '\n'.join(lines) + '\n'
+
+
+def _auto_config(base: Path, path: str) -> ProjectConfig:
+    return project_config(base, SourceConfig(name='quotes', path=path, type='csv',
+                                             encoding='auto', delimiter='auto',
+                                             quotechar='auto'))
+
+
+class TestSniffer:
+    """Test suite for sample-based dialect detection"""
+
+    @pytest.mark.parametrize('encoding, expected', [
+        ('utf-8', 'utf-8'),
+        ('utf-8-sig', 'utf-8-sig'),
+        ('utf-16', 'utf-16'),
+        ('utf-16-le', 'utf-16-le'),
+        ('cp1252', 'cp1252'),
+    ])
+    def test_detect_encoding(self, encoding, expected):
+        assert detect_encoding(_csv_text(';').encode(encoding)) == expected
+
+    @pytest.mark.parametrize('delimiter', [',', ';', '\t', '|'])
+    def test_detect_delimiter(self, delimiter):
+        assert detect_delimiter(_csv_text(delimiter)) == delimiter
+
+    def test_quoted_delimiter_is_ignored(self, tmp_path):
+        # 'Claro; Chile' lleva un separador candidato dentro de comillas simples
+        path = tmp_path / 'quotes.csv'
+        path.write_text(_csv_text(',', quotechar="'"), encoding='utf-8')
+
+        dialect = sniff_csv(path)
+
+        assert (dialect.delimiter, dialect.quotechar) == (',', "'")
+
+    def test_sniff_compressed_sample(self, tmp_path):
+        path = tmp_path / 'quotes.csv.gz'
+        path.write_bytes(gzip.compress(_csv_text('\t').encode('utf-16')))
+
+        dialect = sniff_csv(path, 'gzip')
+
+        assert (dialect.encoding, dialect.delimiter) == ('utf-16', '\t')
+
+
+class TestAutoDialectIngest:
+    """Test suite for 'auto' sources in ingest and the schema probe"""
+
+    @pytest.mark.parametrize('encoding, delimiter', [
+        ('cp1252', ';'),
+        ('utf-16', '\t'),
+        ('utf-8-sig', '|'),
+    ])
+    def test_auto_source_loads_in_one_pass(self, tmp_path, encoding, delimiter):
+        (tmp_path / 'quotes.csv').write_bytes(_csv_text(delimiter).encode(encoding))
+        engine = IngestEngine(_auto_config(tmp_path, 'quotes.csv'), IngestOptions())
+
+        frame = engine.load('quotes')
+
+        assert list(frame.columns) == ['Site_Location_Key', 'Vendor', 'Total MRC']
+        assert list(frame['Vendor']) == ['Telefónica', 'Claro; Chile', 'Entel']
+        assert engine.stats['quotes'].metadata['dialect']['delimiter'] == delimiter
+
+    def test_detected_dialect_is_cached_by_fingerprint(self, tmp_path, monkeypatch):
+        (tmp_path / 'quotes.csv').write_bytes(_csv_text(';').encode('cp1252'))
+        config = _auto_config(tmp_path, 'quotes.csv')
+        cache_dir = tmp_path / 'cache'
+
+        IngestEngine(config, dialect_cache=DialectCache(cache_dir)).load('quotes')
+        assert (cache_dir / DIALECT_CACHE_FILE).exists()
+
+        # Segunda ejecución: el formato sale de la caché sin volver a muestrear
+        import recon.adapters.csv_sniffer as sniffer
+        monkeypatch.setattr(sniffer, 'sniff_csv', lambda *a, **k: pytest.fail('sniffed again'))
+        engine = IngestEngine(config, dialect_cache=DialectCache(cache_dir))
+        frame = engine.load('quotes')
+
+        assert frame['Vendor'].iloc[0] == 'Telefónica'
+        assert engine.stats['quotes'].metadata['dialect']['encoding'] == 'cp1252'
+
+    def test_schema_probe_uses_detected_dialect(self, tmp_path):
+        (tmp_path / 'quotes.csv').write_bytes(_csv_text('\t').encode('utf-16'))
+        config = _auto_config(tmp_path, 'quotes.csv')
+
+        schemas = probe_sources(config, cache=SchemaCache(tmp_path / 'cache'))
+
+        assert schemas['quotes'].columns == ['Site_Location_Key', 'Vendor', 'Total MRC']
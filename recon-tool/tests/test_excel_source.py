@@ -0,0 +1,92 @@
+"""
+Tests for Excel Source Reader
+Pruebas del lector de Excel por chunks
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import pytest
+
+from recon.core.config import SourceConfig
+from recon.core.ingest import IngestEngine, IngestError, IngestOptions
+from recon.core.planner import SourcePlan
+from tests import project_config
+
+openpyxl = pytest.importorskip('openpyxl')
+
+
+def _write_workbook(path: Path, rows: int) -> None:
+    workbook = openpyxl.Workbook(write_only=True)
+    notes = workbook.create_sheet('Notes')
+    notes.append(['Exported from SharePoint'])
+    sheet = workbook.create_sheet('Arch1')
+    sheet.append(['SharePoint export'])
+    sheet.append([])
+    sheet.append(['Site_Location_Key', 'Vendor', 'Broadband Circuit MRC $/Month', 'Notes'])
+    for i in range(rows):
+        sheet.append([float(i), 'Verizon' if i % 2 else 'ATT', 69.5 + i, None])
+    sheet.append([None, None, None, None])
+    workbook.save(path)
+
+
+def _engine(base: Path, cache=None, plan=None, **source_options) -> IngestEngine:
+    source_options = {'sheet': 'Arch1', 'header_row': 3, **source_options}
+    config = project_config(base, SourceConfig(name='arch1', path='arch1.xlsx', type='excel',
+                                               **source_options))
+    return IngestEngine(config, IngestOptions(chunk_rows=400), plan=plan,
+                        cache=cache)
+
+
+class TestExcelSource:
+    """Test suite for the streaming Excel reader"""
+
+    def test_sheet_header_row_and_chunks(self, tmp_path):
+        _write_workbook(tmp_path / 'arch1.xlsx', 1_000)
+        engine = _engine(tmp_path)
+
+        chunks = list(engine.iter_chunks('arch1'))
+
+        assert [len(c) for c in chunks] == [400, 400, 200]
+        first = chunks[0]
+        assert list(first.columns) == ['Site_Location_Key', 'Vendor',
+                                       'Broadband Circuit MRC $/Month', 'Notes']
+        # Los valores llegan como texto, con enteros sin '.0'
+        assert first['Site_Location_Key'].iloc[146] == '146'
+        assert first['Broadband Circuit MRC $/Month'].iloc[0] == '69.5'
+        assert first['Notes'].isna().all()
+
+    def test_column_projection(self, tmp_path):
+        _write_workbook(tmp_path / 'arch1.xlsx', 10)
+        plan = {'arch1': SourcePlan('arch1', columns={'Site_Location_Key', 'Vendor'})}
+        engine = _engine(tmp_path, plan=plan)
+
+        frame = engine.load('arch1')
+
+        assert list(frame.columns) == ['Site_Location_Key', 'Vendor']
+        assert engine.stats['arch1'].metadata['columns_total'] == 4
+
+    def test_unknown_sheet_raises(self, tmp_path):
+        _write_workbook(tmp_path / 'arch1.xlsx', 10)
+
+        with pytest.raises(IngestError, match="Sheet 'Missing' not found"):
+            _engine(tmp_path, sheet='Missing').load('arch1')
+
+    def test_workbook_is_converted_once_into_cache(self, tmp_path):
+        pytest.importorskip('pyarrow')
+        from recon.core.cache import SourceCache
+
+        _write_workbook(tmp_path / 'arch1.xlsx', 500)
+        cache = SourceCache(tmp_path / 'cache')
+
+        cold_engine = _engine(tmp_path, cache=cache)
+        cold = cold_engine.load('arch1')
+        warm_engine = _engine(tmp_path, cache=cache)
+        warm = warm_engine.load('arch1')
+
+        assert cold_engine.stats['arch1'].metadata['cache'] == 'miss'
+        assert warm_engine.stats['arch1'].metadata['cache'] == 'hit'
+        assert warm['Vendor'].tolist() == cold['Vendor'].tolist()
+        assert warm['Site_Location_Key'].tolist() == cold['Site_Location_Key'].tolist()
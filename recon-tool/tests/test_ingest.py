@@ -0,0 +1,137 @@
+"""
+Tests for Ingest Engine
+Pruebas del motor de ingesta por chunks
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import pandas as pd
+import pytest
+
+from recon.core.config import ProjectConfig, SourceConfig
+from recon.core.ingest import IngestEngine, IngestError, IngestOptions, parse_memory_size
+from recon.core.planner import build_plan
+from tests import project_config
+
+
+def _make_config(base: Path, **sources: str) -> ProjectConfig:
+    return project_config(base, *(
+        SourceConfig(name=name, path=path, type='csv') for name, path in sources.items()
+    ))
+
+
+def _write_csv(path: Path, rows: int) -> None:
+    lines = ['Site_Location_Key,Vendor,Total MRC']
+    lines += [f'{i},Verizon,{i * 1.5}' for i in range(rows)]
+    path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+
+class TestIngest:
+    """Test suite for chunked ingest"""
+
+    def test_parse_memory_size(self):
+        assert parse_memory_size('512MB') == 512 * 1024 ** 2
+        assert parse_memory_size('2g') == 2 * 1024 ** 3
+        assert parse_memory_size(4096) == 4096
+        assert parse_memory_size(None) is None
+        with pytest.raises(IngestError):
+            parse_memory_size('lots')
+
+    def test_chunks_are_bounded_by_chunk_rows(self, tmp_path):
+        _write_csv(tmp_path / 'quotes.csv', 2_500)
+        engine = IngestEngine(_make_config(tmp_path, quotes='quotes.csv'),
+                              IngestOptions(chunk_rows=1_000))
+
+        sizes = [len(chunk) for chunk in engine.iter_chunks('quotes')]
+
+        assert sizes == [1_000, 1_000, 500]
+        stats = engine.stats['quotes']
+        assert stats.rows == 2_500
+        assert stats.chunks == 3
+        assert stats.peak_frame_bytes > 0
+
+    def test_max_memory_shrinks_chunks(self, tmp_path):
+        _write_csv(tmp_path / 'quotes.csv', 5_000)
+        budget = 16 * 1024
+        engine = IngestEngine(_make_config(tmp_path, quotes='quotes.csv'),
+                              IngestOptions(chunk_rows=10_000, max_memory=budget))
+
+        chunks = list(engine.iter_chunks('quotes'))
+
+        assert sum(len(c) for c in chunks) == 5_000
+        assert all(c.memory_usage(deep=True).sum() <= budget * 1.1 for c in chunks[1:])
+
+    def test_load_keeps_values_as_text(self, tmp_path):
+        (tmp_path / 'sites.csv').write_text('Site_Location_Key\n0146\n0200\n', encoding='utf-8')
+        engine = IngestEngine(_make_config(tmp_path, sites='sites.csv'))
+
+        frame = engine.load('sites')
+
+        assert frame['Site_Location_Key'].tolist() == ['0146', '0200']
+        assert engine.stats['sites'].to_dict()['rows'] == 2
+
+    def test_missing_file_raises(self, tmp_path):
+        engine = IngestEngine(_make_config(tmp_path, quotes='missing.csv'))
+
+        with pytest.raises(IngestError):
+            engine.load('quotes')
+
+    @pytest.mark.parametrize('executor', ['thread', 'process'])
+    def test_load_many_in_parallel(self, tmp_path, executor):
+        for name, rows in [('a', 10), ('b', 20), ('c', 30)]:
+            _write_csv(tmp_path / f'{name}.csv', rows)
+        config = _make_config(tmp_path, a='a.csv', b='b.csv', c='c.csv', d='missing.csv')
+        engine = IngestEngine(config, IngestOptions(jobs=4, executor=executor))
+
+        result = engine.load_many()
+
+        assert list(result.frames) == ['a', 'b', 'c']
+        assert {n: len(f) for n, f in result.frames.items()} == {'a': 10, 'b': 20, 'c': 30}
+        assert list(result.errors) == ['d']
+        assert engine.stats['c'].rows == 30
+        assert result.seconds > 0
+
+    def test_cli_filters_are_applied_to_csv_chunks(self, tmp_path):
+        _write_csv(tmp_path / 'quotes.csv', 2_500)
+        config = _make_config(tmp_path, quotes='quotes.csv')
+        config.sources['quotes'].filter_columns = {'site_id': 'Site_Location_Key'}
+        plan = build_plan(config, {'site_id': '146'})
+        engine = IngestEngine(config, IngestOptions(chunk_rows=1_000), plan=plan)
+
+        frame = engine.load('quotes')
+
+        assert frame['Site_Location_Key'].tolist() == ['146']
+        stats = engine.stats['quotes']
+        assert stats.rows == 1
+        assert stats.metadata['rows_scanned'] == 2_500
+
+    def test_filter_without_matches_keeps_columns(self, tmp_path):
+        _write_csv(tmp_path / 'quotes.csv', 10)
+        config = _make_config(tmp_path, quotes='quotes.csv')
+        config.sources['quotes'].filter_columns = {'vendor': 'Vendor'}
+        plan = build_plan(config, {'vendor': 'ATT'})
+
+        frame = IngestEngine(config, plan=plan).load('quotes')
+
+        assert frame.empty
+        assert list(frame.columns) == ['Vendor']
+
+    def test_low_cardinality_columns_are_dictionary_encoded(self, tmp_path):
+        lines = ['Site_Location_Key,Vendor,Service_Type']
+        lines += [f'{i},{"Verizon" if i < 1_500 else "ATT"},{("Broadband", "DIA")[i % 2]}'
+                  for i in range(2_000)]
+        (tmp_path / 'quotes.csv').write_text('\n'.join(lines) + '\n', encoding='utf-8')
+        config = _make_config(tmp_path, quotes='quotes.csv')
+
+        encoded = IngestEngine(config, IngestOptions(chunk_rows=1_000)).load('quotes')
+        plain = IngestEngine(config, IngestOptions(dictionary_encoding=False)).load('quotes')
+
+        assert isinstance(encoded['Vendor'].dtype, pd.CategoricalDtype)
+        # El segundo chunk agrega 'ATT': el diccionario es la unión de los chunks
+        assert list(encoded['Vendor'].cat.categories) == ['ATT', 'Verizon']
+        assert not isinstance(encoded['Site_Location_Key'].dtype, pd.CategoricalDtype)
+        assert encoded['Vendor'].tolist() == plain['Vendor'].tolist()
+        assert encoded.memory_usage(deep=True).sum() < plain.memory_usage(deep=True).sum()
@@ -0,0 +1,118 @@
+"""
+Tests for Typed Source Schemas
+Pruebas de conversión de tipos declarados en el schema de las fuentes
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import pandas as pd
+import pytest
+
+from recon.core.config import ColumnType, ConfigLoader, ConfigurationError, SourceConfig
+from recon.core.ingest import IngestEngine, IngestOptions
+from recon.core.normalize import coerce_frame
+from tests import project_config
+
+CSV_TEXT = (
+    'Site_Location_Key,Vendor,Broadband Circuit MRC $/Month,Install_Date,Notes\n'
+    '146,Verizon,"$1,234.50",15/01/2024,ok\n'
+    '147,ATT,($20.00),02/02/2024,\n'
+    '148,Verizon,TBD,not a date,ok\n'
+    '149,ATT,$99,,ok\n'
+)
+
+SCHEMA = {
+    'Site_Location_Key': ColumnType('int'),
+    'Vendor': ColumnType('category'),
+    'Broadband Circuit MRC $/Month': ColumnType('money'),
+    'Install_Date': ColumnType('date', format='%d/%m/%Y'),
+    'Notes': ColumnType('string'),
+}
+
+
+def _engine(base: Path, **options) -> IngestEngine:
+    config = project_config(base, SourceConfig(name='sharepoint', path='sharepoint.csv',
+                                               type='csv', schema=SCHEMA))
+    return IngestEngine(config, IngestOptions(**options))
+
+
+class TestCoercion:
+    """Test suite for vectorized column coercion"""
+
+    def test_coerce_frame_types_and_invalid_counts(self):
+        frame = pd.DataFrame({
+            'Site_Location_Key': ['146', '1,047', '12.5', None],
+            'Broadband Circuit MRC $/Month': ['$1,234.50', '(20)', 'N/A', ' $ 7 '],
+        })
+
+        result = coerce_frame(frame, {
+            'Site_Location_Key': ColumnType('int'),
+            'Broadband Circuit MRC $/Month': ColumnType('money'),
+            'Not_Loaded': ColumnType('decimal'),
+        })
+
+        assert str(result.frame['Site_Location_Key'].dtype) == 'Int64'
+        assert result.frame['Site_Location_Key'].tolist()[:2] == [146, 1047]
+        assert result.frame['Broadband Circuit MRC $/Month'].tolist()[:2] == [1234.5, -20.0]
+        assert result.frame['Broadband Circuit MRC $/Month'].iloc[3] == 7.0
+        # '12.5' no es entero y 'N/A' no es monto; el nulo original no cuenta
+        assert result.invalid == {'Site_Location_Key': 1, 'Broadband Circuit MRC $/Month': 1}
+
+    def test_wide_integer_keys_keep_every_digit(self):
+        frame = pd.DataFrame({'Site_Location_Key': ['12345678901234567', '9007199254740993',
+                                                    '146.0', '99999999999999999999']})
+
+        result = coerce_frame(frame, {'Site_Location_Key': ColumnType('int')})
+
+        # Sin pasar por float64: 2**53 + 1 no se redondea
+        assert result.frame['Site_Location_Key'].tolist()[:3] == [12345678901234567,
+                                                                  9007199254740993, 146]
+        # Fuera de int64 cuenta como inválido en lugar de cambiar de valor
+        assert result.invalid == {'Site_Location_Key': 1}
+
+
+class TestSchemaIngest:
+    """Test suite for schema coercion during ingest"""
+
+    def test_source_is_typed_at_ingest(self, tmp_path):
+        (tmp_path / 'sharepoint.csv').write_text(CSV_TEXT, encoding='utf-8')
+        engine = _engine(tmp_path, chunk_rows=2)
+
+        frame = engine.load('sharepoint')
+
+        assert str(frame['Site_Location_Key'].dtype) == 'Int64'
+        assert isinstance(frame['Vendor'].dtype, pd.CategoricalDtype)
+        assert frame['Broadband Circuit MRC $/Month'].dtype == 'float64'
+        assert pd.api.types.is_datetime64_any_dtype(frame['Install_Date'])
+        assert frame['Install_Date'].iloc[0] == pd.Timestamp('2024-01-15')
+        assert not isinstance(frame['Notes'].dtype, pd.CategoricalDtype)
+        assert engine.stats['sharepoint'].metadata['coerce_invalid'] == {
+            'Broadband Circuit MRC $/Month': 1, 'Install_Date': 1
+        }
+
+    def test_config_schema_block(self, tmp_path):
+        config_path = tmp_path / 'project.yaml'
+        config_path.write_text(
+            "sources:\n"
+            "  sharepoint:\n"
+            "    path: 'sharepoint.csv'\n"
+            "    schema:\n"
+            "      'Broadband Circuit MRC $/Month': money\n"
+            "      Install_Date: {type: date, format: '%d/%m/%Y'}\n",
+            encoding='utf-8'
+        )
+
+        schema = ConfigLoader(config_path).load().sources['sharepoint'].schema
+
+        assert schema['Broadband Circuit MRC $/Month'] == ColumnType('money')
+        assert schema['Install_Date'] == ColumnType('date', format='%d/%m/%Y')
+
+        config_path.write_text(
+            "sources:\n  sharepoint:\n    path: 'a.csv'\n    schema: {MRC: currency}\n",
+            encoding='utf-8'
+        )
+        with pytest.raises(ConfigurationError, match="invalid type 'currency'"):
+            ConfigLoader(config_path).load()
@@ -0,0 +1,91 @@
+"""
+Tests for Parquet Source Adapter
+Pruebas del lector Parquet con pushdown de filtros
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import pytest
+
+pytest.importorskip('pyarrow')
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from recon.core.config import ProjectConfig, SourceConfig, ValidationRule
+from recon.core.ingest import IngestEngine, IngestOptions
+from recon.core.planner import build_plan
+from tests import project_config
+
+
+def _write_dataset(root: Path) -> None:
+    """Dataset particionado por Vendor con 2 row groups por archivo"""
+    for vendor in ['ATT', 'Verizon']:
+        partition = root / f'Vendor={vendor}'
+        partition.mkdir(parents=True)
+        table = pa.table({
+            'Site_Location_Key': pa.array(range(100), type=pa.int64()),
+            'Service_Type': ['Broadband' if i % 2 else 'DIA' for i in range(100)],
+            'Total MRC': [float(i) for i in range(100)],
+        })
+        pq.write_table(table, partition / 'part-0.parquet', row_group_size=50)
+
+
+def _make_config(base: Path) -> ProjectConfig:
+    return project_config(
+        base,
+        SourceConfig(
+            name='fact_quotes', path='quotes', type='parquet',
+            key_columns=['Site_Location_Key'],
+            filter_columns={'site_id': 'Site_Location_Key', 'vendor': 'Vendor'}
+        ),
+        validation_rules={
+            'DIA': ValidationRule(service_type='DIA', source_name='sharepoint',
+                                  pbi_source='fact_quotes',
+                                  pbi_filters={'Service_Type': 'DIA'}),
+        }
+    )
+
+
+class TestParquetSource:
+    """Test suite for Parquet predicate and partition pushdown"""
+
+    def test_site_and_vendor_filters_prune_partitions_and_row_groups(self, tmp_path):
+        _write_dataset(tmp_path / 'quotes')
+        config = _make_config(tmp_path)
+        plan = build_plan(config, {'site_id': '10', 'vendor': 'Verizon'})
+        engine = IngestEngine(config, IngestOptions(), plan=plan)
+
+        frame = engine.load('fact_quotes')
+
+        assert frame['Site_Location_Key'].tolist() == [10]
+        assert frame['Service_Type'].tolist() == ['DIA']
+        metadata = engine.stats['fact_quotes'].metadata
+        assert metadata['files_scanned'] == 1
+        assert metadata['files_total'] == 2
+        assert metadata['row_groups_scanned'] == 1
+        assert metadata['row_groups_total'] == 4
+
+    def test_rule_filter_is_pushed_when_every_consumer_filters(self, tmp_path):
+        _write_dataset(tmp_path / 'quotes')
+        config = _make_config(tmp_path)
+        engine = IngestEngine(config, IngestOptions(), plan=build_plan(config))
+
+        frame = engine.load('fact_quotes')
+
+        assert set(frame['Service_Type']) == {'DIA'}
+        assert len(frame) == 100
+
+    def test_uncastable_filter_value_matches_nothing(self, tmp_path):
+        _write_dataset(tmp_path / 'quotes')
+        config = _make_config(tmp_path)
+        plan = build_plan(config, {'site_id': 'not-a-number'})
+        engine = IngestEngine(config, IngestOptions(), plan=plan)
+
+        frame = engine.load('fact_quotes')
+
+        assert frame.empty
+        assert 'Site_Location_Key' in frame.columns
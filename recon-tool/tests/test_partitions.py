@@ -0,0 +1,89 @@
+"""
+Tests for Partitioned Sources
+Pruebas de fuentes glob y directorios particionados
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import pytest
+
+from recon.core.config import ProjectConfig, SourceConfig
+from recon.core.ingest import IngestEngine, IngestError, IngestOptions
+from recon.core.planner import build_plan
+from recon.core.schema import probe_sources
+from tests import project_config
+
+
+def _write_partitions(base: Path) -> None:
+    for vendor in ('ATT', 'Verizon', 'Lumen'):
+        for month in ('2024-01', '2024-02'):
+            folder = base / 'quotes' / f'Vendor={vendor}' / f'month={month}'
+            folder.mkdir(parents=True)
+            rows = [f'{i},{vendor[0]}{i}' for i in range(100, 110)]
+            (folder / 'part.csv').write_text('Site_Location_Key,Quote_Id\n' + '\n'.join(rows)
+                                             + '\n', encoding='utf-8')
+
+
+def _make_config(base: Path, path: str) -> ProjectConfig:
+    return project_config(base, SourceConfig(
+        name='quotes', path=path, type='csv', key_columns=['Site_Location_Key'],
+        filter_columns={'vendor': 'Vendor', 'site_id': 'Site_Location_Key'}
+    ))
+
+
+class TestPartitionedSources:
+    """Test suite for glob and key=value directory sources"""
+
+    def test_directory_partitions_become_columns(self, tmp_path):
+        _write_partitions(tmp_path)
+        engine = IngestEngine(_make_config(tmp_path, 'quotes'), IngestOptions())
+
+        frame = engine.load('quotes')
+
+        assert len(frame) == 60
+        assert set(frame['Vendor']) == {'ATT', 'Verizon', 'Lumen'}
+        assert set(frame['month']) == {'2024-01', '2024-02'}
+        assert engine.stats['quotes'].metadata['files_total'] == 6
+        assert engine.stats['quotes'].metadata['files_pruned'] == 0
+
+    @pytest.mark.parametrize('jobs', [1, 3])
+    def test_cli_filter_prunes_partitions(self, tmp_path, jobs):
+        _write_partitions(tmp_path)
+        config = _make_config(tmp_path, 'quotes')
+        plan = build_plan(config, {'vendor': 'Verizon', 'site_id': '105'})
+        engine = IngestEngine(config, IngestOptions(jobs=jobs), plan=plan)
+
+        frame = engine.load('quotes')
+
+        metadata = engine.stats['quotes'].metadata
+        assert (metadata['files_scanned'], metadata['files_pruned']) == (2, 4)
+        # Proyección: claves y columnas filtradas (la partición Vendor incluida)
+        assert list(frame.columns) == ['Site_Location_Key', 'Vendor']
+        assert frame['Site_Location_Key'].tolist() == ['105', '105']
+        assert set(frame['Vendor']) == {'Verizon'}
+
+    def test_glob_source(self, tmp_path):
+        _write_partitions(tmp_path)
+        engine = IngestEngine(_make_config(tmp_path, 'quotes/*/month=2024-02/*.csv'),
+                              IngestOptions())
+
+        frame = engine.load('quotes')
+
+        assert len(frame) == 30
+        assert set(frame['month']) == {'2024-02'}
+
+    def test_glob_without_matches_raises(self, tmp_path):
+        engine = IngestEngine(_make_config(tmp_path, 'missing/*.csv'), IngestOptions())
+
+        with pytest.raises(IngestError, match='No files match'):
+            engine.load('quotes')
+
+    def test_schema_probe_includes_partition_keys(self, tmp_path):
+        _write_partitions(tmp_path)
+
+        schemas = probe_sources(_make_config(tmp_path, 'quotes'))
+
+        assert schemas['quotes'].columns == ['Site_Location_Key', 'Quote_Id', 'Vendor', 'month']
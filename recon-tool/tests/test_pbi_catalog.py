@@ -0,0 +1,165 @@
+"""
+Tests for PBI Catalog
+Pruebas del índice de visuales, campos y filtros del reporte
+"""
+
+import io
+import json
+import sys
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from recon.adapters.pbi_catalog import CATALOG_CACHE_DIR, LayoutCatalog, load_catalog
+from recon.adapters.pbi_layout import LAYOUT_MEMBER, LayoutReader, PbixArchive
+from recon.core.config import ConfigLoader
+
+CONFIG_PATH = Path(__file__).parent.parent / 'configs' / 'mvh.yaml'
+
+
+def _column(table: str, column: str, source: str = None) -> dict:
+    ref = {'Source': source} if source else {'Entity': table}
+    return {'Column': {'Expression': {'SourceRef': ref}, 'Property': column}}
+
+
+def _list_filter(table: str, column: str, values: list) -> dict:
+    return {
+        'name': f'Filter_{column}', 'type': 'Categorical',
+        'expression': _column(table, column),
+        'filter': {'Version': 2, 'From': [{'Name': 't', 'Entity': table}], 'Where': [{
+            'Condition': {'In': {'Expressions': [_column(table, column, 't')],
+                                 'Values': [[{'Literal': {'Value': f"'{v}'"}}] for v in values]}}
+        }]},
+    }
+
+
+def _visual(name: str, columns: list[str], filters: list = (), sum_mrc: bool = False) -> dict:
+    select = [dict(_column('factQuotes', c, 'f'), Name=f'factQuotes.{c}') for c in columns]
+    if sum_mrc:
+        select.append({'Aggregation': {'Expression': _column('factQuotes', 'Total MRC', 'f'),
+                                       'Function': 0},
+                       'Name': 'Sum(factQuotes.Total MRC)'})
+    config = {'name': name, 'singleVisual': {
+        'visualType': 'tableEx',
+        'prototypeQuery': {'Version': 2, 'From': [{'Name': 'f', 'Entity': 'factQuotes'}],
+                           'Select': select},
+    }}
+    return {'x': 0, 'y': 0, 'config': json.dumps(config), 'filters': json.dumps(list(filters))}
+
+
+def _layout() -> dict:
+    return {'id': 0, 'sections': [
+        {'name': 'ReportSection1', 'displayName': 'Quotes',
+         'filters': json.dumps([_list_filter('dimSite', 'Region', ['West'])]),
+         'visualContainers': [
+             _visual('quotes', ['Site_Location_Key'], sum_mrc=True,
+                     filters=[_list_filter('factQuotes', 'Service_Type', ['Broadband', 'DIA'])]),
+             _visual('vendors', ['Vendor']),
+         ]},
+        {'name': 'ReportSection2', 'displayName': 'Legacy', 'filters': '[]',
+         'visualContainers': [
+             {'config': json.dumps({'name': 'card', 'singleVisual': {
+                 'visualType': 'card',
+                 'projections': {'Values': [{'queryRef': 'factQuotes.Total MRC'}]}}})},
+         ]},
+    ]}
+
+
+def _catalog() -> LayoutCatalog:
+    data = json.dumps(_layout()).encode('utf-16-le')
+    return LayoutCatalog.build(LayoutReader(io.BytesIO(data)))
+
+
+class TestLayoutCatalog:
+    """Test suite for the catalog indexes"""
+
+    def test_field_to_visuals(self):
+        catalog = _catalog()
+
+        assert [v.visual for v in catalog.visuals_using('factQuotes[Total MRC]')] == \
+            ['quotes', 'card']
+        assert [v.visual for v in catalog.visuals_using('factQuotes[Service_Type]')] == ['quotes']
+        assert catalog.visuals_using('factQuotes[Install_Date]') == []
+
+    def test_table_to_fields(self):
+        catalog = _catalog()
+
+        assert catalog.tables['factQuotes'] == [
+            'factQuotes[Site_Location_Key]', 'factQuotes[Total MRC]',
+            'factQuotes[Service_Type]', 'factQuotes[Vendor]'
+        ]
+        assert catalog.tables['dimSite'] == ['dimSite[Region]']
+        assert catalog.is_referenced('factQuotes', 'Vendor')
+        assert not catalog.is_referenced('factQuotes', 'Install_Date')
+
+    def test_page_to_filters(self):
+        catalog = _catalog()
+        quotes = catalog.visuals_using('factQuotes[Service_Type]')[0]
+
+        filters = catalog.filters_for(quotes)
+        assert [(f.scope, f.field, f.values) for f in filters] == [
+            ('page', 'dimSite[Region]', ['West']),
+            ('visual', 'factQuotes[Service_Type]', ['Broadband', 'DIA']),
+        ]
+        vendors = catalog.visuals_using('factQuotes[Vendor]')[0]
+        assert [f.scope for f in catalog.filters_for(vendors)] == ['page']
+        assert catalog.filters['ReportSection2'] == []
+
+    def test_round_trip(self):
+        catalog = _catalog()
+        restored = LayoutCatalog.from_dict(json.loads(json.dumps(catalog.to_dict())))
+
+        assert restored.to_dict() == catalog.to_dict()
+        assert restored.is_referenced('factQuotes', 'Total MRC')
+
+
+class TestLoadCatalog:
+    """Test suite for the persisted catalog"""
+
+    def _write_pbix(self, path: Path, layout: dict) -> Path:
+        with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr(LAYOUT_MEMBER, json.dumps(layout).encode('utf-16-le'))
+        return path
+
+    def test_persisted_next_to_source_cache(self, tmp_path):
+        pbix = self._write_pbix(tmp_path / 'report.pbix', _layout())
+        cache_dir = tmp_path / 'cache'
+
+        first, cached = load_catalog(PbixArchive(pbix, cache_dir=cache_dir), cache_dir)
+        assert not cached
+        assert (cache_dir / CATALOG_CACHE_DIR / f'{first.key}.json').exists()
+
+        second, cached = load_catalog(PbixArchive(pbix, cache_dir=cache_dir), cache_dir)
+        assert cached
+        assert second.to_dict() == first.to_dict()
+
+        # Un PBIX distinto genera otro catálogo
+        layout = _layout()
+        layout['sections'].pop()
+        changed = self._write_pbix(tmp_path / 'report.pbix', layout)
+        third, cached = load_catalog(PbixArchive(changed, cache_dir=cache_dir), cache_dir)
+        assert not cached
+        assert [v.visual for v in third.visuals] == ['quotes', 'vendors']
+
+    def test_referenced_rules(self):
+        from recon.core.rules import referenced_rules
+
+        config = ConfigLoader(CONFIG_PATH).load()
+        layout = _layout()
+        layout['sections'][0]['visualContainers'].pop()  # Sin visual que use Vendor
+        catalog = LayoutCatalog.build(
+            LayoutReader(io.BytesIO(json.dumps(layout).encode('utf-16-le'))))
+
+        rules, skipped = referenced_rules(config, config.validation_rules, catalog)
+
+        assert [m.pbi_field for m in rules['Broadband'].field_mappings] == ['Total MRC']
+        assert skipped['Broadband'] == ['factQuotes[Vendor]']
+        assert [m.pbi_field for m in config.validation_rules['Broadband'].field_mappings] == \
+            ['Total MRC', 'Vendor']
+        assert set(rules) == {'Broadband', 'DIA', 'CPE', 'LTE'}
+
+        empty = LayoutCatalog()
+        rules, skipped = referenced_rules(config, config.validation_rules, empty)
+        assert rules == {}
+        assert set(skipped) == {'Broadband', 'DIA', 'CPE', 'LTE'}
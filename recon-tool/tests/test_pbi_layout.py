@@ -0,0 +1,202 @@
+"""
+Tests for PBI Layout Adapter
+Pruebas de lectura directa de miembros de un PBIX
+"""
+
+import codecs
+import io
+import json
+import shutil
+import sys
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import pytest
+
+from recon.adapters.pbi_layout import (
+    LAYOUT_MEMBER,
+    SCHEMA_MEMBER,
+    LayoutReader,
+    PbiLayoutError,
+    PbixArchive,
+    ReportSection,
+    VisualContainer,
+    archive_key,
+    clear_member_cache,
+    iter_layout,
+)
+
+LAYOUT = {"id": 0, "sections": [{"name": "ReportSection1", "visualContainers": []}]}
+SCHEMA = {"name": "model", "model": {"tables": []}}
+
+
+def _write_pbix(path: Path) -> Path:
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(LAYOUT_MEMBER, json.dumps(LAYOUT).encode('utf-16-le'))
+        archive.writestr(SCHEMA_MEMBER, json.dumps(SCHEMA).encode('utf-16-le'))
+        archive.writestr('DataModel', b'\x00' * 4096)
+    return path
+
+
+class TestPbixArchive:
+    """Test suite for PbixArchive"""
+
+    def test_reads_members_without_unpacking(self, tmp_path):
+        model = PbixArchive(_write_pbix(tmp_path / 'report.pbix'))
+
+        assert model.is_archive
+        assert model.members() == [LAYOUT_MEMBER, SCHEMA_MEMBER, 'DataModel']
+        assert json.loads(model.read(LAYOUT_MEMBER).decode('utf-16-le')) == LAYOUT
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['report.pbix']
+
+    def test_members_cached_by_archive_hash(self, tmp_path):
+        pbix = _write_pbix(tmp_path / 'report.pbix')
+        cache_dir = tmp_path / 'cache'
+
+        cold = PbixArchive(pbix, cache_dir=cache_dir)
+        assert json.loads(cold.read(SCHEMA_MEMBER).decode('utf-16-le')) == SCHEMA
+        assert cold.members_extracted == 1
+
+        # Copia del mismo PBIX en otra ruta: reutiliza la extracción
+        copy = tmp_path / 'moved' / 'copy.pbix'
+        copy.parent.mkdir()
+        shutil.copy(pbix, copy)
+        warm = PbixArchive(copy, cache_dir=cache_dir)
+        assert warm.read(SCHEMA_MEMBER) == cold.read(SCHEMA_MEMBER)
+        assert warm.members_extracted == 0
+        assert warm.member_path(SCHEMA_MEMBER) == \
+            cache_dir / 'pbix' / archive_key(pbix) / SCHEMA_MEMBER
+        # Solo se extrajo lo pedido
+        assert not (cache_dir / 'pbix' / archive_key(pbix) / 'DataModel').exists()
+
+        assert clear_member_cache(cache_dir) == 1
+        assert not (cache_dir / 'pbix').exists()
+
+    def test_unpacked_directory(self, tmp_path):
+        (tmp_path / 'Report').mkdir()
+        (tmp_path / 'Report' / 'Layout').write_bytes(json.dumps(LAYOUT).encode('utf-16-le'))
+        model = PbixArchive(tmp_path, cache_dir=tmp_path / 'cache')
+
+        assert not model.is_archive
+        assert model.has_member(LAYOUT_MEMBER)
+        assert not model.has_member(SCHEMA_MEMBER)
+        assert model.member_path(LAYOUT_MEMBER) == tmp_path / 'Report' / 'Layout'
+
+    def test_errors(self, tmp_path):
+        with pytest.raises(PbiLayoutError, match='not found'):
+            PbixArchive(tmp_path / 'missing.pbix')
+
+        model = PbixArchive(_write_pbix(tmp_path / 'report.pbix'))
+        with pytest.raises(PbiLayoutError, match="Member 'Report/StaticResources'"):
+            model.read('Report/StaticResources')
+
+        (tmp_path / 'broken.pbix').write_bytes(b'not a zip')
+        with pytest.raises(PbiLayoutError, match='Not a valid PBIX'):
+            PbixArchive(tmp_path / 'broken.pbix').members()
+
+
+def _visual(name: str, visual_type: str = 'tableEx', title: str = None) -> dict:
+    config = {'name': name, 'singleVisual': {'visualType': visual_type}}
+    if title:
+        config['singleVisual']['vcObjects'] = {'title': [{'properties': {'text': {
+            'expr': {'Literal': {'Value': f"'{title}'"}}}}}]}
+    return {'x': 10.5, 'y': 20, 'z': 1000, 'width': 300, 'height': 200,
+            'config': json.dumps(config),
+            'filters': json.dumps([{'name': 'f1', 'type': 'Categorical'}])}
+
+
+def _layout(pages: int = 3, visuals: int = 4) -> dict:
+    return {
+        'id': 0,
+        'resourcePackages': [{'resourcePackage': {'name': 'SharedResources', 'items': []}}],
+        'sections': [{
+            'id': p, 'name': f'ReportSection{p}', 'displayName': f'Página {p}',
+            'filters': '[]', 'ordinal': p,
+            'visualContainers': [_visual(f'v{p}_{v}', title=f'Visual {v}')
+                                 for v in range(visuals)],
+            'config': '{"relationships":[]}', 'displayOption': 1, 'width': 1280.0,
+        } for p in range(pages)],
+        'config': json.dumps({'version': '5.43'}),
+        'layoutOptimization': 0,
+    }
+
+
+class TestLayoutReader:
+    """Test suite for the streaming Layout parser"""
+
+    @pytest.mark.parametrize('read_bytes', [1, 7, 64, 1 << 20])
+    def test_matches_full_parse(self, read_bytes):
+        layout = _layout()
+        data = json.dumps(layout, indent=1).encode('utf-16-le')
+
+        reader = LayoutReader(io.BytesIO(data), read_bytes=read_bytes)
+        items = list(reader)
+
+        visuals = [i for i in items if isinstance(i, VisualContainer)]
+        sections = [i for i in items if isinstance(i, ReportSection)]
+        assert [v.raw for v in visuals] == \
+            [v for s in layout['sections'] for v in s['visualContainers']]
+        assert [s.raw for s in sections] == \
+            [{k: v for k, v in s.items() if k != 'visualContainers'} for s in layout['sections']]
+        assert [s.visual_count for s in sections] == [4, 4, 4]
+        assert reader.report == {k: v for k, v in layout.items() if k != 'sections'}
+
+    def test_items_in_document_order(self):
+        data = json.dumps(_layout(pages=2, visuals=2)).encode('utf-16-le')
+        order = [(type(i).__name__, i.index) for i in LayoutReader(io.BytesIO(data))]
+
+        assert order == [('VisualContainer', 0), ('VisualContainer', 1), ('ReportSection', 0),
+                         ('VisualContainer', 0), ('VisualContainer', 1), ('ReportSection', 1)]
+
+    def test_nested_json_decoded_on_demand(self):
+        data = json.dumps(_layout(pages=1, visuals=1)).encode('utf-16-le')
+        visual = next(iter(LayoutReader(io.BytesIO(data))))
+
+        assert isinstance(visual.raw['config'], str)
+        assert 'config' not in visual.__dict__
+        assert visual.name == 'v0_0'
+        assert visual.visual_type == 'tableEx'
+        assert visual.title == 'Visual 0'
+        assert visual.filters == [{'name': 'f1', 'type': 'Categorical'}]
+        assert visual.section.name == 'ReportSection0'
+
+    @pytest.mark.parametrize('encoding,bom', [
+        ('utf-16-le', b''), ('utf-16-le', codecs.BOM_UTF16_LE),
+        ('utf-16-be', codecs.BOM_UTF16_BE), ('utf-8', b''),
+    ])
+    def test_encodings(self, encoding, bom):
+        data = bom + json.dumps(_layout(pages=1, visuals=2), ensure_ascii=False).encode(encoding)
+        sections = [i for i in LayoutReader(io.BytesIO(data), read_bytes=5)
+                    if isinstance(i, ReportSection)]
+
+        assert [s.display_name for s in sections] == ['Página 0']
+
+    def test_invalid_json(self):
+        data = json.dumps(_layout(pages=1, visuals=2))[:-40].encode('utf-16-le')
+        with pytest.raises(PbiLayoutError):
+            list(LayoutReader(io.BytesIO(data)))
+
+    def test_invalid_encoding(self, tmp_path):
+        # Sustituto UTF-16 sin pareja dentro del nombre de una página
+        text = json.dumps(_layout(pages=1, visuals=2))
+        cut = text.index('ReportSection0')
+        data = text[:cut].encode('utf-16-le') + b'\x00\xd8' + text[cut:].encode('utf-16-le')
+        with pytest.raises(PbiLayoutError, match='Invalid Layout encoding'):
+            list(LayoutReader(io.BytesIO(data), read_bytes=7))
+
+        pbix = tmp_path / 'report.pbix'
+        with zipfile.ZipFile(pbix, 'w') as archive:
+            archive.writestr(LAYOUT_MEMBER, data)
+        with pytest.raises(PbiLayoutError, match='Invalid Layout encoding'):
+            list(iter_layout(PbixArchive(pbix, cache_dir=tmp_path / 'cache')))
+
+    def test_iter_layout_from_pbix(self, tmp_path):
+        pbix = tmp_path / 'report.pbix'
+        with zipfile.ZipFile(pbix, 'w', zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr(LAYOUT_MEMBER, json.dumps(_layout()).encode('utf-16-le'))
+
+        items = list(iter_layout(PbixArchive(pbix, cache_dir=tmp_path / 'cache')))
+
+        assert sum(isinstance(i, VisualContainer) for i in items) == 12
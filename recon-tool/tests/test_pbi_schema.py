@@ -0,0 +1,152 @@
+"""
+Tests for PBI Schema Adapter
+Pruebas de validación contra los metadatos del modelo (DataModelSchema)
+"""
+
+import codecs
+import json
+import sys
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import pytest
+
+from recon.adapters.pbi_layout import SCHEMA_MEMBER, PbiLayoutError, PbixArchive
+from recon.adapters.pbi_schema import (
+    ModelSchema,
+    check_model_fields,
+    read_model_schema,
+    relationship_checks,
+)
+from recon.core.config import ColumnType, ConfigLoader
+
+CONFIG_PATH = Path(__file__).parent.parent / 'configs' / 'mvh.yaml'
+
+SCHEMA = {
+    'name': 'SemanticModel',
+    'compatibilityLevel': 1550,
+    'model': {
+        'tables': [
+            {'name': 'factQuotes', 'columns': [
+                {'type': 'rowNumber', 'name': 'RowNumber-2662979B', 'dataType': 'int64',
+                 'isHidden': True},
+                {'name': 'Site_Location_Key', 'dataType': 'string'},
+                {'name': 'Service_Type', 'dataType': 'string'},
+                {'name': 'Vendor', 'dataType': 'string'},
+                {'name': 'Total MRC', 'dataType': 'double'},
+                {'type': 'calculated', 'name': 'Quote Date', 'dataType': 'dateTime',
+                 'expression': 'TODAY()'},
+            ], 'measures': [{'name': 'MRC Total', 'expression': "SUM(factQuotes[Total MRC])"}]},
+            {'name': 'dimSite', 'columns': [{'name': 'Site_Location_Key', 'dataType': 'string'}]},
+            {'name': 'dimServiceType', 'columns': [{'name': 'Service_Type', 'dataType': 'string'}]},
+            {'name': 'factExistingCosts', 'columns': [
+                {'name': 'Site_Location_Key', 'dataType': 'string'}]},
+        ],
+        'relationships': [
+            {'name': 'r1', 'fromTable': 'factQuotes', 'fromColumn': 'Site_Location_Key',
+             'toTable': 'dimSite', 'toColumn': 'Site_Location_Key'},
+            {'name': 'r2', 'fromTable': 'dimServiceType', 'fromColumn': 'Service_Type',
+             'fromCardinality': 'one', 'toTable': 'factQuotes', 'toColumn': 'Service_Type',
+             'toCardinality': 'many'},
+            {'name': 'r3', 'fromTable': 'factExistingCosts', 'fromColumn': 'Site_Location_Key',
+             'toTable': 'dimSite', 'toColumn': 'Site_Location_Key', 'isActive': False},
+            {'name': 'r4', 'fromTable': 'factQuotes', 'fromColumn': 'Vendor',
+             'toTable': 'LocalDateTable_1', 'toColumn': 'Date'},
+        ],
+    },
+}
+
+
+def _config():
+    config = ConfigLoader(CONFIG_PATH).load()
+    config.integrity_checks = []
+    return config
+
+
+class TestReadModelSchema:
+    """Test suite for reading DataModelSchema"""
+
+    @pytest.mark.parametrize('bom', [b'', codecs.BOM_UTF16_LE])
+    def test_reads_tables_types_and_relationships(self, tmp_path, bom):
+        pbit = tmp_path / 'report.pbit'
+        with zipfile.ZipFile(pbit, 'w', zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr(SCHEMA_MEMBER, bom + json.dumps(SCHEMA).encode('utf-16-le'))
+            archive.writestr('DataModel', b'\x00' * 4096)
+
+        schema = read_model_schema(PbixArchive(pbit))
+
+        assert list(schema.tables) == ['factQuotes', 'dimSite', 'dimServiceType',
+                                       'factExistingCosts']
+        fact = schema.tables['factQuotes']
+        assert list(fact.columns) == ['Site_Location_Key', 'Service_Type', 'Vendor',
+                                      'Total MRC', 'Quote Date']
+        assert schema.column('factQuotes', 'Total MRC').data_type == 'double'
+        assert schema.column('factQuotes', 'Quote Date').kind == 'calculated'
+        assert fact.measures == ['MRC Total']
+        assert [r.is_active for r in schema.relationships] == [True, True, False, True]
+
+    def test_missing_schema_member(self, tmp_path):
+        pbix = tmp_path / 'report.pbix'
+        with zipfile.ZipFile(pbix, 'w') as archive:
+            archive.writestr('DataModel', b'\x00')
+
+        with pytest.raises(PbiLayoutError, match='No DataModelSchema'):
+            read_model_schema(PbixArchive(pbix))
+
+
+class TestCheckModelFields:
+    """Test suite for validating field mappings without loading data"""
+
+    def test_valid_config(self):
+        assert check_model_fields(_config(), ModelSchema.from_dict(SCHEMA)) == []
+
+    def test_names_and_types(self):
+        config = _config()
+        broadband = config.validation_rules['Broadband']
+        broadband.field_mappings[0].pbi_field = 'MRC Total'
+        broadband.field_mappings[1].compare_type = 'numeric'
+        config.validation_rules['DIA'].pbi_filters = {'Service Type': 'DIA'}
+        config.sources['fact_quotes'].schema = {'Total MRC': ColumnType(type='date')}
+
+        messages = [i.message for i in check_model_fields(config, ModelSchema.from_dict(SCHEMA))]
+
+        assert messages == [
+            "factQuotes[MRC Total] is a measure, not a column in source 'fact_quotes' "
+            "(used by rule:Broadband)",
+            "factQuotes[Service Type] not found in the PBI model in source 'fact_quotes' "
+            "(used by rule:DIA)",
+            "factQuotes[Total MRC] is double in the model but declared 'date' "
+            "in source 'fact_quotes' (used by schema)",
+            "factQuotes[Vendor] is string in the model, not numeric (compare_type 'numeric') "
+            "in source 'fact_quotes' (used by rule:Broadband)",
+        ]
+
+    def test_missing_table(self):
+        config = _config()
+        config.sources['fact_quotes'].pbi_table = 'Quotes'
+
+        issues = check_model_fields(config, ModelSchema.from_dict(SCHEMA))
+
+        assert [(i.table, i.column) for i in issues] == [('Quotes', None)]
+
+
+class TestRelationshipChecks:
+    """Test suite for integrity checks generated from relationships"""
+
+    def test_active_relationships_between_project_sources(self):
+        checks = relationship_checks(_config(), ModelSchema.from_dict(SCHEMA))
+
+        assert [(c.name, c.source_table, c.source_key, c.target_table, c.target_key)
+                for c in checks] == [
+            ('fact_quotes_to_dim_site', 'fact_quotes', 'Site_Location_Key', 'dim_site',
+             'Site_Location_Key'),
+            ('fact_quotes_to_dim_service_type', 'fact_quotes', 'Service_Type',
+             'dim_service_type', 'Service_Type'),
+        ]
+
+    def test_skips_configured_checks(self):
+        config = ConfigLoader(CONFIG_PATH).load()
+
+        assert relationship_checks(config, ModelSchema.from_dict(SCHEMA)) == []
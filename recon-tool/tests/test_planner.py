@@ -0,0 +1,70 @@
+"""
+Tests for Load Planner
+Pruebas del planificador de carga de fuentes
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from recon.core.config import ConfigLoader
+from recon.core.ingest import IngestEngine, IngestOptions
+from recon.core.planner import build_plan
+
+CONFIG_PATH = Path(__file__).parent.parent / 'configs' / 'mvh.yaml'
+
+
+class TestPlanner:
+    """Test suite for column projection planning"""
+
+    def test_mvh_columns_per_source(self):
+        config = ConfigLoader(CONFIG_PATH).load()
+
+        plan = build_plan(config)
+
+        assert plan['sharepoint_arch1'].columns == {
+            'Site_Location_Key',
+            'Vendor',
+            'Broadband Circuit MRC $/Month',
+            'DIA Circuit MRC $/Month',
+            'CPE Recurring - Primary DIA',
+            'LTE MRC $/Month',
+        }
+        assert plan['fact_quotes'].columns == {
+            'Site_Location_Key', 'Service_Type', 'Vendor', 'Total MRC'
+        }
+        assert plan['dim_service_type'].columns == {'Service_Type'}
+        assert 'check:fact_quotes_to_dim_site' in plan['dim_site'].consumers
+        assert plan['sharepoint_arch2'].consumers == []
+
+    def test_projection_disabled_loads_everything(self):
+        config = ConfigLoader(CONFIG_PATH).load()
+        config.column_projection = False
+
+        plan = build_plan(config)
+
+        assert all(p.columns is None for p in plan.values())
+
+    def test_ingest_reads_only_planned_columns(self, tmp_path):
+        config = ConfigLoader(CONFIG_PATH).load()
+        config.sources_base_path = str(tmp_path)
+        (tmp_path / 'dimServiceType.csv').write_text(
+            'Service_Type,Description,Owner\nDIA,Dedicated,NOC\n', encoding='utf-8'
+        )
+        engine = IngestEngine(config, IngestOptions(), plan=build_plan(config))
+
+        frame = engine.load('dim_service_type')
+
+        assert list(frame.columns) == ['Service_Type']
+        stats = engine.stats['dim_service_type'].to_dict()
+        assert stats['columns_total'] == 3
+        assert stats['columns_loaded'] == 1
+
+    def test_rule_filters_not_pushed_when_a_consumer_needs_all_rows(self):
+        config = ConfigLoader(CONFIG_PATH).load()
+
+        plan = build_plan(config)
+
+        # fact_quotes también alimenta checks de integridad sin filtro
+        assert plan['fact_quotes'].filters == {}
@@ -0,0 +1,297 @@
+"""
+Tests for Power BI Dataset Adapter
+Pruebas de consultas DAX por lotes, paginadas y sobre conexiones reutilizadas
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import pandas as pd
+import pytest
+
+from recon.adapters.powerbi_dataset import DatasetError, DatasetSourceReader, build_query
+from recon.core.config import (
+    ConfigLoader,
+    ConfigurationError,
+    DatasetOptions,
+    FieldMapping,
+    ProjectConfig,
+    SourceConfig,
+    ValidationRule,
+)
+from recon.core.ingest import IngestEngine, IngestError, IngestOptions
+from recon.core.planner import build_plan
+from recon.core.schema import probe_sources
+from tests import project_config
+from tests.powerbi_standin import StandInDataset
+
+SITES = 1200
+
+
+def _quotes() -> pd.DataFrame:
+    """Tres servicios por sitio; el sitio 7 tiene filas repetidas (empates de clave)"""
+    rows = []
+    for site in range(SITES):
+        for service in ('Broadband', 'DIA', 'LTE'):
+            rows.append((str(site), service, 'ATT' if site % 2 else None, site * 1.5))
+    rows += [('7', 'DIA', 'ATT', 1.0)] * 20
+    return pd.DataFrame(rows, columns=['Site_Location_Key', 'Service_Type', 'Vendor',
+                                       'Total MRC'])
+
+
+def _read(reader: DatasetSourceReader, chunk_rows: int = 1000) -> pd.DataFrame:
+    return pd.concat(list(reader.iter_chunks(chunk_rows)), ignore_index=True)
+
+
+def _same_rows(frame: pd.DataFrame, expected: pd.DataFrame) -> bool:
+    """Mismas filas (en cualquier orden), con los importes del esperado como texto"""
+    columns = list(frame.columns)
+    expected = expected[columns].copy()
+    if 'Total MRC' in columns:
+        expected['Total MRC'] = [str(int(v)) if v.is_integer() else str(v)
+                                 for v in expected['Total MRC']]
+    ordered = [f.astype(str).sort_values(columns).reset_index(drop=True)
+               for f in (frame, expected)]
+    return ordered[0].equals(ordered[1])
+
+
+class TestBuildQuery:
+    """Test suite for the generated DAX"""
+
+    def test_escaping_filters_and_paging(self):
+        dax = build_query("Quote's", ['Total MRC', 'Odd]"Name'], {'Vendor': ['A"B', 146]},
+                          page_column='Total MRC', page_rows=10, after='x', has_after=True)
+
+        assert dax == (
+            "EVALUATE TOPN(10, FILTER(CALCULATETABLE(SELECTCOLUMNS('Quote''s', "
+            "\"Total MRC\", 'Quote''s'[Total MRC], \"Odd]\"\"Name\", 'Quote''s'[Odd]]\"Name]), "
+            "TREATAS({\"A\"\"B\", 146}, 'Quote''s'[Vendor])), [Total MRC] > \"x\"), "
+            "[Total MRC], ASC) ORDER BY [Total MRC]"
+        )
+        assert build_query('T', ['A']) == "EVALUATE SELECTCOLUMNS('T', \"A\", 'T'[A])"
+
+
+class TestDatasetSourceReader:
+    """Test suite for batched, paged reads against the stand-in dataset"""
+
+    def test_full_table_paged_over_one_connection(self):
+        quotes = _quotes()
+        with StandInDataset({'factQuotes': quotes}, max_rows=1000) as dataset:
+            reader = DatasetSourceReader(dataset.url, 'factQuotes',
+                                         key_columns=['Site_Location_Key'], page_rows=900)
+            frame = _read(reader)
+
+            assert _same_rows(frame, quotes)
+            assert frame['Vendor'].isna().sum() == quotes['Vendor'].isna().sum()
+            assert frame.loc[frame['Site_Location_Key'] == '3', 'Total MRC'].iloc[0] == '4.5'
+            # Encabezado + páginas, todas sobre la misma conexión keep-alive
+            assert reader.metrics['pages'] == len(dataset.queries) - 1
+            assert reader.metrics['pages'] > 1
+            assert reader.metrics['requests'] == dataset.requests
+            assert reader.metrics['connections_opened'] == dataset.connections == 1
+
+    def test_key_ties_are_never_split_across_pages(self):
+        quotes = _quotes()
+        with StandInDataset({'factQuotes': quotes}) as dataset:
+            reader = DatasetSourceReader(dataset.url, 'factQuotes',
+                                         columns={'Site_Location_Key', 'Total MRC'},
+                                         key_columns=['Site_Location_Key'], page_rows=2)
+            reader.filters = {'Site_Location_Key': {'6', '7', '8'}}
+            frame = _read(reader)
+
+        assert list(frame.columns) == ['Site_Location_Key', 'Total MRC']
+        assert frame['Site_Location_Key'].value_counts().to_dict() == {'7': 23, '6': 3, '8': 3}
+
+    def test_entity_filters_sent_in_batches(self):
+        quotes = _quotes()
+        sites = {str(s) for s in range(0, SITES, 2)}
+        with StandInDataset({'factQuotes': quotes}) as dataset:
+            reader = DatasetSourceReader(dataset.url, 'factQuotes',
+                                         columns={'Site_Location_Key', 'Total MRC'},
+                                         filters={'Site_Location_Key': sites,
+                                                  'Service_Type': {'DIA'}},
+                                         key_columns=['Site_Location_Key'],
+                                         batch_size=250, connections=3)
+            frame = _read(reader, chunk_rows=100)
+
+            # 600 sitios en 3 lotes (no 600 consultas), hasta 3 conexiones en paralelo
+            assert reader.metrics['batches'] == 3
+            assert len(dataset.queries) == 1 + 3
+            assert dataset.connections <= 3
+        expected = quotes[quotes['Site_Location_Key'].isin(sites)
+                          & (quotes['Service_Type'] == 'DIA')]
+        assert _same_rows(frame, expected)
+
+    def test_filters_cast_to_model_column_types(self):
+        quotes = _quotes()
+        sites = quotes['Site_Location_Key'].astype(int)
+        quotes = quotes.assign(Site_Location_Key=sites,
+                               Quote_Date=pd.Timestamp('2024-01-01')
+                               + pd.to_timedelta(sites % 3, unit='D'))
+        with StandInDataset({'factQuotes': quotes}) as dataset:
+            reader = DatasetSourceReader(dataset.url, 'factQuotes',
+                                         columns={'Site_Location_Key', 'Quote_Date'},
+                                         filters={'Site_Location_Key': {'6', '7', '8', 'abc'},
+                                                  'Quote_Date': {'2024-01-02'}},
+                                         key_columns=['Site_Location_Key'], page_rows=2)
+            frame = _read(reader)
+
+            assert reader.column_kinds['Site_Location_Key'] == 'number'
+            assert reader.column_kinds['Quote_Date'] == 'datetime'
+            assert "TREATAS({6, 7, 8}" in dataset.queries[1]
+            assert "TREATAS({DATE(2024, 1, 2)}" in dataset.queries[1]
+            # Solo el sitio 7 cae el 2 de enero; sus 23 filas en una página (empates)
+            assert frame['Site_Location_Key'].value_counts().to_dict() == {'7': 23}
+            assert set(frame['Quote_Date']) == {'2024-01-02T00:00:00'}
+
+            # Keyset sobre una columna de fecha: el límite se envía como DATE(...)
+            reader = DatasetSourceReader(dataset.url, 'factQuotes', columns={'Quote_Date'},
+                                         key_columns=['Quote_Date'], page_rows=1000)
+            frame = _read(reader)
+            assert len(frame) == len(quotes)
+            assert any("[Quote_Date] > DATE(2024, 1, 1)" in q for q in dataset.queries)
+
+            reader = DatasetSourceReader(dataset.url, 'factQuotes',
+                                         filters={'Site_Location_Key': {'abc'}})
+            assert _read(reader).empty
+
+    def test_pages_stream_into_chunks(self):
+        quotes = _quotes()
+        with StandInDataset({'factQuotes': quotes}) as dataset:
+            reader = DatasetSourceReader(dataset.url, 'factQuotes',
+                                         key_columns=['Site_Location_Key'], page_rows=300)
+            chunks = reader.iter_chunks(100)
+            next(chunks)
+            # El primer chunk sale de la primera página, sin esperar el resto de la tabla
+            assert len(dataset.queries) == 1 + 1
+            chunks.close()
+
+            sites = {str(s) for s in range(SITES)}
+            dataset.queries.clear()
+            reader = DatasetSourceReader(dataset.url, 'factQuotes',
+                                         filters={'Site_Location_Key': sites},
+                                         key_columns=['Site_Location_Key'],
+                                         batch_size=400, page_rows=100, connections=2)
+            chunks = reader.iter_chunks(100)
+            next(chunks)
+            # 2 lotes en vuelo, cada uno a lo sumo 2 páginas por delante del consumidor
+            assert len(dataset.queries) <= 1 + 1 + 2 * 2
+            frame = pd.concat([next(chunks) for _ in range(3)])
+            chunks.close()
+            assert len(frame) == 300
+            assert len(dataset.queries) <= 1 + 4 + 2 * 2
+
+    def test_max_memory_bounds_page_size(self):
+        quotes = _quotes()
+        with StandInDataset({'factQuotes': quotes}) as dataset:
+            reader = DatasetSourceReader(dataset.url, 'factQuotes',
+                                         key_columns=['Site_Location_Key'], page_rows=50_000)
+            frame = pd.concat(list(reader.iter_chunks(1000, max_memory=200_000)))
+
+            assert _same_rows(frame, quotes)
+            # Primera página de PROBE_ROWS filas, luego páginas acotadas por max_memory
+            assert dataset.queries[1].startswith('EVALUATE TOPN(256,')
+            assert reader.metrics['pages'] > 2
+
+    def test_unpaged_query_over_the_row_limit_fails(self):
+        with StandInDataset({'factQuotes': _quotes()}, max_rows=100) as dataset:
+            reader = DatasetSourceReader(dataset.url, 'factQuotes')
+            with pytest.raises(DatasetError, match='exceeded the maximum of 100 rows'):
+                _read(reader)
+
+    def test_filter_on_missing_column_matches_nothing(self):
+        with StandInDataset({'factQuotes': _quotes()}) as dataset:
+            reader = DatasetSourceReader(dataset.url, 'factQuotes',
+                                         columns={'Site_Location_Key', 'Region'},
+                                         filters={'Region': {'West'}})
+            frame = _read(reader)
+
+            assert frame.empty
+            assert list(frame.columns) == ['Site_Location_Key']
+            assert len(dataset.queries) == 1
+
+    def test_token_and_errors(self):
+        with StandInDataset({'factQuotes': _quotes()}, token='secret') as dataset:
+            with pytest.raises(DatasetError, match='Unauthorized'):
+                DatasetSourceReader(dataset.url, 'factQuotes').read_header()
+            reader = DatasetSourceReader(dataset.url, 'factQuotes', token='secret')
+            assert reader.read_header() == ['Site_Location_Key', 'Service_Type', 'Vendor',
+                                            'Total MRC']
+            with pytest.raises(DatasetError, match="Table 'dimSite' cannot be found"):
+                DatasetSourceReader(dataset.url, 'dimSite', token='secret').read_header()
+
+
+def _config(url: str, **dataset) -> ProjectConfig:
+    return project_config(
+        Path('.'),
+        SourceConfig(
+            name='fact_quotes', path=url, type='powerbi', pbi_table='factQuotes',
+            key_columns=['Site_Location_Key'],
+            filter_columns={'site_id': 'Site_Location_Key'},
+            dataset=DatasetOptions(**dataset),
+        ),
+        validation_rules={
+            'DIA': ValidationRule(service_type='DIA', source_name='sharepoint',
+                                  pbi_source='fact_quotes', pbi_filters={'Service_Type': 'DIA'},
+                                  field_mappings=[FieldMapping(source_field='DIA MRC',
+                                                               pbi_field='Total MRC')]),
+        }
+    )
+
+
+class TestPowerBISource:
+    """Test suite for `type: powerbi` sources in the chunked ingest"""
+
+    def test_ingest_pushes_filters_into_the_query(self):
+        with StandInDataset({'factQuotes': _quotes()}) as dataset:
+            config = _config(dataset.url, page_rows=500)
+            engine = IngestEngine(config, IngestOptions(chunk_rows=400),
+                                  plan=build_plan(config, {'site_id': '146'}))
+            frame = engine.load('fact_quotes')
+
+            stats = engine.stats['fact_quotes']
+            assert frame.to_dict('records') == [
+                {'Site_Location_Key': '146', 'Service_Type': 'DIA', 'Total MRC': '219'}]
+            assert stats.metadata['filters'] == {'Service_Type': ['DIA'],
+                                                 'Site_Location_Key': ['146']}
+            assert stats.metadata['columns_total'] == 4
+            assert stats.metadata['requests'] == 2
+            assert "TREATAS({\"146\"}" in dataset.queries[-1]
+
+            schemas = probe_sources(config)
+            assert schemas['fact_quotes'].columns == ['Site_Location_Key', 'Service_Type',
+                                                      'Vendor', 'Total MRC']
+
+    def test_query_errors_surface_as_ingest_errors(self):
+        with StandInDataset({'factQuotes': _quotes()}, max_rows=10) as dataset:
+            config = _config(dataset.url)
+            config.sources['fact_quotes'].key_columns = []
+            engine = IngestEngine(config, IngestOptions())
+            with pytest.raises(IngestError, match="Could not query 'fact_quotes'"):
+                engine.load('fact_quotes')
+
+    def test_config_validation(self, tmp_path):
+        path = tmp_path / 'project.yaml'
+        path.write_text(
+            "sources:\n"
+            "  live:\n"
+            "    type: powerbi\n"
+            "    path: 'https://api.powerbi.com/v1.0/myorg/datasets/abc'\n"
+            "    pbi_table: factQuotes\n"
+            "    dataset: {batch_size: 250, connections: 8}\n",
+            encoding='utf-8')
+        source = ConfigLoader(path).load().sources['live']
+        assert (source.dataset.batch_size, source.dataset.connections) == (250, 8)
+        assert source.dataset.token_env == 'POWERBI_TOKEN'
+
+        path.write_text(path.read_text().replace('batch_size', 'batch'), encoding='utf-8')
+        with pytest.raises(ConfigurationError, match='unknown dataset option'):
+            ConfigLoader(path).load()
+
+        path.write_text(path.read_text().replace('batch', 'batch_size')
+                        .replace('    pbi_table: factQuotes\n', ''),
+                        encoding='utf-8')
+        with pytest.raises(ConfigurationError, match='requires pbi_table'):
+            ConfigLoader(path).load()
@@ -3,8 +3,53 @@ Tests for Rules Engine
 Pruebas del motor de reglas de validación
 """
 
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
 import pytest
 
+from recon.core.config import ConfigLoader
+from recon.core.ingest import IngestEngine, IngestOptions
+from recon.core.models import ReconciliationReport, ValidationStatus
+from recon.core.planner import build_plan
+from recon.core.rules import RulesEngine, select_rules
+from recon.core.session import SourceSession
+
+CONFIG_PATH = Path(__file__).parent.parent / 'configs' / 'mvh.yaml'
+
+
+def _write(path: Path, content: str) -> None:
+    path.write_text(content, encoding='utf-8')
+
+
+@pytest.fixture
+def mvh_data(tmp_path):
+    _write(tmp_path / 'factQuotes.csv',
+           'Site_Location_Key,Service_Type,Vendor,Total MRC\n'
+           '146,Broadband,Verizon,69.00\n'
+           '146,DIA,Verizon,933.48\n'
+           '999,Broadband,ATT,10\n')
+    _write(tmp_path / 'dimSite.csv', 'Site_Location_Key\n146\n')
+    _write(tmp_path / 'dimServiceType.csv', 'Service_Type\nBroadband\nDIA\n')
+    _write(tmp_path / 'Broadband DIA_Archetype 1_sharepoint.csv',
+           'Site_Location_Key,Vendor,Broadband Circuit MRC $/Month,DIA Circuit MRC $/Month,'
+           'CPE Recurring - Primary DIA,LTE MRC $/Month\n'
+           '146,Verizon,$69.00,900,,\n')
+    config = ConfigLoader(CONFIG_PATH).load()
+    config.sources_base_path = str(tmp_path)
+    return config
+
+
+def _run(config) -> tuple[ReconciliationReport, SourceSession]:
+    plan = build_plan(config)
+    session = SourceSession(IngestEngine(config, IngestOptions(), plan=plan), plan)
+    report = ReconciliationReport(project_name=config.name, generated_at=datetime.now(),
+                                  config_file=str(CONFIG_PATH))
+    return RulesEngine(config, session).run(report), session
+
 
 class TestRules:
     """Test suite for validation rules"""
@@ -12,3 +57,34 @@ class TestRules:
     def test_placeholder(self):
         """Placeholder test - to be implemented"""
         assert True
+
+    def test_mvh_end_to_end(self, mvh_data):
+        report, session = _run(mvh_data)
+
+        checks = {c.check_name: c for c in report.integrity_checks}
+        assert checks['fact_quotes_to_dim_site'].status == ValidationStatus.MISMATCH
+        assert checks['fact_quotes_to_dim_site'].orphan_keys == ['999']
+        assert checks['fact_quotes_to_dim_service_type'].status == ValidationStatus.MATCH
+        assert checks['fact_existing_costs_to_dim_site'].status == \
+            ValidationStatus.NOT_VERIFIABLE
+
+        results = {
+            (c.entity_filters['service_type'], c.entity_id): [v.status for v in c.validations]
+            for c in report.entity_comparisons
+        }
+        assert results[('Broadband', '146')] == [ValidationStatus.MATCH, ValidationStatus.MATCH]
+        assert results[('DIA', '146')][0] == ValidationStatus.MISMATCH
+        assert results[('CPE', '146')] == [ValidationStatus.MISSING_IN_PBI]
+
+        # La fuente SharePoint alimenta las 4 reglas pero se carga una sola vez
+        assert session.load_counts['sharepoint_arch1'] == 1
+        assert session.refcounts['sharepoint_arch1'] == 0
+        assert not session.is_loaded('sharepoint_arch1')
+
+    def test_unknown_service_type_is_rule_not_defined(self, mvh_data):
+        mvh_data.validation_rules = select_rules(mvh_data, 'Satellite')
+
+        report, _ = _run(mvh_data)
+
+        [comparison] = report.entity_comparisons
+        assert comparison.validations[0].status == ValidationStatus.RULE_NOT_DEFINED
@@ -0,0 +1,75 @@
+"""
+Tests for Schema Probe
+Pruebas del sondeo de esquema por encabezados
+"""
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from click.testing import CliRunner
+
+from recon.cli import cli
+from recon.core.config import ConfigLoader
+from recon.core.schema import SchemaCache, check_columns, probe_sources
+
+CONFIG_PATH = Path(__file__).parent.parent / 'configs' / 'mvh.yaml'
+
+
+def _load_config(base: Path):
+    config = ConfigLoader(CONFIG_PATH).load()
+    config.sources_base_path = str(base)
+    return config
+
+
+class TestSchema:
+    """Test suite for header-only schema validation"""
+
+    def test_missing_referenced_column_is_reported(self, tmp_path):
+        (tmp_path / 'dimSite.csv').write_text('Site_Key,Site_Name\n146,HQ\n', encoding='utf-8')
+        config = _load_config(tmp_path)
+
+        schemas = probe_sources(config, ['dim_site', 'fact_quotes'])
+        issues = check_columns(config, schemas)
+
+        assert schemas['dim_site'].columns == ['Site_Key', 'Site_Name']
+        assert 'not found' in schemas['fact_quotes'].error
+        [issue] = issues
+        assert issue.column == 'Site_Location_Key'
+        assert 'check:fact_quotes_to_dim_site' in issue.referrers
+        assert 'key_columns' in issue.referrers
+
+    def test_schema_cache_hit_and_invalidation(self, tmp_path):
+        csv_path = tmp_path / 'dimSite.csv'
+        csv_path.write_text('Site_Location_Key\n146\n', encoding='utf-8')
+        config = _load_config(tmp_path)
+        cache_dir = tmp_path / 'cache'
+
+        probe_sources(config, ['dim_site'], SchemaCache(cache_dir))
+        warm = probe_sources(config, ['dim_site'], SchemaCache(cache_dir))
+        assert warm['dim_site'].cached
+
+        csv_path.write_text('Site_Location_Key,Region\n146,West\n', encoding='utf-8')
+        stat = csv_path.stat()
+        os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        changed = probe_sources(config, ['dim_site'], SchemaCache(cache_dir))
+        assert not changed['dim_site'].cached
+        assert changed['dim_site'].columns == ['Site_Location_Key', 'Region']
+
+    def test_run_fails_fast_on_missing_column(self, tmp_path):
+        config_dir = tmp_path / 'configs'
+        config_dir.mkdir()
+        content = CONFIG_PATH.read_text(encoding='utf-8')
+        base_line = next(line for line in content.splitlines() if 'sources_base:' in line)
+        content = content.replace(base_line, f"  sources_base: '{tmp_path.as_posix()}'")
+        (config_dir / 'mvh.yaml').write_text(content, encoding='utf-8')
+        (tmp_path / 'dimSite.csv').write_text('Site_Key\n146\n', encoding='utf-8')
+
+        result = CliRunner().invoke(cli, ['run', '-p', 'mvh', '-c', str(config_dir),
+                                          '--no-cache'])
+
+        assert result.exit_code == 1
+        assert "Column 'Site_Location_Key' not found in source 'dim_site'" in result.output
+        assert 'Ingesting sources' not in result.output
@@ -0,0 +1,200 @@
+"""
+Tests for Service Unpivot
+Pruebas del cruce único de reglas por servicio (fuente ancha vs. PBI larga)
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import pandas as pd
+import pytest
+
+from recon.core.backends import get_backend
+from recon.core.config import ConfigLoader, FieldMapping, ValidationRule
+from recon.core.ingest import IngestEngine, IngestOptions
+from recon.core.models import ReconciliationReport
+from recon.core.planner import build_plan
+from recon.core.rules import RulesEngine
+from recon.core.session import SourceSession
+from recon.core.validators.entity_compare import compare_rule
+from recon.core.validators.service_unpivot import compare_service_group, plan_service_groups
+
+CONFIG_PATH = Path(__file__).parent.parent / 'configs' / 'mvh.yaml'
+
+KEYS = {'sharepoint': ['Site_Location_Key']}
+
+
+def _engine_params():
+    """Motores disponibles; los no instalados se omiten"""
+    params = ['pandas']
+    for name in ('polars', 'duckdb'):
+        try:
+            __import__(name)
+            params.append(name)
+        except ImportError:
+            skip = pytest.mark.skip(reason=f'{name} not installed')
+            params.append(pytest.param(name, marks=skip))
+    return params
+
+
+def _rule(service_type: str, source_field: str, **kwargs) -> ValidationRule:
+    defaults = {
+        'service_type': service_type,
+        'source_name': 'sharepoint',
+        'pbi_source': 'fact_quotes',
+        'pbi_filters': {'Service_Type': service_type},
+        'field_mappings': [
+            FieldMapping(source_field=source_field, pbi_field='Total MRC',
+                         compare_type='numeric', tolerance=0.01),
+            FieldMapping(source_field='Vendor', pbi_field='Vendor'),
+        ]
+    }
+    defaults.update(kwargs)
+    return ValidationRule(**defaults)
+
+
+def _rules() -> list[ValidationRule]:
+    return [
+        _rule('Broadband', 'Broadband MRC'),
+        _rule('DIA', 'DIA MRC'),
+        _rule('LTE', 'LTE MRC', field_mappings=[
+            FieldMapping(source_field='LTE MRC', pbi_field='Total MRC', compare_type='numeric')
+        ]),
+    ]
+
+
+def _frames() -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Fuente ancha (una columna por servicio) y PBI larga (una fila por servicio)"""
+    source = pd.DataFrame({
+        'Site_Location_Key': ['146', ' 147', '148', '149', '149', None],
+        'Vendor': ['Verizon', 'ATT', 'Verizon', 'ATT', 'ATT', 'ATT'],
+        'Broadband MRC': ['$1,069.00', '50', None, '10', '11', '1'],
+        'DIA MRC': ['933.48', None, '20', '5', '5', '1'],
+        'LTE MRC': [None, '30', None, None, None, None],
+    })
+    pbi = pd.DataFrame({
+        'Site_Location_Key': ['146', '146', '147 ', '148', '148', '150', '149'],
+        'Service_Type': ['Broadband', 'DIA', 'LTE', 'DIA', 'DIA', 'Broadband', 'CPE'],
+        'Vendor': ['Verizon', 'Verizon', 'ATT', 'ATT', 'ATT', 'ATT', 'ATT'],
+        'Total MRC': [1069.0, 900.0, 30.0, 20.0, 21.0, 5.0, 1.0],
+    })
+    return source, pbi
+
+
+def _dump(comparisons) -> list[dict]:
+    return [c.to_dict() for c in comparisons]
+
+
+class TestPlanServiceGroups:
+    """Test suite for grouping rules by service column"""
+
+    def test_groups_rules_sharing_source_and_service_column(self):
+        groups = plan_service_groups(_rules(), KEYS)
+
+        assert len(groups) == 1
+        assert groups[0].service_column == 'Service_Type'
+        assert [r.service_type for r in groups[0].rules] == ['Broadband', 'DIA', 'LTE']
+
+    def test_skips_rules_that_cannot_be_grouped(self):
+        rules = _rules() + [
+            _rule('Multi', 'DIA MRC', pbi_filters={'Service_Type': ['DIA', 'LTE']}),
+            _rule('Filtered', 'DIA MRC', source_filters={'Vendor': 'ATT'}),
+            _rule('Other', 'DIA MRC', pbi_source='fact_existing_costs'),
+            _rule('Again', 'DIA MRC', pbi_filters={'Service_Type': 'DIA'}),
+        ]
+        groups = plan_service_groups(rules, KEYS)
+
+        assert [[r.service_type for r in g.rules] for g in groups] == \
+            [['Broadband', 'DIA', 'LTE']]
+
+
+class TestCompareServiceGroup:
+    """Test suite asserting the single join matches rule-by-rule results"""
+
+    @pytest.mark.parametrize('engine', _engine_params())
+    @pytest.mark.parametrize('encode', [False, True])
+    def test_matches_compare_rule(self, engine, encode):
+        source, pbi = _frames()
+        if encode:
+            source = source.astype({'Site_Location_Key': 'category', 'Vendor': 'category'})
+            pbi = pbi.astype({'Service_Type': 'category', 'Site_Location_Key': 'category'})
+        backend = get_backend(engine)
+        group = plan_service_groups(_rules(), KEYS)[0]
+
+        results = compare_service_group(group, source, pbi, ['Site_Location_Key'],
+                                        backend=backend)
+
+        for rule in _rules():
+            expected = compare_rule(rule, source, pbi, ['Site_Location_Key'])
+            assert _dump(results[rule.service_type]) == _dump(expected)
+        dia = {c.entity_id: c.validations[0].status.value for c in results['DIA']}
+        assert dia == {'146': 'MISMATCH', '147': 'MISSING_IN_PBI', '148': 'NOT_VERIFIABLE',
+                       '149': 'MISSING_IN_PBI'}
+
+    def test_rule_level_and_missing_service_column(self):
+        source, pbi = _frames()
+        rules = _rules()
+        group = plan_service_groups(rules, KEYS)[0]
+
+        missing_keys = compare_service_group(group, source, pbi, ['Region'])
+        no_service = compare_service_group(group, source, pbi.drop(columns='Service_Type'),
+                                           ['Site_Location_Key'])
+
+        for rule in rules:
+            assert _dump(missing_keys[rule.service_type]) == \
+                _dump(compare_rule(rule, source, pbi, ['Region']))
+            assert _dump(no_service[rule.service_type]) == \
+                _dump(compare_rule(rule, source, pbi.drop(columns='Service_Type'),
+                                   ['Site_Location_Key']))
+
+    def test_empty_pbi(self):
+        source, pbi = _frames()
+        group = plan_service_groups(_rules(), KEYS)[0]
+
+        results = compare_service_group(group, source, pbi.iloc[:0], ['Site_Location_Key'])
+
+        for rule in _rules():
+            assert _dump(results[rule.service_type]) == \
+                _dump(compare_rule(rule, source, pbi.iloc[:0], ['Site_Location_Key']))
+
+
+class TestUnpivotReport:
+    """Test suite for RulesEngine with unpivot_rules"""
+
+    def test_report_matches_rule_by_rule(self, tmp_path):
+        (tmp_path / 'factQuotes.csv').write_text(
+            'Site_Location_Key,Service_Type,Vendor,Total MRC\n'
+            + ''.join(f'{i},{("Broadband", "DIA", "LTE")[i % 3]},{"ATT" if i % 2 else "Verizon"},'
+                      f'{i * 1.5}\n' for i in range(100, 400)),
+            encoding='utf-8')
+        (tmp_path / 'dimSite.csv').write_text('Site_Location_Key\n146\n', encoding='utf-8')
+        (tmp_path / 'dimServiceType.csv').write_text('Service_Type\nBroadband\n', encoding='utf-8')
+        (tmp_path / 'Broadband DIA_Archetype 1_sharepoint.csv').write_text(
+            'Site_Location_Key,Vendor,Broadband Circuit MRC $/Month,DIA Circuit MRC $/Month,'
+            'CPE Recurring - Primary DIA,LTE MRC $/Month\n'
+            + ''.join(f'{i},{"ATT" if i % 2 else "Verizon"},"${i * 1.5 + (i % 7 == 0):,.2f}",'
+                      f'{i * 1.5},,{i * 1.5 if i % 5 else ""}\n' for i in range(150, 450)),
+            encoding='utf-8')
+        config = ConfigLoader(CONFIG_PATH).load()
+        config.sources_base_path = str(tmp_path)
+
+        reports = {}
+        sessions = {}
+        for unpivot in (False, True):
+            config.unpivot_rules = unpivot
+            plan = build_plan(config)
+            sessions[unpivot] = SourceSession(IngestEngine(config, IngestOptions(), plan=plan),
+                                              plan)
+            report = ReconciliationReport(project_name=config.name,
+                                          generated_at=datetime(2024, 1, 1),
+                                          config_file=str(CONFIG_PATH))
+            reports[unpivot] = RulesEngine(config, sessions[unpivot]).run(report).to_dict()
+
+        assert reports[True] == reports[False]
+        assert reports[True]['entity_comparisons']
+        # Cada fuente se cargó una vez y se liberó al terminar el grupo
+        assert sessions[True].load_counts['sharepoint_arch1'] == 1
+        assert not sessions[True].is_loaded('sharepoint_arch1')
@@ -0,0 +1,69 @@
+"""
+Tests for Source Session
+Pruebas del registro de fuentes compartido
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import pytest
+
+from recon.core import session as session_module
+from recon.core.config import ConfigLoader
+from recon.core.ingest import IngestEngine, IngestOptions
+from recon.core.planner import build_plan
+from recon.core.session import SourceSession
+
+CONFIG_PATH = Path(__file__).parent.parent / 'configs' / 'mvh.yaml'
+
+
+def _make_session(tmp_path: Path) -> SourceSession:
+    config = ConfigLoader(CONFIG_PATH).load()
+    config.sources_base_path = str(tmp_path)
+    (tmp_path / 'dimSite.csv').write_text('Site_Location_Key\n146\n', encoding='utf-8')
+    plan = build_plan(config)
+    return SourceSession(IngestEngine(config, IngestOptions(), plan=plan), plan)
+
+
+class TestSourceSession:
+    """Test suite for the shared source registry"""
+
+    def test_source_loaded_once_and_freed_after_last_consumer(self, tmp_path):
+        session = _make_session(tmp_path)
+        # dim_site es destino de dos checks de integridad
+        assert session.refcounts['dim_site'] == 2
+
+        first = session.acquire('dim_site')
+        session.release('dim_site')
+        assert session.is_loaded('dim_site')
+
+        second = session.acquire('dim_site')
+        session.release('dim_site')
+
+        assert session.load_counts['dim_site'] == 1
+        assert not session.is_loaded('dim_site')
+        assert first['Site_Location_Key'].tolist() == second['Site_Location_Key'].tolist()
+
+    # Sin Copy-on-Write (pandas 2.x por defecto) la vista es una copia completa
+    @pytest.mark.parametrize('copy_on_write', [True, False])
+    def test_views_are_read_only_for_other_consumers(self, tmp_path, monkeypatch,
+                                                     copy_on_write):
+        monkeypatch.setattr(session_module, 'copy_on_write_enabled', lambda: copy_on_write)
+        session = _make_session(tmp_path)
+
+        view = session.acquire('dim_site')
+        view.loc[0, 'Site_Location_Key'] = 'changed'
+
+        assert session.acquire('dim_site')['Site_Location_Key'].tolist() == ['146']
+
+    def test_failed_source_is_released_as_none(self, tmp_path):
+        session = _make_session(tmp_path)
+
+        with session.use('fact_quotes', 'dim_site') as (quotes, sites):
+            assert quotes is None
+            assert sites is not None
+
+        assert 'fact_quotes' in session.errors
+        assert session.refcounts['dim_site'] == 1
@@ -0,0 +1,190 @@
+"""
+Tests for Out-of-core Comparison
+Pruebas de la comparación por buckets en disco
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from recon.core.backends import get_backend
+from recon.core.config import ConfigLoader, FieldMapping, ValidationRule
+from recon.core.ingest import IngestEngine, IngestOptions
+from recon.core.models import ReconciliationReport
+from recon.core.planner import build_plan
+from recon.core.rules import RulesEngine
+from recon.core.session import SourceSession
+from recon.core.spill import bucket_count, compare_rule_spilled, distinct_key_frame, key_buckets
+from recon.core.validators.entity_compare import compare_rule
+
+CONFIG_PATH = Path(__file__).parent.parent / 'configs' / 'mvh.yaml'
+
+
+def _rule(**kwargs) -> ValidationRule:
+    defaults = {
+        'service_type': 'Broadband',
+        'source_name': 'sharepoint',
+        'pbi_source': 'fact_quotes',
+        'pbi_filters': {'Service_Type': 'Broadband'},
+        'field_mappings': [
+            FieldMapping(source_field='MRC', pbi_field='Total MRC',
+                         compare_type='numeric', tolerance=0.01),
+            FieldMapping(source_field='Vendor', pbi_field='Vendor'),
+        ]
+    }
+    defaults.update(kwargs)
+    return ValidationRule(**defaults)
+
+
+def _frames() -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Entidades duplicadas, claves con espacios y nulas, y claves solo de un lado"""
+    keys = [str(i) for i in range(100, 160)]
+    source = pd.DataFrame({
+        'Site_Location_Key': keys + [' 101', '102 ', None],
+        'Vendor': ['ATT' if i % 2 else 'Verizon' for i in range(63)],
+        'MRC': [float(i) for i in range(63)],
+    })
+    pbi = pd.DataFrame({
+        'Site_Location_Key': keys[10:] + ['200', '201'],
+        'Service_Type': ['DIA' if i % 5 == 0 else 'Broadband' for i in range(52)],
+        'Vendor': ['ATT' if i % 3 else 'Verizon' for i in range(52)],
+        'Total MRC': [str(i + 10 + (i % 4 == 0)) for i in range(52)],
+    })
+    return source, pbi
+
+
+def _chunks(frame: pd.DataFrame, rows: int = 7):
+    for start in range(0, len(frame), rows):
+        yield frame.iloc[start:start + rows].reset_index(drop=True)
+
+
+def _dump(comparisons) -> list[dict]:
+    return [c.to_dict() for c in comparisons]
+
+
+class TestKeyBuckets:
+    """Test suite for key hashing"""
+
+    def test_same_bucket_across_dtypes_and_whitespace(self):
+        keys = pd.Series(['146', '147', '148', '149'])
+        expected = key_buckets(pd.DataFrame({'k': keys}), ['k'], 16)
+        variants = [
+            keys.astype(object),
+            keys.astype('category'),
+            (' ' + keys).astype(object),
+            keys.astype('Int64'),
+            keys.astype(pd.ArrowDtype(pa.string())),
+        ]
+        for variant in variants:
+            assert (key_buckets(pd.DataFrame({'k': variant}), ['k'], 16) == expected).all()
+
+    def test_null_keys_have_no_bucket(self):
+        frame = pd.DataFrame({'a': ['1', None, '3'], 'b': ['x', 'y', None]})
+        buckets = key_buckets(frame, ['a', 'b'], 8)
+        assert buckets[1] == -1 and buckets[2] == -1
+        assert 0 <= buckets[0] < 8
+
+    def test_bucket_count(self):
+        assert bucket_count(0, 1024) == 1
+        assert bucket_count(1024, 1024) == 4
+        assert bucket_count(10 ** 12, 1) == 1024
+
+
+class TestCompareRuleSpilled:
+    """Test suite asserting spilled comparisons equal in-memory ones"""
+
+    @pytest.mark.parametrize('buckets', [1, 3, 16])
+    @pytest.mark.parametrize('encode', [False, True])
+    def test_matches_in_memory(self, tmp_path, buckets, encode):
+        source, pbi = _frames()
+        if encode:
+            source = source.astype({'Site_Location_Key': 'category', 'Vendor': 'category'})
+            pbi = pbi.astype({'Service_Type': 'category'})
+        keys = ['Site_Location_Key']
+
+        stats = {}
+        actual = compare_rule_spilled(_rule(), _chunks(source), _chunks(pbi), keys,
+                                      tmp_path, buckets, stats=stats)
+
+        assert _dump(actual) == _dump(compare_rule(_rule(), source, pbi, keys))
+        assert stats['buckets'] == buckets
+        assert stats['rows_spilled'] == len(source) + len(pbi)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_multi_key_with_backend(self, tmp_path):
+        source, pbi = _frames()
+        keys = ['Site_Location_Key', 'Vendor']
+        backend = get_backend('pandas')
+
+        actual = compare_rule_spilled(_rule(), _chunks(source), _chunks(pbi), keys,
+                                      tmp_path, 5, backend=backend)
+
+        assert _dump(actual) == _dump(compare_rule(_rule(), source, pbi, keys))
+
+    def test_rule_level_result(self, tmp_path):
+        source, pbi = _frames()
+        keys = ['Region']
+
+        actual = compare_rule_spilled(_rule(), _chunks(source), _chunks(pbi), keys, tmp_path, 4)
+
+        assert _dump(actual) == _dump(compare_rule(_rule(), source, pbi, keys))
+        assert len(actual) == 1
+
+    def test_distinct_key_frame(self):
+        source, _ = _frames()
+        keys = distinct_key_frame(_chunks(source), 'Site_Location_Key', get_backend('pandas'))
+
+        assert sorted(keys['Site_Location_Key']) == [str(i) for i in range(100, 160)]
+        assert list(distinct_key_frame(_chunks(source), 'Missing',
+                                       get_backend('pandas')).columns) == list(source.columns)
+
+
+class TestOutOfCoreReport:
+    """Test suite for RulesEngine in out-of-core mode"""
+
+    def test_report_matches_in_memory(self, tmp_path):
+        data = tmp_path / 'data'
+        data.mkdir()
+        (data / 'factQuotes.csv').write_text(
+            'Site_Location_Key,Service_Type,Vendor,Total MRC\n'
+            + ''.join(f'{i},{"Broadband" if i % 3 else "DIA"},{"ATT" if i % 2 else "Verizon"},'
+                      f'{i * 1.5}\n' for i in range(100, 400)),
+            encoding='utf-8')
+        (data / 'dimSite.csv').write_text(
+            'Site_Location_Key\n' + ''.join(f'{i}\n' for i in range(100, 390)), encoding='utf-8')
+        (data / 'dimServiceType.csv').write_text('Service_Type\nBroadband\n', encoding='utf-8')
+        (data / 'Broadband DIA_Archetype 1_sharepoint.csv').write_text(
+            'Site_Location_Key,Vendor,Broadband Circuit MRC $/Month,DIA Circuit MRC $/Month,'
+            'CPE Recurring - Primary DIA,LTE MRC $/Month\n'
+            + ''.join(f'{i},{"ATT" if i % 2 else "Verizon"},"${i * 1.5 + (i % 7 == 0):,.2f}",'
+                      f'{i},,\n' for i in range(150, 450)),
+            encoding='utf-8')
+        config = ConfigLoader(CONFIG_PATH).load()
+        config.sources_base_path = str(data)
+
+        reports = {}
+        engines = {}
+        for name, spill_memory in (('memory', None), ('spilled', 4096)):
+            plan = build_plan(config)
+            session = SourceSession(IngestEngine(config, IngestOptions(chunk_rows=50),
+                                                 plan=plan), plan)
+            report = ReconciliationReport(project_name=config.name,
+                                          generated_at=datetime(2024, 1, 1),
+                                          config_file=str(CONFIG_PATH))
+            engines[name] = RulesEngine(config, session, spill_memory=spill_memory,
+                                        spill_dir=str(tmp_path / 'spill'))
+            reports[name] = engines[name].run(report).to_dict()
+
+        assert reports['spilled'] == reports['memory']
+        assert reports['memory']['entity_comparisons']
+        stats = engines['spilled'].spill_stats['Broadband']
+        assert stats['buckets'] > 1
+        assert stats['peak_bucket_bytes'] > 0
+        assert engines['spilled'].session.peak_frame_bytes == 0
+        assert list((tmp_path / 'spill').iterdir()) == []
@@ -0,0 +1,113 @@
+"""
+Tests for Arrow-backed Tables
+Pruebas del backend pyarrow (ArrowDtype) de la ingesta y los validadores
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+import pandas as pd
+import pytest
+
+pytest.importorskip('pyarrow')
+
+import pyarrow as pa
+
+from recon.core.cache import SourceCache
+from recon.core.config import ColumnType, FieldMapping, ProjectConfig, SourceConfig, ValidationRule
+from recon.core.ingest import IngestEngine, IngestError, IngestOptions
+from recon.core.table import to_backend
+from recon.core.validators.entity_compare import compare_rule
+from tests import project_config
+
+SHAREPOINT_CSV = (
+    'Site_Location_Key,Vendor,Broadband Circuit MRC $/Month\n'
+    + ''.join(f'{i},{"Verizon" if i % 2 else "ATT"},"${i * 10:,}.50"\n' for i in range(100, 400))
+)
+QUOTES_CSV = (
+    'Site_Location_Key,Vendor,Total MRC\n'
+    + ''.join(f'{i},{"Verizon" if i % 2 else "ATT"},{i * 10 + (0.5 if i % 7 else 3)}\n'
+              for i in range(150, 450))
+)
+
+
+def _config(base: Path) -> ProjectConfig:
+    return project_config(
+        base,
+        SourceConfig(name='sharepoint', path='sharepoint.csv', type='csv',
+                     schema={'Broadband Circuit MRC $/Month': ColumnType('money')}),
+        SourceConfig(name='fact_quotes', path='quotes.csv', type='csv'),
+    )
+
+
+def _load(base: Path, dtype_backend: str, cache=None) -> dict[str, pd.DataFrame]:
+    engine = IngestEngine(_config(base), IngestOptions(chunk_rows=128, dtype_backend=dtype_backend),
+                          cache=cache)
+    return engine.load_many().frames
+
+
+class TestArrowBackend:
+    """Test suite for the pyarrow dtype backend"""
+
+    def test_columns_are_arrow_backed(self, tmp_path):
+        (tmp_path / 'sharepoint.csv').write_text(SHAREPOINT_CSV, encoding='utf-8')
+        (tmp_path / 'quotes.csv').write_text(QUOTES_CSV, encoding='utf-8')
+
+        frame = _load(tmp_path, 'pyarrow')['sharepoint']
+
+        assert isinstance(frame['Site_Location_Key'].dtype, pd.ArrowDtype)
+        assert frame['Broadband Circuit MRC $/Month'].dtype == pd.ArrowDtype(pa.float64())
+        # Las columnas de baja cardinalidad siguen como category (códigos enteros)
+        assert isinstance(frame['Vendor'].dtype, pd.CategoricalDtype)
+
+    def test_cache_hit_wraps_mapped_buffers(self, tmp_path):
+        (tmp_path / 'sharepoint.csv').write_text(SHAREPOINT_CSV, encoding='utf-8')
+        (tmp_path / 'quotes.csv').write_text(QUOTES_CSV, encoding='utf-8')
+        cache = SourceCache(tmp_path / '.recon_cache')
+        _load(tmp_path, 'pyarrow', cache)
+
+        chunk = next(cache.iter_chunks(cache.entries()[0].key, 1_000, dtype_backend='pyarrow'))
+        column = chunk[chunk.columns[0]]
+
+        assert isinstance(column.dtype, pd.ArrowDtype)
+        # Los datos siguen legibles después de cerrar el lector mapeado
+        assert column.notna().all()
+
+    def test_validators_match_numpy_backend(self, tmp_path):
+        (tmp_path / 'sharepoint.csv').write_text(SHAREPOINT_CSV, encoding='utf-8')
+        (tmp_path / 'quotes.csv').write_text(QUOTES_CSV, encoding='utf-8')
+        rule = ValidationRule(
+            service_type='Broadband', source_name='sharepoint', pbi_source='fact_quotes',
+            field_mappings=[
+                FieldMapping(source_field='Broadband Circuit MRC $/Month', pbi_field='Total MRC',
+                             compare_type='numeric', tolerance=0.01),
+                FieldMapping(source_field='Vendor', pbi_field='Vendor'),
+            ]
+        )
+
+        results = {}
+        for backend in ('numpy', 'pyarrow'):
+            frames = _load(tmp_path, backend)
+            comparisons = compare_rule(rule, frames['sharepoint'], frames['fact_quotes'],
+                                       ['Site_Location_Key'])
+            results[backend] = [(c.entity_id, [(v.status, v.source_value, v.pbi_value)
+                                               for v in c.validations]) for c in comparisons]
+
+        assert results['pyarrow'] == results['numpy']
+        assert len(results['numpy']) == 350
+
+    def test_to_backend_keeps_categories(self):
+        frame = pd.DataFrame({'Vendor': pd.Categorical(['ATT', 'Verizon']),
+                              'Total MRC': [1.5, 2.0]})
+
+        converted = to_backend(frame, 'pyarrow')
+
+        assert isinstance(converted['Vendor'].dtype, pd.CategoricalDtype)
+        assert converted['Total MRC'].dtype == pd.ArrowDtype(pa.float64())
+        assert to_backend(frame, 'numpy') is frame
+
+    def test_invalid_backend_is_rejected(self, tmp_path):
+        with pytest.raises(IngestError, match='Invalid dtype_backend'):
+            IngestOptions.from_config(_config(tmp_path), dtype_backend='arrow')